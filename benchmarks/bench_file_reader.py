@@ -0,0 +1,69 @@
+from src.converter import DeliverConverter
+from src.file_service import DeliverReaderJson, FileReader
+from src.model import DeliversDataDict
+from typing import Callable, Iterable, cast
+import argparse
+import tempfile
+import tracemalloc
+import time
+import json
+import os
+
+
+def write_delivers(file_name: str, records: int) -> None:
+    """
+    Writes `records` synthetic deliveries to a JSON file in the same layout as data_json/delivers.json.
+    """
+    with open(file_name, "w", encoding="utf-8") as file:
+        file.write("[\n")
+        for i in range(records):
+            entry: DeliversDataDict = {
+                "parcel_id": f"P{i:08d}",
+                "locker_id": f"L{i % 500:04d}",
+                "sender_email": f"sender{i % 10_000}@gmail.com",
+                "receiver_email": f"receiver{i % 10_000}@gmail.com",
+                "sent_date": "2025-01-01",
+                "expected_delivery_date": "2025-01-07",
+            }
+            if i:
+                file.write(",\n")
+            file.write(json.dumps(entry, indent=4))
+        file.write("\n]")
+
+
+def measure(name: str, load: Callable[[], Iterable[DeliversDataDict]], records: int) -> None:
+    """
+    Runs the read + convert pipeline twice: once for wall time, once under tracemalloc for peak memory.
+    """
+    converter = DeliverConverter()
+
+    start = time.perf_counter()
+    converted = [converter.convert(entry) for entry in load()]
+    elapsed = time.perf_counter() - start
+    del converted
+
+    tracemalloc.start()
+    converted = [converter.convert(entry) for entry in load()]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del converted
+
+    print(f"{name:<12} {elapsed:>8.2f} s {records / elapsed:>12,.0f} rec/s {peak / 2 ** 20:>10.1f} MiB peak")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare json.load with the streaming FileReader.iter_read.")
+    parser.add_argument("--records", type=int, default=200_000)
+    args = parser.parse_args()
+
+    reader = cast(FileReader[DeliversDataDict], DeliverReaderJson())
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, "delivers.json")
+        write_delivers(file_name, args.records)
+        print(f"{args.records:,} deliveries, {os.path.getsize(file_name) / 2 ** 20:.1f} MiB on disk")
+        measure("json.load", lambda: reader.read(file_name), args.records)
+        measure("iter_read", lambda: reader.iter_read(file_name), args.records)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+from src.converter import Converter, UserConverter, LockerConverter, ParcelConverter, DeliverConverter
+from src.dataset_generator import DatasetConfig, DatasetGenerator
+from typing import Any, Iterator
+import argparse
+import tracemalloc
+import json
+import gc
+
+
+def decoded(records: Iterator[Any]) -> list[Any]:
+    """
+    Round-trips records through JSON so every string is a separate object, as after reading a file.
+    """
+    return [json.loads(json.dumps(record)) for record in records]
+
+
+def measure(name: str, converter: Converter[Any, Any], records: Iterator[Any]) -> None:
+    """
+    Prints the memory retained per converted record (instance and the strings it keeps alive)
+    once the decoded dictionaries are gone.
+    """
+    gc.collect()
+    tracemalloc.start()
+    raw = decoded(records)
+    converted = [converter.convert(entry) for entry in raw]
+    del raw
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<10} {len(converted):>10,} records {current / len(converted):>8.1f} B/record")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure memory retained per converted model instance.")
+    parser.add_argument("--deliveries", type=int, default=200_000)
+    args = parser.parse_args()
+
+    generator = DatasetGenerator(DatasetConfig.for_deliveries(args.deliveries))
+    measure("users", UserConverter(), generator.users())
+    measure("lockers", LockerConverter(), generator.lockers())
+    measure("parcels", ParcelConverter(), generator.parcels())
+    measure("delivers", DeliverConverter(), generator.deliveries())
+
+
+if __name__ == "__main__":
+    main()
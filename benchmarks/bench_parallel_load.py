@@ -0,0 +1,66 @@
+from src.converter import DeliverConverter
+from src.dataset_generator import DatasetConfig, DatasetGenerator
+from src.file_service import DeliverReaderJson, FileReader
+from src.model import DeliversDataDict
+from src.repository import DeliveryDataRepository
+from src.validator import DeliversDataDictValidator
+from typing import cast
+import argparse
+import tempfile
+import logging
+import time
+import os
+
+
+def load(file_name: str, workers: int, chunk_size: int, streaming: bool) -> tuple[float, int]:
+    """
+    Loads the deliveries file once and returns the wall time and the number of valid deliveries.
+    """
+    start = time.perf_counter()
+    repository = DeliveryDataRepository(
+        file_reader=cast(FileReader[DeliversDataDict], DeliverReaderJson()),
+        validator=DeliversDataDictValidator(),
+        converter=DeliverConverter(),
+        filename=file_name,
+        streaming=streaming,
+        workers=workers,
+        chunk_size=chunk_size,
+    )
+    return time.perf_counter() - start, len(repository.get_data())
+
+
+def main() -> None:
+    """
+    Measures how loading deliveries scales with the number of worker processes.
+
+    Usage:
+        python -m benchmarks.bench_parallel_load --deliveries 1000000 --workers 1 2 4 8 16 32
+    """
+    parser = argparse.ArgumentParser(description="Time parallel validation and conversion of deliveries.")
+    parser.add_argument("--deliveries", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per worker count; the best time is kept")
+    parser.add_argument("--format", choices=("json", "ndjson"), default="json")
+    parser.add_argument("--streaming", action="store_true", help="Read entries with iter_read")
+    args = parser.parse_args()
+
+    logging.disable(logging.ERROR)
+    print(f"{os.cpu_count()} CPUs, {args.deliveries:,} deliveries, chunks of {args.chunk_size:,}")
+    with tempfile.TemporaryDirectory() as directory:
+        extension = f".{args.format}"
+        DatasetGenerator(DatasetConfig.for_deliveries(args.deliveries)).write(directory, extension)
+        file_name = os.path.join(directory, f"delivers{extension}")
+
+        baseline = None
+        for workers in args.workers:
+            seconds, count = min(
+                load(file_name, workers, args.chunk_size, args.streaming) for _ in range(args.repeat))
+            baseline = baseline or seconds
+            speedup = baseline / seconds
+            print(f"{workers:>3} workers {seconds:>9.3f} s {count / seconds:>12,.0f} rec/s "
+                  f"{speedup:>6.2f}x speedup {speedup / workers * args.workers[0]:>6.0%} efficiency", flush=True)
+
+
+if __name__ == "__main__":
+    main()
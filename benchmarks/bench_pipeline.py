@@ -0,0 +1,280 @@
+from src.converter import Converter, UserConverter, LockerConverter, ParcelConverter, DeliverConverter
+from src.dataset_generator import DatasetConfig, DatasetGenerator
+from src.file_service import FileReader
+from src.repository import (
+    DataRepository,
+    UserDataRepository,
+    LockerDataRepository,
+    ParcelDataRepository,
+    DeliveryDataRepository,
+    ParcelSummaryRepository,
+)
+from src.report_service import ReportService
+from src.service import ParcelReportService
+from src.vectorized_service import REPORT_BACKENDS
+from src.validator import (
+    Validator,
+    UserDataDictValidator,
+    LockerDataDictValidator,
+    ParcelDataDictValidator,
+    DeliversDataDictValidator,
+    email_validation_cache,
+)
+from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from typing import Any, Callable, override
+import email_validator
+import argparse
+import platform
+import gc
+import tempfile
+import tracemalloc
+import logging
+import time
+import json
+import sys
+import os
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), "baseline.json")
+SERVICE_METHODS = (
+    "compute_all",
+    "most_common_parcel_sizes_per_locker",
+    "city_most_shipments_by_size",
+    "max_days_between_sent_and_expected",
+    "is_parcel_limit_in_locker_exceeded",
+)
+REPORT_METHODS = (
+    "report_most_common_parcel_sizes_per_locker",
+    "report_city_most_shipments_by_size",
+    "report_max_days_between_sent_and_expected",
+    "report_is_parcel_limit_in_locker_exceeded",
+)
+ENTITIES: dict[str, tuple[type[DataRepository], Validator[Any], Converter[Any, Any]]] = {
+    "users": (UserDataRepository, UserDataDictValidator(), UserConverter()),
+    "lockers": (LockerDataRepository, LockerDataDictValidator(), LockerConverter()),
+    "parcels": (ParcelDataRepository, ParcelDataDictValidator(), ParcelConverter()),
+    "delivers": (DeliveryDataRepository, DeliversDataDictValidator(), DeliverConverter()),
+}
+
+
+@dataclass(frozen=True)
+class StageResult:
+    """
+    Timing and memory of one benchmark stage at one dataset scale.
+
+    Attributes:
+        stage (str): Stage name, e.g. "read:delivers" or "service:compute_all".
+        deliveries (int): Number of deliveries in the dataset.
+        records (int): Number of records the stage processed.
+        seconds (float): Best wall time over all repetitions.
+        peak_mib (float): Peak memory allocated while the stage ran, in MiB.
+    """
+    stage: str
+    deliveries: int
+    records: int
+    seconds: float
+    peak_mib: float
+
+    @property
+    def key(self) -> str:
+        return f"{self.stage}@{self.deliveries}"
+
+
+class AcceptAll(Validator[Any]):
+    """
+    Lets every record through, so stages after validation are measured on the full dataset
+    independently of the validators (which have their own stages).
+    """
+    @override
+    def validate(self, data: Any) -> bool:
+        return True
+
+
+def measure(
+        stage: str,
+        deliveries: int,
+        records: int,
+        run: Callable[[], Any],
+        repeat: int,
+        setup: Callable[[], Any] | None = None) -> StageResult:
+    """
+    Runs a stage `repeat` times for the best wall time, then once more under tracemalloc for peak memory.
+    The garbage collector is paused while timing, like `timeit` does, to keep results comparable.
+    `setup`, if given, runs untimed before every run, e.g. to drop caches the previous run filled.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = StageResult(stage, deliveries, records, best, peak / 2 ** 20)
+    print(f"{result.key:<60} {result.seconds:>9.4f} s {records / max(best, 1e-9):>12,.0f} rec/s "
+          f"{result.peak_mib:>9.1f} MiB peak", flush=True)
+    return result
+
+
+def bench_scale(deliveries: int, repeat: int, seed: int) -> list[StageResult]:
+    """
+    Generates a dataset with the given number of deliveries and benchmarks every stage on it.
+    """
+    results: list[StageResult] = []
+    with tempfile.TemporaryDirectory() as directory:
+        DatasetGenerator(DatasetConfig.for_deliveries(deliveries, seed=seed)).write(directory)
+        reader: FileReader[Any] = FileReader()
+        repositories: dict[str, DataRepository] = {}
+
+        for name, (repository_type, validator, converter) in ENTITIES.items():
+            file_name = os.path.join(directory, f"{name}.json")
+            raw = reader.read(file_name)
+            results.append(measure(f"read:{name}", deliveries, len(raw), lambda: reader.read(file_name), repeat))
+
+            def validate() -> None:
+                email_validation_cache.clear()
+                for entry in raw:
+                    validator.validate(entry)
+
+            results.append(measure(f"validate:{type(validator).__name__}", deliveries, len(raw), validate, repeat))
+            results.append(measure(
+                f"convert:{type(converter).__name__}", deliveries, len(raw),
+                lambda: [converter.convert(entry) for entry in raw], repeat))
+            repositories[name] = repository_type(
+                file_reader=reader, validator=AcceptAll(), converter=converter, filename=file_name)
+
+        summary = ParcelSummaryRepository(
+            repositories["users"], repositories["lockers"], repositories["parcels"], repositories["delivers"])
+
+        # Every run has to join the deliveries again, as the first one did, instead of reusing its view.
+        results.append(measure(
+            "join:_build_parcel", deliveries, deliveries,
+            lambda: summary._build_parcel(summary.delivery_view()), repeat, setup=summary.invalidate))
+
+        for backend, service_type in REPORT_BACKENDS.items():
+            prefix = "service" if service_type is ParcelReportService else f"service[{backend}]"
+            for method in SERVICE_METHODS:
+                results.append(measure(
+                    f"{prefix}:{method}", deliveries, deliveries,
+                    lambda: getattr(service_type(summary), method)(), repeat, setup=summary.invalidate))
+
+        service = ParcelReportService(summary)
+        service.compute_all()
+        for method in REPORT_METHODS:
+            results.append(measure(
+                f"report:{method}", deliveries, deliveries,
+                lambda: getattr(ReportService(service), method)(), repeat))
+    return results
+
+
+def compare(
+        results: list[StageResult],
+        baseline: list[StageResult],
+        time_threshold: float,
+        memory_threshold: float,
+        min_seconds: float) -> list[str]:
+    """
+    Compares results with a baseline and describes every regression.
+
+    A stage regresses if it is more than `time_threshold` (relative) slower and at least `min_seconds` slower,
+    or needs more than `memory_threshold` (relative) more peak memory. Stages missing from the baseline are ignored.
+
+    Returns:
+        list[str]: One message per regression; empty if there are none.
+    """
+    known = {result.key: result for result in baseline}
+    regressions = []
+    for result in results:
+        base = known.get(result.key)
+        if base is None:
+            continue
+        if result.seconds > base.seconds * (1 + time_threshold) and result.seconds - base.seconds >= min_seconds:
+            regressions.append(
+                f"{result.key}: {result.seconds:.4f} s vs baseline {base.seconds:.4f} s "
+                f"(+{result.seconds / base.seconds - 1:.0%})")
+        if result.peak_mib > base.peak_mib * (1 + memory_threshold) and result.peak_mib - base.peak_mib >= 1:
+            regressions.append(
+                f"{result.key}: {result.peak_mib:.1f} MiB vs baseline {base.peak_mib:.1f} MiB "
+                f"(+{result.peak_mib / base.peak_mib - 1:.0%})")
+    return regressions
+
+
+def save_results(file_name: str, results: list[StageResult]) -> None:
+    document = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "email_deliverability_checks": email_validator.CHECK_DELIVERABILITY,
+        "results": [asdict(result) for result in results],
+    }
+    with open(file_name, "w", encoding="utf-8") as file:
+        json.dump(document, file, indent=4)
+
+
+def load_results(file_name: str) -> list[StageResult]:
+    with open(file_name, "r", encoding="utf-8") as file:
+        return [StageResult(**result) for result in json.load(file)["results"]]
+
+
+def main() -> None:
+    """
+    Benchmarks every pipeline stage at several dataset scales and checks the results against a baseline.
+
+    Usage:
+        python -m benchmarks.bench_pipeline --scales 1000 10000 100000 --output results.json
+        python -m benchmarks.bench_pipeline --update-baseline
+
+    Exits with status 1 if any stage regressed beyond the thresholds.
+
+    Email deliverability (DNS) checks are turned off, so validation stages time the validators rather than
+    the network, and results are reproducible offline.
+    """
+    parser = argparse.ArgumentParser(description="Time and memory-profile each stage of the parcel pipeline.")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per stage; the best time is kept")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="Write results as JSON to this file")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="Baseline results to compare against")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the results as the new baseline")
+    parser.add_argument("--time-threshold", type=float, default=0.25, help="Allowed relative slowdown")
+    parser.add_argument("--memory-threshold", type=float, default=0.25, help="Allowed relative peak memory growth")
+    parser.add_argument("--min-seconds", type=float, default=0.005, help="Ignore slowdowns smaller than this")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    email_validator.CHECK_DELIVERABILITY = False
+    results = [result for scale in args.scales for result in bench_scale(scale, args.repeat, args.seed)]
+
+    if args.output:
+        save_results(args.output, results)
+    if args.update_baseline:
+        save_results(args.baseline, results)
+        print(f"Baseline updated: {args.baseline}")
+        return
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}, run with --update-baseline to create one")
+        return
+
+    regressions = compare(
+        results, load_results(args.baseline), args.time_threshold, args.memory_threshold, args.min_seconds)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        sys.exit(1)
+    print("No regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
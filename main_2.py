@@ -1,56 +1,35 @@
 from src.report_service import ReportService
 from src.ui_service import UiService
-from src.converter import (
-    UserConverter, LockerConverter, ParcelConverter, DeliverConverter
-)
-from src.file_service import (
-    UserReaderJson, LockerReaderJson, ParcelReaderJson, DeliverReaderJson, FileReader
-)
-from src.model import DeliversDataDict, UsersDataDict, LockersDataDict, ParcelsDataDict
-from src.repository import (
-    UserDataRepository, LockerDataRepository,
-    ParcelDataRepository, DeliveryDataRepository, ParcelSummaryRepository,
-)
-from src.service import ParcelReportService
-from src.validator import (
-    UserDataDictValidator, LockerDataDictValidator,
-    ParcelDataDictValidator, DeliversDataDictValidator
-)
-from typing import cast
+from src.bootstrap import load_repositories
+from src.vectorized_service import REPORT_BACKENDS
+from src.snapshot import SnapshotCache
+import streamlit as st
+import os
 
+SNAPSHOT_DIR = os.environ.get("SNAPSHOT_DIR")
+REPORT_BACKEND = os.environ.get("REPORT_BACKEND", "python")
+LOAD_WORKERS = int(os.environ.get("LOAD_WORKERS", "1"))
+DELIVERIES_FILE = os.environ.get("DELIVERIES_FILE", "data_json/delivers.json")
 
-def main_2() -> None:
-
-    user_repo = UserDataRepository(
-        file_reader= cast(FileReader[UsersDataDict], UserReaderJson()),
-        validator=UserDataDictValidator(),
-        converter=UserConverter(),
-        filename="data_json/users.json",
-    )
-    locker_repo = LockerDataRepository(
-        file_reader=cast(FileReader[LockersDataDict], LockerReaderJson()),
-        validator=LockerDataDictValidator(),
-        converter=LockerConverter(),
-        filename="data_json/lockers.json",
-    )
-    parcel_repo = ParcelDataRepository(
-        file_reader=cast(FileReader[ParcelsDataDict], ParcelReaderJson()),
-        validator=ParcelDataDictValidator(),
-        converter=ParcelConverter(),
-        filename="data_json/parcels.json",
-    )
-    delivery_repo = DeliveryDataRepository(
-        file_reader=cast(FileReader[DeliversDataDict], DeliverReaderJson()),
-        validator=DeliversDataDictValidator(),
-        converter=DeliverConverter(),
-        filename="data_json/delivers.json",
-    )
 
-    repository = ParcelSummaryRepository(user_repo, locker_repo, parcel_repo, delivery_repo)
-    service = ParcelReportService(repository)
+@st.cache_resource
+def build_ui_service() -> UiService:
+    """
+    Builds the repository and service graph once per process; Streamlit shares it across sessions and reruns.
+    Repositories are lazy, so the first page renders before any dataset is loaded.
+    """
+    snapshot_cache = SnapshotCache(SNAPSHOT_DIR) if SNAPSHOT_DIR else None
+    repository = load_repositories(
+        "data_json", deliveries_file=DELIVERIES_FILE, snapshot_cache=snapshot_cache, process_workers=LOAD_WORKERS,
+        lazy=True)
+    service = REPORT_BACKENDS[REPORT_BACKEND](repository)
     service_report = ReportService(service)
-    service_ui = UiService(service_report)
+    return UiService(service_report, deliveries_file=DELIVERIES_FILE, delivery_repo=repository.delivery_repo)
 
+
+def main_2() -> None:
+    service_ui = build_ui_service()
+    service_ui.report_service.service.repository.refresh_if_changed()
     service_ui.show_ui()
 
 
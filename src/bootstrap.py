@@ -0,0 +1,169 @@
+from src.converter import UserConverter, LockerConverter, ParcelConverter, DeliverConverter
+from src.file_service import UserReaderJson, LockerReaderJson, ParcelReaderJson, DeliverReaderJson, FileReader
+from src.model import UsersDataDict, LockersDataDict, ParcelsDataDict, DeliversDataDict
+from src.repository import (
+    DataRepository,
+    UserDataRepository,
+    LockerDataRepository,
+    ParcelDataRepository,
+    DeliveryDataRepository,
+    ParcelSummaryRepository,
+)
+from src.validator import (
+    UserDataDictValidator,
+    LockerDataDictValidator,
+    ParcelDataDictValidator,
+    DeliversDataDictValidator,
+)
+from src.snapshot import SnapshotCache
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_EXCEPTION
+from typing import Callable, cast
+import logging
+import time
+import os
+
+logging.basicConfig(level=logging.INFO)
+
+RepositoryFactory = Callable[[], DataRepository]
+
+
+class RepositoryLoadError(RuntimeError):
+    """
+    Raised when a repository could not be loaded during bootstrap.
+
+    Attributes:
+        name (str): Name of the repository that failed; the original error is the exception's __cause__.
+    """
+    def __init__(self, name: str, error: BaseException) -> None:
+        super().__init__(f"Loading {name} repository failed: {error}")
+        self.name = name
+
+
+def load_in_parallel(
+        factories: dict[str, RepositoryFactory],
+        max_workers: int | None = None) -> tuple[dict[str, DataRepository], dict[str, float]]:
+    """
+    Builds repositories concurrently in a thread pool.
+
+    Each factory constructs (and thereby loads) one repository, so file reads, snapshot loads and other
+    GIL-releasing work overlap. If any factory fails, pending ones are cancelled, running ones are awaited,
+    and no repository is returned.
+
+    Args:
+        factories (dict[str, RepositoryFactory]): Repository name to a callable that builds it.
+        max_workers (int | None): Thread count; defaults to one thread per repository.
+
+    Returns:
+        tuple[dict[str, DataRepository], dict[str, float]]: Repositories and their load times in seconds, by name.
+
+    Raises:
+        RepositoryLoadError: For the first repository that failed to load.
+    """
+    timings: dict[str, float] = {}
+
+    def timed(name: str, factory: RepositoryFactory) -> DataRepository:
+        start = time.perf_counter()
+        repository = factory()
+        timings[name] = time.perf_counter() - start
+        if repository.is_loaded():
+            logging.info(f"Loaded {name} repository ({len(repository.get_data())} records) in {timings[name]:.2f} s")
+        return repository
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(factories) or 1,
+                            thread_name_prefix="repository-loader") as executor:
+        futures: dict[Future[DataRepository], str] = {
+            executor.submit(timed, name, factory): name for name, factory in factories.items()
+        }
+        done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+        failed = [future for future in futures if future in done and future.exception() is not None]
+        if failed:
+            for future in pending:
+                future.cancel()
+            name = futures[failed[0]]
+            error = cast(BaseException, failed[0].exception())
+            logging.error(f"Loading {name} repository failed, discarding all repositories: {error}")
+            raise RepositoryLoadError(name, error) from error
+
+    return {name: future.result() for future, name in futures.items()}, timings
+
+
+def load_repositories(
+        data_dir: str = "data_json",
+        deliveries_file: str | None = None,
+        snapshot_cache: SnapshotCache | None = None,
+        max_workers: int | None = None,
+        process_workers: int = 1,
+        chunk_size: int = 10_000,
+        lazy: bool = False) -> ParcelSummaryRepository:
+    """
+    Loads users, lockers, parcels and deliveries concurrently and returns them as a ready ParcelSummaryRepository.
+
+    Args:
+        data_dir (str): Directory with users.json, lockers.json, parcels.json and delivers.json.
+        deliveries_file (str | None): Deliveries file, if it is not `data_dir`/delivers.json.
+        snapshot_cache (SnapshotCache | None): Optional snapshot cache shared by all repositories.
+        max_workers (int | None): Thread count; defaults to one thread per repository.
+        process_workers (int): Processes each repository validates entries with; files that fit in one chunk
+            are always validated in-process.
+        chunk_size (int): Number of entries sent to a validation process at a time.
+        lazy (bool): If True, repositories are only created here and each loads on first access.
+
+    Returns:
+        ParcelSummaryRepository: Summary repository over the four loaded repositories.
+
+    Raises:
+        RepositoryLoadError: If any repository fails to load.
+    """
+    start = time.perf_counter()
+    factories: dict[str, RepositoryFactory] = {
+        "users": lambda: UserDataRepository(
+            file_reader=cast(FileReader[UsersDataDict], UserReaderJson()),
+            validator=UserDataDictValidator(),
+            converter=UserConverter(),
+            filename=os.path.join(data_dir, "users.json"),
+            snapshot_cache=snapshot_cache,
+            workers=process_workers,
+            chunk_size=chunk_size,
+            lazy=lazy,
+        ),
+        "lockers": lambda: LockerDataRepository(
+            file_reader=cast(FileReader[LockersDataDict], LockerReaderJson()),
+            validator=LockerDataDictValidator(),
+            converter=LockerConverter(),
+            filename=os.path.join(data_dir, "lockers.json"),
+            snapshot_cache=snapshot_cache,
+            workers=process_workers,
+            chunk_size=chunk_size,
+            lazy=lazy,
+        ),
+        "parcels": lambda: ParcelDataRepository(
+            file_reader=cast(FileReader[ParcelsDataDict], ParcelReaderJson()),
+            validator=ParcelDataDictValidator(),
+            converter=ParcelConverter(),
+            filename=os.path.join(data_dir, "parcels.json"),
+            snapshot_cache=snapshot_cache,
+            workers=process_workers,
+            chunk_size=chunk_size,
+            lazy=lazy,
+        ),
+        "delivers": lambda: DeliveryDataRepository(
+            file_reader=cast(FileReader[DeliversDataDict], DeliverReaderJson()),
+            validator=DeliversDataDictValidator(),
+            converter=DeliverConverter(),
+            filename=deliveries_file or os.path.join(data_dir, "delivers.json"),
+            snapshot_cache=snapshot_cache,
+            workers=process_workers,
+            chunk_size=chunk_size,
+            lazy=lazy,
+            streaming=True,
+        ),
+    }
+    repositories, timings = load_in_parallel(factories, max_workers)
+    logging.info(f"Loaded all repositories in {time.perf_counter() - start:.2f} s "
+                 f"(sequential sum {sum(timings.values()):.2f} s)")
+    return ParcelSummaryRepository(
+        user_repo=cast(UserDataRepository, repositories["users"]),
+        locker_repo=cast(LockerDataRepository, repositories["lockers"]),
+        parcel_repo=cast(ParcelDataRepository, repositories["parcels"]),
+        delivery_repo=cast(DeliveryDataRepository, repositories["delivers"]),
+    )
@@ -0,0 +1,148 @@
+from src.repository import DataRepository
+from src.model import Deliver
+from src.dates import iso_date
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator
+from array import array
+import numpy as np
+
+COLUMNS = ("parcel", "locker", "sender", "receiver", "sent_day", "expected_day")
+
+
+@dataclass
+class DictionaryEncoding:
+    """
+    Maps distinct string values to dense integer codes in order of first appearance.
+
+    Attributes:
+        values (list[str]): Value of every code; `values[code]` decodes a code.
+        codes (dict[str, int]): Code of every value.
+    """
+    values: list[str] = field(default_factory=list)
+    codes: dict[str, int] = field(default_factory=dict)
+
+    def encode(self, value: str) -> int:
+        """
+        Returns the code of a value, assigning the next free code to a new value.
+        """
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def decode(self, code: int) -> str:
+        return self.values[code]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+@dataclass
+class DeliveryColumns:
+    """
+    Columnar (struct-of-arrays) store of deliveries for vectorized reports.
+
+    Parcel, locker and user identifiers are dictionary-encoded into int32 code columns; sender and receiver share
+    one user dictionary, so their codes are comparable. Dates are stored as int32 day numbers (date ordinals),
+    so durations are plain subtractions. Columns are `array('i')` buffers exposed to NumPy without copying
+    through `numpy_column`.
+
+    Iterating (or indexing) yields `Deliver` objects rebuilt from the columns, so code written for
+    `list[Deliver]` keeps working.
+
+    Attributes:
+        parcels (DictionaryEncoding): Dictionary of parcel IDs.
+        lockers (DictionaryEncoding): Dictionary of locker IDs.
+        users (DictionaryEncoding): Dictionary of sender and receiver emails.
+        columns (dict[str, array]): Code and day-number columns, keyed by the names in `COLUMNS`.
+    """
+    parcels: DictionaryEncoding = field(default_factory=DictionaryEncoding)
+    lockers: DictionaryEncoding = field(default_factory=DictionaryEncoding)
+    users: DictionaryEncoding = field(default_factory=DictionaryEncoding)
+    columns: dict[str, array] = field(default_factory=lambda: {name: array("i") for name in COLUMNS})
+
+    @classmethod
+    def from_delivers(cls, delivers: Iterable[Deliver]) -> "DeliveryColumns":
+        """
+        Builds the columns from deliveries, in order.
+        """
+        columns = cls()
+        columns.extend(delivers)
+        return columns
+
+    @classmethod
+    def from_repository(cls, repository: DataRepository[Any, Deliver]) -> "DeliveryColumns":
+        """
+        Builds the columns from the current data_json of a delivery repository.
+        """
+        return cls.from_delivers(repository.get_data())
+
+    def append(self, deliver: Deliver) -> None:
+        """
+        Encodes a single delivery and appends it to every column.
+
+        Raises:
+            BufferError: If a NumPy view of a column is still alive; no column is changed then.
+        """
+        row = (
+            self.parcels.encode(deliver.parcel_id),
+            self.lockers.encode(deliver.locker_id),
+            self.users.encode(deliver.sender_email),
+            self.users.encode(deliver.receiver_email),
+            deliver.sent_day,
+            deliver.expected_day,
+        )
+        appended: list[array] = []
+        try:
+            for name, value in zip(COLUMNS, row):
+                self.columns[name].append(value)
+                appended.append(self.columns[name])
+        except BufferError:
+            for column in appended:
+                column.pop()
+            raise
+
+    def extend(self, delivers: Iterable[Deliver]) -> None:
+        for deliver in delivers:
+            self.append(deliver)
+
+    def numpy_column(self, name: str) -> np.ndarray:
+        """
+        Returns a column as an int32 NumPy array sharing memory with the underlying buffer.
+
+        The buffer cannot grow while the array is alive: `append`/`extend` raise BufferError until it is released.
+
+        Args:
+            name (str): One of `COLUMNS`.
+
+        Returns:
+            np.ndarray: Read-only int32 array.
+        """
+        column = self.columns[name]
+        if not column:
+            return np.empty(0, dtype=np.int32)
+        view = np.frombuffer(column, dtype=np.int32)
+        view.flags.writeable = False
+        return view
+
+    def __len__(self) -> int:
+        return len(self.columns["parcel"])
+
+    def __getitem__(self, index: int) -> Deliver:
+        """
+        Rebuilds the delivery at the given position.
+        """
+        columns = self.columns
+        return Deliver(
+            parcel_id=self.parcels.decode(columns["parcel"][index]),
+            locker_id=self.lockers.decode(columns["locker"][index]),
+            sender_email=self.users.decode(columns["sender"][index]),
+            receiver_email=self.users.decode(columns["receiver"][index]),
+            sent_date=iso_date(columns["sent_day"][index]),
+            expected_delivery_date=iso_date(columns["expected_day"][index]),
+        )
+
+    def __iter__(self) -> Iterator[Deliver]:
+        for index in range(len(self)):
+            yield self[index]
@@ -0,0 +1,46 @@
+from dataclasses import dataclass, field
+from contextlib import contextmanager
+from typing import Iterator
+import threading
+
+
+@dataclass
+class SingleFlight:
+    """
+    Serializes the refreshes of one resource and coalesces concurrent refresh requests.
+
+    A caller takes a ticket with `request` when it decides a refresh is needed, then enters `flight`. Every refresh
+    that starts after the ticket was taken satisfies the request, so callers that waited for such a refresh skip
+    their own and read its published result instead.
+
+    Attributes:
+        lock (threading.RLock): Held for the duration of a flight; reentrant, so a refresh may trigger another.
+        started (int): Number of refreshes started so far.
+    """
+    lock: threading.RLock = field(default_factory=threading.RLock, repr=False)
+    started: int = 0
+
+    def request(self) -> int:
+        """
+        Returns a ticket for a refresh requested now.
+        """
+        return self.started
+
+    @contextmanager
+    def flight(self, ticket: int, force: bool = False) -> Iterator[bool]:
+        """
+        Waits for the refresh in progress, if any, and holds the lock.
+
+        Args:
+            ticket (int): Ticket returned by `request`.
+            force (bool): If True, the caller refreshes even if a later refresh already completed.
+
+        Yields:
+            bool: True if the caller has to refresh, False if a refresh started after the ticket already did it.
+        """
+        with self.lock:
+            if self.started > ticket and not force:
+                yield False
+            else:
+                self.started += 1
+                yield True
@@ -0,0 +1,25 @@
+from src.file_service import convert_json_to_ndjson
+import argparse
+import logging
+
+logging.basicConfig(level=logging.INFO)
+
+
+def main() -> None:
+    """
+    One-shot migration of JSON array files (e.g. data_json/delivers.json) to NDJSON.
+
+    Usage:
+        python -m src.convert_ndjson data_json/delivers.json [--target data_json/delivers.ndjson]
+    """
+    parser = argparse.ArgumentParser(description="Convert a JSON array file into an NDJSON (JSON Lines) file.")
+    parser.add_argument("source", help="Path to the JSON array file")
+    parser.add_argument("--target", default=None, help="Path of the NDJSON file (defaults to <source>.ndjson)")
+    args = parser.parse_args()
+
+    target = convert_json_to_ndjson(args.source, args.target)
+    logging.info(f"Converted {args.source} to {target}")
+
+
+if __name__ == "__main__":
+    main()
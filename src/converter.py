@@ -11,6 +11,7 @@ from src.model import (
 )
 from abc import ABC, abstractmethod
 from typing import override
+from sys import intern
 
 
 class Converter[T, U](ABC):
@@ -37,10 +38,10 @@ class UserConverter(Converter[UsersDataDict, User]):
     @override
     def convert(self, data: UsersDataDict) -> User:
         return User(
-            email=data["email"],
-            name=data["name"],
-            surname=data["surname"],
-            city=data["city"],
+            email=intern(data["email"]),
+            name=intern(data["name"]),
+            surname=intern(data["surname"]),
+            city=intern(data["city"]),
             latitude=data["latitude"],
             longitude=data["longitude"],
         )
@@ -55,8 +56,8 @@ class LockerConverter(Converter[LockersDataDict, Locker]):
         converted_compartment = {CompartmentsLarge(key): value for key, value in compartment.items()}
 
         return Locker(
-            locker_id=data["locker_id"],
-            city=data["city"],
+            locker_id=intern(data["locker_id"]),
+            city=intern(data["city"]),
             latitude=data["latitude"],
             longitude=data["longitude"],
             compartments=converted_compartment,
@@ -83,11 +84,11 @@ class DeliverConverter(Converter[DeliversDataDict, Deliver]):
     def convert(self, data: DeliversDataDict) -> Deliver:
         return Deliver(
             parcel_id=data["parcel_id"],
-            locker_id=data["locker_id"],
-            sender_email=data["sender_email"],
-            receiver_email=data["receiver_email"],
-            sent_date=data["sent_date"],
-            expected_delivery_date=data["expected_delivery_date"],
+            locker_id=intern(data["locker_id"]),
+            sender_email=intern(data["sender_email"]),
+            receiver_email=intern(data["receiver_email"]),
+            sent_date=intern(data["sent_date"]),
+            expected_delivery_date=intern(data["expected_delivery_date"]),
         )
 
 
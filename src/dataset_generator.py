@@ -0,0 +1,305 @@
+from src.model import UsersDataDict, LockersDataDict, ParcelsDataDict, DeliversDataDict
+from src.file_service import FileWriter, NdjsonFileWriter, is_ndjson
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Callable, Iterator
+import argparse
+import logging
+import random
+import time
+import os
+
+logging.basicConfig(level=logging.INFO)
+
+FIRST_NAMES = ("John", "Jane", "Alice", "Bob", "Anna", "Piotr", "Maria", "Tomasz", "Eva", "Mark", "Olga", "Adam")
+LAST_NAMES = ("Doe", "Smith", "Jones", "Nowak", "Kowalski", "Brown", "Miller", "Wilson", "Taylor", "Lewandowski")
+CITIES = (
+    ("New York", 40.712776, -74.005974),
+    ("Los Angeles", 34.052235, -118.243683),
+    ("Chicago", 41.878113, -87.629799),
+    ("Houston", 29.760427, -95.369804),
+    ("Warsaw", 52.229676, 21.012229),
+    ("Krakow", 50.064650, 19.944980),
+    ("Gdansk", 54.352025, 18.646638),
+    ("Berlin", 52.520008, 13.404954),
+)
+EMAIL_DOMAIN = "gmail.com"
+
+
+@dataclass(frozen=True)
+class DatasetConfig:
+    """
+    Parameters of a synthetic dataset.
+
+    Attributes:
+        deliveries (int): Number of valid deliveries; every delivery has its own parcel.
+        users (int): Number of valid users, at least 2 so that sender and receiver can differ.
+        lockers (int): Number of valid lockers.
+        seed (int): Seed of the random generators; the same config always produces the same files.
+        locker_skew (float): Popularity skew of lockers. 1.0 spreads deliveries evenly, higher values
+            concentrate them on the first (hot) lockers.
+        sender_skew (float): Popularity skew of senders, with the same meaning as `locker_skew`.
+        invalid_fraction (float): Number of invalid records mixed into every file, relative to the valid ones.
+        start_date (date): Earliest sent date.
+        end_date (date): Latest sent date.
+        max_delivery_days (int): Maximum number of days between sent and expected delivery date.
+    """
+    deliveries: int = 1_000
+    users: int = 100
+    lockers: int = 10
+    seed: int = 0
+    locker_skew: float = 2.0
+    sender_skew: float = 3.0
+    invalid_fraction: float = 0.0
+    start_date: date = date(2025, 1, 1)
+    end_date: date = date(2025, 12, 31)
+    max_delivery_days: int = 14
+
+    def __post_init__(self) -> None:
+        if self.deliveries < 0 or self.users < 2 or self.lockers < 1:
+            raise ValueError("Dataset needs deliveries >= 0, users >= 2 and lockers >= 1")
+        if self.locker_skew < 1 or self.sender_skew < 1:
+            raise ValueError("Skew must be at least 1.0")
+        if not 0 <= self.invalid_fraction < 1:
+            raise ValueError("invalid_fraction must be in [0, 1)")
+        if self.start_date > self.end_date or self.max_delivery_days < 1:
+            raise ValueError("Invalid date range")
+
+    @classmethod
+    def for_deliveries(cls, deliveries: int, **kwargs: Any) -> "DatasetConfig":
+        """
+        Builds a config with user and locker counts scaled to the number of deliveries
+        (about 20 deliveries per user and 2,000 per locker).
+        """
+        kwargs.setdefault("users", max(2, deliveries // 20))
+        kwargs.setdefault("lockers", max(1, deliveries // 2_000))
+        return cls(deliveries=deliveries, **kwargs)
+
+
+@dataclass
+class DatasetGenerator:
+    """
+    Deterministic generator of referentially consistent users, lockers, parcels and deliveries.
+
+    Records are derived from their position, so deliveries reference users, lockers and parcels by index and
+    nothing has to be kept in memory: every file is produced by a generator and streamed to disk, which keeps
+    memory flat from a thousand to tens of millions of deliveries.
+
+    Every valid delivery references existing users, locker and parcel, so validation only drops the invalid
+    records mixed in according to `DatasetConfig.invalid_fraction`. Invalid records use ids that valid
+    records never reference.
+
+    Attributes:
+        config (DatasetConfig): Parameters of the dataset.
+    """
+    config: DatasetConfig
+
+    def users(self) -> Iterator[UsersDataDict]:
+        """
+        Yields users; user `i` is the one referenced by deliveries as `user_email(i)`.
+        """
+        rng = self._random("users")
+        for i in range(self.config.users):
+            city, latitude, longitude = CITIES[i % len(CITIES)]
+            user: UsersDataDict = {
+                "email": self.user_email(i),
+                "name": FIRST_NAMES[i % len(FIRST_NAMES)],
+                "surname": LAST_NAMES[i // len(FIRST_NAMES) % len(LAST_NAMES)],
+                "city": city,
+                "latitude": round(latitude + rng.uniform(-0.1, 0.1), 6),
+                "longitude": round(longitude + rng.uniform(-0.1, 0.1), 6),
+            }
+            yield from self._with_invalid(rng, user, self._invalid_user)
+
+    def lockers(self) -> Iterator[LockersDataDict]:
+        """
+        Yields lockers with random compartment capacities.
+        """
+        rng = self._random("lockers")
+        for i in range(self.config.lockers):
+            city, latitude, longitude = CITIES[i % len(CITIES)]
+            locker: LockersDataDict = {
+                "locker_id": self.locker_id(i),
+                "city": city,
+                "latitude": round(latitude + rng.uniform(-0.1, 0.1), 6),
+                "longitude": round(longitude + rng.uniform(-0.1, 0.1), 6),
+                "compartments": {
+                    "small": rng.randint(10, 50),
+                    "medium": rng.randint(5, 30),
+                    "large": rng.randint(2, 15),
+                },
+            }
+            yield from self._with_invalid(rng, locker, self._invalid_locker)
+
+    def parcels(self) -> Iterator[ParcelsDataDict]:
+        """
+        Yields one parcel per delivery, with dimensions spread over all compartment sizes.
+        """
+        rng = self._random("parcels")
+        for i in range(self.config.deliveries):
+            parcel: ParcelsDataDict = {
+                "parcel_id": self.parcel_id(i),
+                "height": rng.randint(5, 40),
+                "length": rng.randint(10, 60),
+                "weight": rng.randint(1, 30),
+            }
+            yield from self._with_invalid(rng, parcel, self._invalid_parcel)
+
+    def deliveries(self) -> Iterator[DeliversDataDict]:
+        """
+        Yields deliveries with skewed locker and sender popularity and valid date ranges.
+        """
+        rng = self._random("deliveries")
+        users = self.config.users
+        first_day = self.config.start_date.toordinal()
+        days = self.config.end_date.toordinal() - first_day
+        for i in range(self.config.deliveries):
+            sender = self._skewed(rng, users, self.config.sender_skew)
+            receiver = rng.randrange(users - 1)
+            receiver += receiver >= sender
+            sent = first_day + rng.randint(0, days)
+            deliver: DeliversDataDict = {
+                "parcel_id": self.parcel_id(i),
+                "locker_id": self.locker_id(self._skewed(rng, self.config.lockers, self.config.locker_skew)),
+                "sender_email": self.user_email(sender),
+                "receiver_email": self.user_email(receiver),
+                "sent_date": date.fromordinal(sent).isoformat(),
+                "expected_delivery_date": date.fromordinal(
+                    sent + rng.randint(1, self.config.max_delivery_days)).isoformat(),
+            }
+            yield from self._with_invalid(rng, deliver, self._invalid_deliver)
+
+    def write(self, directory: str, extension: str = ".json") -> dict[str, int]:
+        """
+        Streams all four files to a directory, named like the files in data_json/.
+
+        Args:
+            directory (str): Target directory, created if missing.
+            extension (str): `.json` for JSON arrays, `.ndjson`/`.jsonl` for one record per line.
+
+        Returns:
+            dict[str, int]: Number of records written per file path.
+        """
+        os.makedirs(directory, exist_ok=True)
+        sources = {"users": self.users, "lockers": self.lockers, "parcels": self.parcels, "delivers": self.deliveries}
+        written = {}
+        for name, records in sources.items():
+            file_name = os.path.join(directory, name + extension)
+            writer: FileWriter[Any] = NdjsonFileWriter() if is_ndjson(file_name) else FileWriter()
+            start = time.perf_counter()
+            written[file_name] = writer.write_iter(file_name, records())
+            logging.info(f"Wrote {written[file_name]:,} records to {file_name} in {time.perf_counter() - start:.1f} s")
+        return written
+
+    @staticmethod
+    def user_email(index: int) -> str:
+        first = FIRST_NAMES[index % len(FIRST_NAMES)]
+        last = LAST_NAMES[index // len(FIRST_NAMES) % len(LAST_NAMES)]
+        return f"{first.lower()}.{last.lower()}{index}@{EMAIL_DOMAIN}"
+
+    @staticmethod
+    def locker_id(index: int) -> str:
+        return f"L{index:06d}"
+
+    @staticmethod
+    def parcel_id(index: int) -> str:
+        return f"P{index:09d}"
+
+    def _random(self, name: str) -> random.Random:
+        """
+        Returns a generator seeded per file, so every file is reproducible on its own.
+        """
+        return random.Random(f"{self.config.seed}-{name}")
+
+    @staticmethod
+    def _skewed(rng: random.Random, count: int, skew: float) -> int:
+        """
+        Draws an index in [0, count) whose probability decreases with the index for skew > 1.
+        """
+        return min(count - 1, int(count * rng.random() ** skew))
+
+    def _with_invalid(
+            self,
+            rng: random.Random,
+            record: Any,
+            make_invalid: Callable[[random.Random, dict[str, Any]], dict[str, Any]]) -> Iterator[Any]:
+        """
+        Yields the record, followed by a corrupted copy with probability `invalid_fraction`.
+        """
+        yield record
+        if self.config.invalid_fraction and rng.random() < self.config.invalid_fraction:
+            yield make_invalid(rng, dict(record))
+
+    @staticmethod
+    def _invalid_user(rng: random.Random, user: dict[str, Any]) -> dict[str, Any]:
+        user["email"] = user["email"].replace("@", ".invalid.")
+        if rng.random() < 0.5:
+            del user["city"]
+        return user
+
+    @staticmethod
+    def _invalid_locker(rng: random.Random, locker: dict[str, Any]) -> dict[str, Any]:
+        locker["locker_id"] += "-INVALID"
+        if rng.random() < 0.5:
+            locker["compartments"] = {**locker["compartments"], "small": -rng.randint(1, 10)}
+        else:
+            del locker["compartments"]
+        return locker
+
+    @staticmethod
+    def _invalid_parcel(rng: random.Random, parcel: dict[str, Any]) -> dict[str, Any]:
+        parcel["parcel_id"] += "-INVALID"
+        parcel[rng.choice(("height", "length", "weight"))] = -rng.randint(0, 10)
+        return parcel
+
+    @staticmethod
+    def _invalid_deliver(rng: random.Random, deliver: dict[str, Any]) -> dict[str, Any]:
+        deliver["parcel_id"] += "-INVALID"
+        match rng.randrange(3):
+            case 0:
+                deliver["receiver_email"] = deliver["sender_email"]
+            case 1:
+                deliver["sent_date"], deliver["expected_delivery_date"] = (
+                    deliver["expected_delivery_date"], deliver["sent_date"])
+            case _:
+                del deliver["locker_id"]
+        return deliver
+
+
+def main() -> None:
+    """
+    Writes a synthetic dataset in the format of data_json/.
+
+    Usage:
+        python -m src.dataset_generator data_json/generated --deliveries 1000000 --invalid-fraction 0.01
+    """
+    parser = argparse.ArgumentParser(description="Generate a seeded synthetic users/lockers/parcels/delivers dataset.")
+    parser.add_argument("directory", help="Directory to write users, lockers, parcels and delivers files to")
+    parser.add_argument("--deliveries", type=int, default=1_000)
+    parser.add_argument("--users", type=int, default=None, help="Defaults to one user per 20 deliveries")
+    parser.add_argument("--lockers", type=int, default=None, help="Defaults to one locker per 2,000 deliveries")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--locker-skew", type=float, default=DatasetConfig.locker_skew)
+    parser.add_argument("--sender-skew", type=float, default=DatasetConfig.sender_skew)
+    parser.add_argument("--invalid-fraction", type=float, default=0.0)
+    parser.add_argument("--start-date", type=date.fromisoformat, default=DatasetConfig.start_date)
+    parser.add_argument("--end-date", type=date.fromisoformat, default=DatasetConfig.end_date)
+    parser.add_argument("--format", choices=("json", "ndjson"), default="json")
+    args = parser.parse_args()
+
+    counts = {key: value for key, value in (("users", args.users), ("lockers", args.lockers)) if value is not None}
+    config = DatasetConfig.for_deliveries(
+        args.deliveries,
+        seed=args.seed,
+        locker_skew=args.locker_skew,
+        sender_skew=args.sender_skew,
+        invalid_fraction=args.invalid_fraction,
+        start_date=args.start_date,
+        end_date=args.end_date,
+        **counts,
+    )
+    DatasetGenerator(config).write(args.directory, f".{args.format}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+from datetime import date, datetime
+import functools
+
+DATE_CACHE_SIZE = 1 << 16
+
+
+@functools.lru_cache(maxsize=DATE_CACHE_SIZE)
+def day_number(value: str) -> int:
+    """
+    Parses a 'YYYY-MM-DD' date into a day number (proleptic Gregorian ordinal, as `date.toordinal`).
+
+    Zero-padded dates are sliced and checked directly; anything else goes through
+    `datetime.strptime(value, "%Y-%m-%d")`, so the same inputs are accepted as before. Results are
+    memoized, so a dataset with many records per day parses every distinct date once.
+
+    Args:
+        value (str): Date in 'YYYY-MM-DD' format.
+
+    Returns:
+        int: Day number; the difference of two day numbers is the number of days between the dates.
+
+    Raises:
+        ValueError: If the value is not a valid 'YYYY-MM-DD' date.
+    """
+    digits = value[:4] + value[5:7] + value[8:]
+    if len(value) != 10 or value[4] != "-" or value[7] != "-" or not (digits.isascii() and digits.isdigit()):
+        return datetime.strptime(value, "%Y-%m-%d").toordinal()
+    return date(int(value[:4]), int(value[5:7]), int(value[8:])).toordinal()
+
+
+@functools.lru_cache(maxsize=DATE_CACHE_SIZE)
+def iso_date(day: int) -> str:
+    """
+    Formats a day number back into a 'YYYY-MM-DD' string, memoized per distinct day.
+    """
+    return date.fromordinal(day).isoformat()
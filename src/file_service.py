@@ -1,10 +1,140 @@
 from src.model import User, Parcel, Locker, Deliver, UsersDataDict, LockersDataDict, ParcelsDataDict, DeliversDataDict
+from typing import Any, Iterable, Iterator, TextIO, override
+from dataclasses import dataclass
 import json
+import io
+import os
+import re
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _JsonArrayStream:
+    """
+    Incremental parser for a top-level JSON array.
+
+    Reads the file in chunks of `chunk_size` characters and decodes one array element at a time,
+    so only the current chunk and the element being decoded are held in memory. An element that still
+    fails to decode once more than `max_element_size` characters of it are buffered is reported as invalid,
+    so a corrupt element does not pull the rest of the file into memory. With `opened=True` the input
+    starts inside the array, right after a previously read element.
+    """
+    def __init__(self, file: TextIO, chunk_size: int, max_element_size: int, opened: bool = False) -> None:
+        self._file = file
+        self._chunk_size = chunk_size
+        self._max_element_size = max_element_size
+        self._opened = opened
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._eof = False
+
+    def __iter__(self) -> Iterator[Any]:
+        if not self._opened:
+            self._expect("[")
+        elif self._peek() == ",":
+            # Continuation of an array whose earlier elements were already read.
+            self._position += 1
+        if self._peek() == "]":
+            return
+        while True:
+            yield self._decode()
+            match self._peek():
+                case ",":
+                    self._position += 1
+                case "]":
+                    return
+                case _:
+                    raise self._error("Expecting ',' delimiter")
+
+    def _read_more(self) -> bool:
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._position:] + chunk
+        self._position = 0
+        return True
+
+    def _peek(self) -> str:
+        while True:
+            self._position = _WHITESPACE.match(self._buffer, self._position).end()  # type: ignore[union-attr]
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._read_more():
+                return ""
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise self._error(f"Expecting '{char}'")
+        self._position += 1
+
+    def _decode(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if len(self._buffer) - self._position <= self._max_element_size and self._read_more():
+                    continue
+                raise
+            # A number or literal ending exactly at the chunk boundary may continue in the next chunk.
+            if end == len(self._buffer) and not self._eof and self._read_more():
+                continue
+            self._position = end
+            return value
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._position)
+
+
+@dataclass(frozen=True)
+class FileState:
+    """
+    Identity and version of a file on disk, used to detect changes.
+
+    Attributes:
+        size (int): File size in bytes.
+        mtime_ns (int): Last modification time in nanoseconds.
+        inode (int): Inode number; a new inode means the file was replaced rather than modified.
+    """
+    size: int
+    mtime_ns: int
+    inode: int
+
+    @classmethod
+    def of(cls, file_name: str) -> "FileState | None":
+        """
+        Returns the current state of a file, or None if it cannot be accessed.
+        """
+        try:
+            stat = os.stat(file_name)
+        except OSError:
+            return None
+        return cls(size=stat.st_size, mtime_ns=stat.st_mtime_ns, inode=stat.st_ino)
+
+def read_bytes(file_name: str, start: int, end: int) -> bytes:
+    """
+    Reads the bytes of a file in the range [start, end).
+    """
+    with open(file_name, "rb") as file:
+        file.seek(start)
+        return file.read(end - start)
 
 class FileReader[T]:
     """
     Generic file reader class for reading JSON data_json into a list of type T.
+
+    Attributes:
+        extensions (tuple[str, ...]): File extensions handled by this reader.
+        chunk_size (int): Number of characters read at once by `iter_read`.
+        max_element_size (int): Number of characters `iter_read` buffers for a single element before
+            treating it as invalid JSON.
     """
+    extensions: tuple[str, ...] = (".json",)
+    chunk_size: int = 64 * 1024
+    max_element_size: int = 1024 * 1024
+
     def read(self, file_name: str) -> list[T]:
         """
         Reads JSON data_json from a file and returns it as a list of objects of type T.
@@ -18,6 +148,121 @@ class FileReader[T]:
         with open(file_name, "r", encoding="utf-8") as file:
             return json.load(file)
 
+    def iter_read(self, file_name: str) -> Iterator[T]:
+        """
+        Lazily reads a top-level JSON array from a file, yielding one element at a time.
+
+        Unlike `read`, the whole file is never loaded into memory, which keeps memory usage
+        bounded by `chunk_size` and `max_element_size`. The price is throughput: decoding element by
+        element is somewhat slower than `json.load`, for a much lower peak memory
+        (`python -m benchmarks.bench_file_reader` measures both).
+
+        Args:
+            file_name (str): Path to the JSON file.
+
+        Yields:
+            T: Deserialized objects in file order.
+
+        Raises:
+            json.JSONDecodeError: If the file is not a valid JSON array, or an element does not decode
+                within `max_element_size` characters.
+        """
+        with open(file_name, "r", encoding="utf-8") as file:
+            yield from _JsonArrayStream(file, self.chunk_size, self.max_element_size)
+
+    def append_offset(self, file_name: str, size: int) -> int | None:
+        """
+        Returns the byte offset right after the last array element of the first `size` bytes of the file.
+
+        Appending elements to a JSON array keeps every byte before this offset unchanged, so elements
+        added later can be read with `read_appended` starting here.
+
+        Args:
+            file_name (str): Path to the JSON file.
+            size (int): Number of bytes of the file to consider.
+
+        Returns:
+            int | None: Offset of appended data_json, or None if the file does not end with a JSON array.
+        """
+        start = max(0, size - 4096)
+        tail = read_bytes(file_name, start, size).rstrip()
+        if not tail.endswith(b"]"):
+            return None
+        body = tail[:-1].rstrip()
+        if not body:
+            return None
+        return start + len(body)
+
+    def read_appended(self, file_name: str, offset: int, size: int) -> list[T]:
+        """
+        Reads elements appended to a JSON array, from `append_offset` up to `size` bytes of the file.
+
+        Args:
+            file_name (str): Path to the JSON file.
+            offset (int): Offset returned by `append_offset` before the elements were appended.
+            size (int): Current size of the file.
+
+        Returns:
+            list[T]: Appended objects in file order.
+
+        Raises:
+            json.JSONDecodeError: If the appended part is not a valid continuation of the array.
+        """
+        text = read_bytes(file_name, offset, size).decode("utf-8")
+        return list(_JsonArrayStream(io.StringIO(text), self.chunk_size, self.max_element_size, opened=True))
+
+class NdjsonFileReader[T](FileReader[T]):
+    """
+    Generic file reader for NDJSON (JSON Lines) files, where every line holds one JSON object.
+    """
+    extensions: tuple[str, ...] = (".ndjson", ".jsonl")
+
+    @override
+    def read(self, file_name: str) -> list[T]:
+        """
+        Reads all records from an NDJSON file.
+
+        Args:
+            file_name (str): Path to the NDJSON file.
+
+        Returns:
+            list[T]: List of deserialized objects.
+        """
+        return list(self.iter_read(file_name))
+
+    @override
+    def iter_read(self, file_name: str) -> Iterator[T]:
+        """
+        Lazily reads an NDJSON file line by line, skipping blank lines.
+
+        Args:
+            file_name (str): Path to the NDJSON file.
+
+        Yields:
+            T: Deserialized objects in file order.
+        """
+        with open(file_name, "r", encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+    @override
+    def append_offset(self, file_name: str, size: int) -> int | None:
+        """
+        Returns the offset where appended lines start, or None if the last line is incomplete.
+        """
+        if size == 0:
+            return 0
+        return size if read_bytes(file_name, size - 1, size) == b"\n" else None
+
+    @override
+    def read_appended(self, file_name: str, offset: int, size: int) -> list[T]:
+        """
+        Reads the lines appended after `offset`, up to `size` bytes of the file.
+        """
+        text = read_bytes(file_name, offset, size).decode("utf-8")
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+
 class UserReaderJson(FileReader[User]):
     """
     File reader specialized for User objects.
@@ -42,10 +287,55 @@ class DeliverReaderJson(FileReader[Deliver]):
     """
     pass
 
+class UserReaderNdjson(NdjsonFileReader[User]):
+    """
+    NDJSON file reader specialized for User objects.
+    """
+    pass
+
+class LockerReaderNdjson(NdjsonFileReader[Locker]):
+    """
+    NDJSON file reader specialized for Locker objects.
+    """
+    pass
+
+class ParcelReaderNdjson(NdjsonFileReader[Parcel]):
+    """
+    NDJSON file reader specialized for Parcel objects.
+    """
+    pass
+
+class DeliverReaderNdjson(NdjsonFileReader[Deliver]):
+    """
+    NDJSON file reader specialized for Deliver objects.
+    """
+    pass
+
+FILE_READERS: dict[str, type[FileReader]] = {
+    extension: reader for reader in (FileReader, NdjsonFileReader) for extension in reader.extensions
+}
+
+def reader_for[T](file_name: str, reader: FileReader[T]) -> FileReader[T]:
+    """
+    Picks a reader matching the extension of the given file.
+
+    Args:
+        file_name (str): Path to the file that is going to be read.
+        reader (FileReader[T]): Configured reader, kept if it handles the extension or the extension is unknown.
+
+    Returns:
+        FileReader[T]: Reader able to parse the file.
+    """
+    extension = os.path.splitext(file_name)[1].lower()
+    if not isinstance(reader, FileReader) or extension in reader.extensions or extension not in FILE_READERS:
+        return reader
+    return FILE_READERS[extension]()
+
 class FileWriter[T]:
     """
     Generic file writer class for writing a list of objects of type T to a JSON file.
     """
+    extensions: tuple[str, ...] = (".json",)
 
     def write(self, file_name: str, data: list[T]) -> None:
         """
@@ -58,6 +348,67 @@ class FileWriter[T]:
         with open(file_name, "w", encoding="utf-8") as file:
             json.dump(data, file, indent=4, ensure_ascii=False)
 
+    def write_iter(self, file_name: str, data: Iterable[T]) -> int:
+        """
+        Writes objects to a JSON file one at a time, producing the same output as `write`
+        without holding the whole list in memory.
+
+        Args:
+            file_name (str): Path to the JSON file.
+            data (Iterable[T]): Objects to serialize, e.g. a generator.
+
+        Returns:
+            int: Number of objects written.
+        """
+        count = 0
+        with open(file_name, "w", encoding="utf-8") as file:
+            file.write("[")
+            for count, entry in enumerate(data, start=1):
+                file.write(self._element(entry, first=count == 1))
+            file.write("\n]" if count else "]")
+        return count
+
+    def append(self, file_name: str, data: list[T]) -> None:
+        """
+        Appends objects to the JSON array in a file in place: only the closing bracket is rewritten, so the cost
+        does not depend on the size of the file. The result is the same as writing the whole list with `write`.
+
+        The new tail is written over the closing bracket in one write, and the file is truncated only after it
+        succeeded. This is still not crash safe: a crash during the write leaves the array unterminated and the file
+        unreadable. NDJSON appends never rewrite existing bytes; convert files that must survive a crash with
+        `convert_json_to_ndjson`.
+
+        Args:
+            file_name (str): Path to the JSON file, created if it does not exist or is empty.
+            data (list[T]): List of objects to append.
+
+        Raises:
+            ValueError: If the file does not end with a JSON array.
+        """
+        size = os.path.getsize(file_name) if os.path.exists(file_name) else 0
+        if size == 0:
+            self.write(file_name, data)
+            return
+        if not data:
+            return
+        offset = FileReader[T]().append_offset(file_name, size)
+        if offset is None:
+            raise ValueError(f"{file_name} does not end with a JSON array")
+        first = read_bytes(file_name, offset - 1, offset) == b"["
+        text = "".join(self._element(entry, first=first and index == 0) for index, entry in enumerate(data))
+        with open(file_name, "r+b") as file:
+            file.seek(offset)
+            file.write((text + "\n]").encode("utf-8"))
+            file.truncate()
+
+    @staticmethod
+    def _element(entry: T, first: bool) -> str:
+        """
+        Formats an array element the way `json.dump(..., indent=4)` does, with its leading separator.
+        """
+        separator = "\n    " if first else ",\n    "
+        return separator + json.dumps(entry, indent=4, ensure_ascii=False).replace("\n", "\n    ")
+
 class UserWriterJson(FileWriter[User]):
     """
     File writer specialized for User objects.
@@ -80,4 +431,125 @@ class DeliverWriterJson(FileWriter[Deliver]):
     """
     File writer specialized for Deliver objects.
     """
-    pass
\ No newline at end of file
+    pass
+
+class NdjsonFileWriter[T](FileWriter[T]):
+    """
+    Generic file writer for NDJSON (JSON Lines) files, writing one JSON object per line.
+    """
+    extensions: tuple[str, ...] = (".ndjson", ".jsonl")
+
+    @override
+    def write(self, file_name: str, data: list[T]) -> None:
+        """
+        Writes a list of objects to an NDJSON file, replacing its content.
+
+        Args:
+            file_name (str): Path to the NDJSON file.
+            data (list[T]): List of objects to serialize.
+        """
+        with open(file_name, "w", encoding="utf-8") as file:
+            file.writelines(self._lines(data))
+
+    @override
+    def append(self, file_name: str, data: list[T]) -> None:
+        """
+        Appends objects to the end of an NDJSON file without reading or rewriting existing records.
+        A missing newline after the last record is added first, so it is not merged with the first appended one.
+
+        Args:
+            file_name (str): Path to the NDJSON file, created if it does not exist.
+            data (list[T]): List of objects to append.
+        """
+        size = os.path.getsize(file_name) if os.path.exists(file_name) else 0
+        separator = "\n" if size and read_bytes(file_name, size - 1, size) != b"\n" else ""
+        with open(file_name, "a", encoding="utf-8") as file:
+            file.write(separator + "".join(self._lines(data)))
+
+    @override
+    def write_iter(self, file_name: str, data: Iterable[T]) -> int:
+        """
+        Writes objects to an NDJSON file one line at a time.
+
+        Args:
+            file_name (str): Path to the NDJSON file.
+            data (Iterable[T]): Objects to serialize, e.g. a generator.
+
+        Returns:
+            int: Number of objects written.
+        """
+        count = 0
+        with open(file_name, "w", encoding="utf-8") as file:
+            for count, line in enumerate(self._lines(data), start=1):
+                file.write(line)
+        return count
+
+    @staticmethod
+    def _lines(data: Iterable[T]) -> Iterator[str]:
+        for entry in data:
+            yield json.dumps(entry, ensure_ascii=False) + "\n"
+
+class UserWriterNdjson(NdjsonFileWriter[User]):
+    """
+    NDJSON file writer specialized for User objects.
+    """
+    pass
+
+class LockerWriterNdjson(NdjsonFileWriter[Locker]):
+    """
+    NDJSON file writer specialized for Locker objects.
+    """
+    pass
+
+class ParcelWriterNdjson(NdjsonFileWriter[Parcel]):
+    """
+    NDJSON file writer specialized for Parcel objects.
+    """
+    pass
+
+class DeliverWriterNdjson(NdjsonFileWriter[Deliver]):
+    """
+    NDJSON file writer specialized for Deliver objects.
+    """
+    pass
+
+FILE_WRITERS: dict[str, type[FileWriter]] = {
+    extension: writer for writer in (FileWriter, NdjsonFileWriter) for extension in writer.extensions
+}
+
+def writer_for(file_name: str) -> FileWriter:
+    """
+    Picks a writer matching the extension of the given file; unknown extensions are written as JSON.
+
+    Args:
+        file_name (str): Path to the file that is going to be written.
+
+    Returns:
+        FileWriter: Writer producing the file's format.
+    """
+    return FILE_WRITERS.get(os.path.splitext(file_name)[1].lower(), FileWriter)()
+
+def is_ndjson(file_name: str) -> bool:
+    """
+    Checks whether the file extension denotes an NDJSON (JSON Lines) file.
+    """
+    return os.path.splitext(file_name)[1].lower() in NdjsonFileReader.extensions
+
+def convert_json_to_ndjson(source: str, target: str | None = None) -> str:
+    """
+    Converts a JSON array file into an NDJSON file, streaming one record at a time.
+
+    Args:
+        source (str): Path to the JSON array file.
+        target (str | None): Path of the NDJSON file to create; defaults to `source` with an `.ndjson` extension.
+
+    Returns:
+        str: Path of the written NDJSON file.
+    """
+    if target is None:
+        target = os.path.splitext(source)[0] + ".ndjson"
+    records = FileReader[Any]().iter_read(source)
+    with open(target, "w", encoding="utf-8") as file:
+        for record in records:
+            file.write(json.dumps(record, ensure_ascii=False) + "\n")
+    return target
\ No newline at end of file
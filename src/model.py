@@ -1,6 +1,10 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from src.dates import day_number
 from typing import TypedDict
 from enum import Enum
+import hashlib
+import json
+import os
 
 class CompartmentsLarge(Enum):
     """
@@ -10,6 +14,81 @@ class CompartmentsLarge(Enum):
     MEDIUM = "medium"
     LARGE = "large"
 
+class ParcelSizeRuleDict(TypedDict):
+    """
+        TypedDict representing one row of a parcel size rule table, as stored in a JSON file.
+        """
+    size: str
+    max_height: int
+    max_length: int
+
+@dataclass(frozen=True, slots=True)
+class ParcelSizeRule:
+    """
+        A parcel fits `size` if its height and length do not exceed the given limits (in centimeters).
+        """
+    size: CompartmentsLarge
+    max_height: int
+    max_length: int
+
+@dataclass
+class ParcelSizeRules:
+    """
+        Sorted table of parcel size rules; the first rule a parcel fits decides its size.
+
+        Rules are kept sorted from the smallest to the largest limits, so tiers can be added or changed by
+        configuring a new table (e.g. from a JSON file named by the PARCEL_SIZE_RULES environment variable)
+        without touching the classification code. Parcels fitting no rule get `fallback`.
+
+        Attributes:
+            rules (list[ParcelSizeRule]): Rules, sorted by (max_height, max_length).
+            fallback (CompartmentsLarge): Size of parcels exceeding every rule.
+        """
+    rules: list[ParcelSizeRule] = field(default_factory=lambda: [
+        ParcelSizeRule(CompartmentsLarge.SMALL, max_height=20, max_length=40),
+        ParcelSizeRule(CompartmentsLarge.MEDIUM, max_height=30, max_length=50),
+    ])
+    fallback: CompartmentsLarge = CompartmentsLarge.LARGE
+
+    def __post_init__(self) -> None:
+        self.rules = sorted(self.rules, key=lambda rule: (rule.max_height, rule.max_length))
+
+    @classmethod
+    def from_file(cls, file_name: str) -> "ParcelSizeRules":
+        """
+                Loads a rule table from a JSON list of {"size", "max_height", "max_length"} objects.
+                """
+        with open(file_name, "r", encoding="utf-8") as file:
+            rows: list[ParcelSizeRuleDict] = json.load(file)
+        return cls([ParcelSizeRule(CompartmentsLarge(row["size"]), row["max_height"], row["max_length"]) for row in rows])
+
+    def configure(self, rules: list[ParcelSizeRule], fallback: CompartmentsLarge | None = None) -> None:
+        """
+                Replaces the rule table. Parcels created earlier keep the size they were classified with.
+                """
+        self.rules = sorted(rules, key=lambda rule: (rule.max_height, rule.max_length))
+        if fallback is not None:
+            self.fallback = fallback
+
+    def classify(self, height: int, length: int) -> CompartmentsLarge:
+        """
+                Returns the size of the first rule the dimensions fit, or `fallback`.
+                """
+        for rule in self.rules:
+            if height <= rule.max_height and length <= rule.max_length:
+                return rule.size
+        return self.fallback
+
+    def fingerprint(self) -> str:
+        """
+                Returns a short hash of the rule table, so data classified with another table can be told apart.
+                """
+        table = [(rule.size.value, rule.max_height, rule.max_length) for rule in self.rules]
+        return hashlib.blake2b(repr((table, self.fallback.value)).encode(), digest_size=8).hexdigest()
+
+parcel_size_rules = ParcelSizeRules.from_file(os.environ["PARCEL_SIZE_RULES"]) \
+    if os.environ.get("PARCEL_SIZE_RULES") else ParcelSizeRules()
+
 class UsersDataDict(TypedDict):
     """
         TypedDict representing the structure of user data_json.
@@ -57,7 +136,7 @@ class DeliversDataDict(TypedDict):
     expected_delivery_date: str
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """
         Represents a system user with location information.
@@ -82,7 +161,7 @@ class User:
             "longitude": self.longitude
         }
 
-@dataclass
+@dataclass(slots=True)
 class Locker:
     """
         Represents a parcel locker with compartments of various sizes.
@@ -106,15 +185,21 @@ class Locker:
             "compartments": {key.value: value for key, value in self.compartments.items()},
         }
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Parcel:
     """
         Represents a physical parcel with dimensions and weight.
+
+        `size` is classified once on creation with the shared `parcel_size_rules` table.
         """
     parcel_id: str
     height: int
     length: int
     weight: int
+    size: CompartmentsLarge = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "size", parcel_size_rules.classify(self.height, self.length))
 
     @staticmethod
     def get_size(height: int, length: int) -> CompartmentsLarge:
@@ -122,9 +207,9 @@ class Parcel:
            Determines the parcel size category based on its dimensions.
 
            This method evaluates the given `height` and `length` of a parcel
-           and returns the corresponding size category based on predefined thresholds.
+           and returns the corresponding size category from the `parcel_size_rules` table.
 
-           Size categories:
+           Default size categories:
                - SMALL: height ≤ 20 cm and length ≤ 40 cm
                - MEDIUM: height ≤ 30 cm and length ≤ 50 cm
                - LARGE: any parcel exceeding the above dimensions
@@ -137,13 +222,7 @@ class Parcel:
                CompartmentsLarge: The size category enum value (`SMALL`, `MEDIUM`, or `LARGE`).
 
            """
-
-        if height <= 20 and length <= 40:
-            return CompartmentsLarge.SMALL
-        elif height <= 30 and length <= 50:
-            return CompartmentsLarge.MEDIUM
-        else:
-            return CompartmentsLarge.LARGE
+        return parcel_size_rules.classify(height, length)
 
     def to_dict(self) -> ParcelsDataDict:
         """
@@ -156,10 +235,13 @@ class Parcel:
             "weight": self.weight,
         }
 
-@dataclass
+@dataclass(slots=True)
 class Deliver:
     """
         Represents a delivery operation between a sender and receiver.
+
+        Dates are kept as 'YYYY-MM-DD' strings and parsed once on creation into `sent_day` and
+        `expected_day` day numbers (date ordinals), which reports use instead of parsing the strings.
         """
     parcel_id: str
     locker_id: str
@@ -167,6 +249,12 @@ class Deliver:
     receiver_email: str
     sent_date: str
     expected_delivery_date: str
+    sent_day: int = field(init=False, repr=False, compare=False)
+    expected_day: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.sent_day = day_number(self.sent_date)
+        self.expected_day = day_number(self.expected_delivery_date)
 
     def to_dict(self) -> DeliversDataDict:
         """
@@ -181,3 +269,18 @@ class Deliver:
             "expected_delivery_date": self.expected_delivery_date,
         }
 
+
+@dataclass(frozen=True, slots=True)
+class EnrichedDelivery:
+    """
+        A delivery joined with the records it references, as served by `ParcelSummaryRepository.delivery_view`.
+
+        Only deliveries whose parcel, locker, sender and receiver all exist are enriched, so reports never
+        look up references again. `days` is the number of days between the sent and expected delivery dates.
+        """
+    deliver: Deliver
+    size: CompartmentsLarge
+    locker_city: str
+    sender_city: str
+    receiver_city: str
+    days: int
@@ -1,14 +1,68 @@
 from src.service import ParcelReportService
+from dataclasses import dataclass, field
 from src.model import CompartmentsLarge
-from dataclasses import dataclass
+from typing import Any, Callable
+from datetime import date
 from pandas import DataFrame
 import pandas as pd
+import functools
+import threading
+
+
+ReportMethod = Callable[["ReportService", date | None, date | None], DataFrame]
+ReportKey = tuple[str, date | None, date | None]
+
+
+def cached_report(method: ReportMethod) -> Callable[..., DataFrame]:
+    """
+    Caches the DataFrame returned by a ReportService method per sent-date window until the repository data_json
+    version changes.
+    """
+    @functools.wraps(method)
+    def wrapper(self: "ReportService", since: date | None = None, until: date | None = None) -> DataFrame:
+        return self._cached((method.__name__, since, until), lambda: method(self, since, until))
+    return wrapper
+
 
 @dataclass
 class ReportService:
+    """
+    Builds report DataFrames from ParcelReportService results.
+
+    DataFrames are cached per report and sent-date window and keyed on the repository generations, so repeated
+    requests (e.g. Streamlit reruns) reuse them until any repository data_json changes.
+    """
     service: ParcelReportService
+    _cache: dict[ReportKey, tuple[Any, DataFrame]] = field(default_factory=dict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def _cached(self, key: ReportKey, build: Callable[[], DataFrame]) -> DataFrame:
+        """
+        Returns the cached DataFrame of a report if it was built for the current repository generations.
+        DataFrames built for older generations are dropped when a new one is stored.
+
+        Args:
+            key (ReportKey): Report name and sent-date window used as cache key.
+            build (Callable[[], DataFrame]): Builds the DataFrame on a cache miss.
+
+        Returns:
+            DataFrame: Report DataFrame.
+        """
+        version = self.service.repository.data_version()
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        df = build()
+        with self._lock:
+            self._cache = {
+                cached_key: entry for cached_key, entry in self._cache.items() if entry[0] == version}
+            self._cache[key] = (version, df)
+        return df
 
-    def report_most_common_parcel_sizes_per_locker(self) -> DataFrame:
+    @cached_report
+    def report_most_common_parcel_sizes_per_locker(
+            self, since: date | None = None, until: date | None = None) -> DataFrame:
         """
         Displays a table of the most common parcel sizes per locker using Streamlit.
 
@@ -17,19 +71,21 @@ class ReportService:
         most frequent parcel sizes.
 
         Args:
-            service (ParcelReportService): A service object that provides parcel report data.
+            since (date | None): Only deliveries sent on or after this date; unbounded if None.
+            until (date | None): Only deliveries sent on or before this date; unbounded if None.
 
         Returns:
             None
         """
-        data = self.service.most_common_parcel_sizes_per_locker()
+        data = self.service.most_common_parcel_sizes_per_locker(since, until)
 
         df = pd.DataFrame([
             {"Locker ID": locker_id, "Most Common Size(s)": ", ".join(sizes)} for locker_id, sizes in data.items()])
 
         return df
 
-    def report_city_most_shipments_by_size(self) -> DataFrame:
+    @cached_report
+    def report_city_most_shipments_by_size(self, since: date | None = None, until: date | None = None) -> DataFrame:
         """
         Displays a table of cities with the most shipments sent and received, grouped by parcel size.
 
@@ -38,12 +94,13 @@ class ReportService:
         city with the most activity for sending or receiving.
 
         Args:
-            service (ParcelReportService): A service object that provides parcel shipment statistics.
+            since (date | None): Only deliveries sent on or after this date; unbounded if None.
+            until (date | None): Only deliveries sent on or before this date; unbounded if None.
 
         Returns:
             None
         """
-        data = self.service.city_most_shipments_by_size()
+        data = self.service.city_most_shipments_by_size(since, until)
 
         df = pd.DataFrame([
             {
@@ -58,7 +115,9 @@ class ReportService:
 
         return df
 
-    def report_max_days_between_sent_and_expected(self) -> DataFrame:
+    @cached_report
+    def report_max_days_between_sent_and_expected(
+            self, since: date | None = None, until: date | None = None) -> DataFrame:
         """
         Generates and displays a Streamlit table showing the maximum number of days
         between when a parcel was sent and the expected delivery date for each email.
@@ -67,12 +126,13 @@ class ReportService:
         and renders it as an interactive table in Streamlit.
 
         Args:
-            service (ParcelReportService): The service object providing parcel report data.
+            since (date | None): Only deliveries sent on or after this date; unbounded if None.
+            until (date | None): Only deliveries sent on or before this date; unbounded if None.
 
         Returns:
             None
         """
-        data = self.service.max_days_between_sent_and_expected()
+        data = self.service.max_days_between_sent_and_expected(since, until)
 
         df = pd.DataFrame([
             {
@@ -83,7 +143,9 @@ class ReportService:
 
         return df
 
-    def report_is_parcel_limit_in_locker_exceeded(self) -> DataFrame:
+    @cached_report
+    def report_is_parcel_limit_in_locker_exceeded(
+            self, since: date | None = None, until: date | None = None) -> DataFrame:
         """
         Displays a Streamlit dataframe indicating whether the parcel limit in each locker
         has been exceeded, broken down by compartment size (Small, Medium, Large).
@@ -92,12 +154,13 @@ class ReportService:
         and shows the counts of parcels per size category for each locker.
 
         Args:
-            service (ParcelReportService): The service providing parcel limit data per locker.
+            since (date | None): Only deliveries sent on or after this date; unbounded if None.
+            until (date | None): Only deliveries sent on or before this date; unbounded if None.
 
         Returns:
             None
         """
-        data = self.service.is_parcel_limit_in_locker_exceeded()
+        data = self.service.is_parcel_limit_in_locker_exceeded(since, until)
 
 
         df = pd.DataFrame([
@@ -1,13 +1,334 @@
-from src.model import User, UsersDataDict, LockersDataDict, Locker, ParcelsDataDict, DeliversDataDict, Deliver, Parcel
-from dataclasses import dataclass, field
-from src.file_service import FileReader
+from src.model import (
+    User, UsersDataDict, LockersDataDict, Locker, ParcelsDataDict, DeliversDataDict, Deliver, Parcel, EnrichedDelivery,
+    parcel_size_rules,
+)
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, ClassVar, Iterable, Iterator, Sequence, overload, override
+from src.file_service import FileReader, FileState, reader_for, writer_for, read_bytes
 from collections import defaultdict
+from src.snapshot import SnapshotCache, SnapshotKey
 from src.converter import Converter
 from src.validator import Validator
+from src.concurrency import SingleFlight
+from concurrent.futures import ProcessPoolExecutor, Future
+from collections import deque
+from itertools import batched, chain, islice, takewhile
+from bisect import bisect_left, bisect_right
+from datetime import date
+from enum import Enum
+import multiprocessing
+import heapq
 import logging
 
 logging.basicConfig(level=logging.INFO)
 
+# Repositories are loaded from worker threads (see src.bootstrap), and forking a multi-threaded process can deadlock.
+_PROCESS_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn")
+
+
+class RefreshResult(Enum):
+    """
+    Outcome of `DataRepository.refresh_if_changed`.
+    """
+    UNCHANGED = "unchanged"
+    APPENDED = "appended"
+    RELOADED = "reloaded"
+
+
+class ListPrefix[U](Sequence[U]):
+    """
+    Read-only view of the first items of a list that is only ever appended to.
+
+    The snapshots of one load share a single item list and each one sees its own prefix of it, so appending
+    to the data_json neither copies the list nor changes what earlier snapshots show.
+
+    Attributes:
+        items (list[U]): The shared list; must only be appended to, through `extended`.
+        length (int): Number of items, from the start of the list, that belong to this view.
+    """
+    __slots__ = ("items", "length")
+
+    def __init__(self, items: list[U] | None = None, length: int | None = None) -> None:
+        self.items: list[U] = [] if items is None else items
+        self.length = len(self.items) if length is None else length
+
+    def __len__(self) -> int:
+        return self.length
+
+    @overload
+    def __getitem__(self, index: int) -> U: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[U]: ...
+
+    def __getitem__(self, index: int | slice) -> U | list[U]:
+        if isinstance(index, slice):
+            return self.items[slice(*index.indices(self.length))]
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("ListPrefix index out of range")
+        return self.items[index]
+
+    def __iter__(self) -> Iterator[U]:
+        return islice(self.items, self.length)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (list, ListPrefix)):
+            return NotImplemented
+        return len(self) == len(other) and all(mine == theirs for mine, theirs in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"ListPrefix({list(self)!r})"
+
+    def is_latest(self) -> bool:
+        """
+        Checks that nothing was appended to the shared list after this prefix.
+        """
+        return self.length == len(self.items)
+
+    def extended(self, items: Iterable[U]) -> "ListPrefix[U]":
+        """
+        Returns a prefix with the items added after this one, in O(number of items).
+
+        The shared list is appended to in place; if this prefix is not its latest one, it is copied first so
+        later prefixes keep their items. Callers serialize appends to the same list.
+        """
+        shared = self.items if self.is_latest() else self.items[:self.length]
+        shared.extend(items)
+        return ListPrefix(shared)
+
+
+@dataclass
+class RepositoryIndex[U]:
+    """
+    Lookup tables over the item list of one load, shared by all snapshots of that load.
+
+    Items are recorded by their position in the list, and a snapshot only looks at positions before its own
+    length, so the tables grow in place on appends and earlier snapshots keep seeing their own items.
+
+    Attributes:
+        primary_key (str | None): Attribute holding a unique key (e.g. email, locker_id, parcel_id).
+        secondary_keys (tuple[str, ...]): Attributes indexed as non-unique keys.
+        primary (dict[str, int]): Position of the last item with each primary key value.
+        shadowed (dict[str, list[int]]): Earlier positions of primary key values that occur more than once.
+        secondary (dict[str, dict[str, list[int]]]): Mapping of attribute name to key values and the positions
+            of matching items, ascending.
+        size (int): Number of items added.
+    """
+    primary_key: str | None = None
+    secondary_keys: tuple[str, ...] = ()
+    primary: dict[str, int] = field(default_factory=dict)
+    shadowed: dict[str, list[int]] = field(default_factory=dict)
+    secondary: dict[str, dict[str, list[int]]] = field(default_factory=dict)
+    size: int = 0
+
+    def __post_init__(self) -> None:
+        for key in self.secondary_keys:
+            self.secondary.setdefault(key, defaultdict(list))
+
+    def add(self, item: U) -> None:
+        """
+        Adds a single item, at the next position, to every index.
+        """
+        position = self.size
+        if self.primary_key is not None:
+            key = getattr(item, self.primary_key)
+            if key in self.primary:
+                self.shadowed.setdefault(key, []).append(self.primary[key])
+            self.primary[key] = position
+        for key, index in self.secondary.items():
+            index[getattr(item, key)].append(position)
+        self.size += 1
+
+    def build(self, data: Iterable[U]) -> "RepositoryIndex[U]":
+        """
+        Adds all items to the indexes.
+
+        Returns:
+            RepositoryIndex[U]: The index itself, to allow chaining.
+        """
+        for item in data:
+            self.add(item)
+        return self
+
+    def position(self, key: str, length: int) -> int | None:
+        """
+        Returns the position of the last item with the primary key value among the first `length` items.
+        """
+        position = self.primary.get(key)
+        if position is None or position < length:
+            return position
+        earlier = self.shadowed.get(key, [])
+        stop = bisect_left(earlier, length)
+        return earlier[stop - 1] if stop else None
+
+    def positions(self, key: str, value: str, length: int) -> list[int]:
+        """
+        Returns the positions of the items with the attribute value among the first `length` items.
+        """
+        positions = self.secondary[key].get(value, [])
+        if positions and positions[-1] >= length:
+            return positions[:bisect_left(positions, length)]
+        return list(positions)
+
+
+@dataclass(frozen=True)
+class RepositorySnapshot[U]:
+    """
+    Immutable, versioned state of a DataRepository.
+
+    A repository never changes what a published snapshot shows: refreshes build a new one and publish it with
+    a single assignment, so a reader holding a snapshot always sees complete, consistent data_json and indexes.
+    Appends add to the item list and indexes shared with the previous snapshot and publish a longer view of
+    them, in O(number of appended items).
+
+    Attributes:
+        version (int): Increases with every published snapshot.
+        base_version (int): Version of the last full load; snapshots created by appends keep it, and all
+            snapshots with the same base_version share their common prefix of items.
+        data (ListPrefix[U]): Validated and converted items.
+        index (RepositoryIndex[U]): Indexes over the shared item list; only the first `len(data)` items count.
+        loaded (bool): False until the source file was loaded for the first time.
+        source_state (FileState | None): State of the source file the data_json is up to date with.
+        append_offset (int | None): Where entries appended to the file later will start.
+        tail_sample (bytes): Bytes of the file right before `append_offset`, to detect rewrites.
+        skipped (int): Number of invalid entries of the source file left out of `data`.
+    """
+    version: int = 0
+    base_version: int = 0
+    data: ListPrefix[U] = field(default_factory=ListPrefix[U])
+    index: RepositoryIndex[U] = field(default_factory=RepositoryIndex[U])
+    loaded: bool = False
+    source_state: FileState | None = None
+    append_offset: int | None = None
+    tail_sample: bytes = b""
+    skipped: int = 0
+
+    def appended(self, items: list[U]) -> "RepositorySnapshot[U]":
+        """
+        Returns the next version with the items added to the data_json and indexes.
+
+        The indexes are extended in place when this is the latest snapshot of its load, as it is for appends made
+        by the repository, and rebuilt for the new list otherwise.
+        """
+        shared = self.data.is_latest() and self.index.size == len(self.data)
+        data = self.data.extended(items)
+        if shared:
+            index = self.index.build(items)
+        else:
+            index = RepositoryIndex[U](self.index.primary_key, self.index.secondary_keys).build(data)
+        return replace(self, version=self.version + 1, data=data, index=index)
+
+    def get_by_key(self, key: str) -> U | None:
+        """
+        Returns the item with the given primary key value, or None if there is none.
+        """
+        return self.key_lookup()(key)
+
+    def key_lookup(self) -> Callable[[str], U | None]:
+        """
+        Returns `get_by_key` as a function, for joins looking up many keys in the same snapshot.
+        """
+        items, length, primary, position = self.data.items, len(self.data), self.index.primary, self.index.position
+
+        def lookup(key: str) -> U | None:
+            found = primary.get(key)
+            if found is not None and found >= length:
+                found = position(key, length)
+            return None if found is None else items[found]
+        return lookup
+
+    def find_by(self, key: str, value: str) -> list[U]:
+        """
+        Returns all items whose secondary key attribute equals the given value, in repository order.
+        """
+        items = self.data.items
+        return [items[position] for position in self.index.positions(key, value, len(self.data))]
+
+
+@dataclass(frozen=True)
+class Versioned[V]:
+    """
+    A value derived from repository data_json, together with the data generations it was computed from.
+
+    Attributes:
+        generations (tuple[int, ...]): Generations of the source repositories, see `DataRepository.generation`.
+        value (V): The derived value.
+    """
+    generations: tuple[int, ...]
+    value: V
+
+
+@dataclass(frozen=True)
+class SentDayIndex:
+    """
+    Positions of the rows of an enriched delivery view, grouped by sent day, for date-window queries.
+
+    The index is extended in place as rows are appended to the view, and is shared with the views before them:
+    their windows leave out positions past their own length.
+
+    Attributes:
+        days (list[int]): Distinct sent day numbers, ascending.
+        positions (list[list[int]]): View positions of the rows sent on each of `days`, ascending.
+    """
+    days: list[int] = field(default_factory=list)
+    positions: list[list[int]] = field(default_factory=list)
+
+    @classmethod
+    def build(cls, rows: Sequence[EnrichedDelivery]) -> "SentDayIndex":
+        by_day: dict[int, list[int]] = defaultdict(list)
+        for position, row in enumerate(rows):
+            by_day[row.deliver.sent_day].append(position)
+        days = sorted(by_day)
+        return cls(days, [by_day[day] for day in days])
+
+    def extended(self, rows: Iterable[EnrichedDelivery], start: int) -> "SentDayIndex":
+        """
+        Adds rows appended to the view at positions `start` onwards, in O(1) per row for rows sent on an indexed
+        day or after every indexed day, the usual case.
+
+        Returns:
+            SentDayIndex: This index, or a copy of its day lists if a row was sent on a new day between two indexed
+            ones, so readers never see `days` and `positions` out of step.
+        """
+        index = self
+        for position, row in enumerate(rows, start):
+            day = row.deliver.sent_day
+            at = bisect_left(index.days, day)
+            if at < len(index.days) and index.days[at] == day:
+                index.positions[at].append(position)
+            elif at == len(index.days):
+                index.positions.append([position])
+                index.days.append(day)
+            else:
+                if index is self:
+                    index = SentDayIndex(list(self.days), list(self.positions))
+                index.days.insert(at, day)
+                index.positions.insert(at, [position])
+        return index
+
+    def window(self, since: int | None, until: int | None, length: int) -> list[int]:
+        """
+        Returns the view positions of rows sent between two day numbers, in view order.
+
+        Args:
+            since (int | None): First sent day included; unbounded if None.
+            until (int | None): Last sent day included; unbounded if None.
+            length (int): Length of the view; later positions are left out.
+
+        Returns:
+            list[int]: Positions of the days found with two binary searches, merged into view order, in
+            O(log d + k log w) for k positions on w of the d indexed days.
+        """
+        start = 0 if since is None else bisect_left(self.days, since)
+        stop = len(self.days) if until is None else bisect_right(self.days, until)
+        runs = self.positions[start:stop]
+        merged = heapq.merge(*runs) if len(runs) > 1 else iter(runs[0] if runs else ())
+        return list(takewhile(length.__gt__, merged))
+
+
 @dataclass
 class DataRepository[T, U]:
     """
@@ -18,54 +339,386 @@ class DataRepository[T, U]:
         validator (Validator[T]): Validator for raw data_json.
         converter (Converter[T, U]): Converter from raw data_json to model.
         filename (str | None): File path to read data_json from.
-        _data (list[U]): Cached list of validated and converted data_json.
+        streaming (bool): If True, entries are read one at a time with `FileReader.iter_read`
+            instead of loading the whole file first.
+        snapshot_cache (SnapshotCache | None): Optional on-disk cache of converted data_json; a fresh snapshot
+            lets `refresh_data` skip reading, validation and conversion.
+        workers (int): Number of processes validating entries; 1 (the default) validates in this process.
+        chunk_size (int): Number of entries sent to a worker process at a time.
+        lazy (bool): If True, the file is not loaded on construction but on first access to the data_json or
+            indexes, or by `warm`.
+        _snapshot (RepositorySnapshot[U]): Current published state.
+
+    The reader is picked by file extension, so pointing `filename` at an `.ndjson`/`.jsonl` file
+    uses `NdjsonFileReader` even if a JSON reader was configured.
+
+    Subclasses declare `primary_key` and `secondary_keys`; the matching indexes are rebuilt on every refresh
+    and queried with `get_by_key` and `find_by`.
+
+    `refresh_if_changed` compares the size, modification time and inode of the source file with the last load.
+    When records were only appended to the file, just the new tail is read and merged into the data_json and indexes.
+
+    A lazy repository defers the first load to the first `get_data`, `get_by_key` or `find_by` call, or to `warm`.
+
+    The repository is safe to share between threads. Readers work on immutable snapshots and never wait for writers;
+    loads, refreshes and appends are serialized, build a new snapshot off to the side and publish it atomically.
+    Concurrent refresh requests are coalesced into one refresh.
     """
+    primary_key: ClassVar[str | None] = None
+    secondary_keys: ClassVar[tuple[str, ...]] = ()
+
     file_reader: FileReader[T]
     validator: Validator[T]
     converter: Converter[T, U]
     filename: str | None = None
-    _data: list[U] = field(default_factory=list)
+    streaming: bool = False
+    snapshot_cache: SnapshotCache | None = None
+    workers: int = 1
+    chunk_size: int = 10_000
+    lazy: bool = False
+    _snapshot: RepositorySnapshot[U] = field(default_factory=RepositorySnapshot[U], init=False, repr=False)
+    _refresh: SingleFlight = field(default_factory=SingleFlight, init=False, repr=False, compare=False)
+    _listeners: list[Callable[[list[U]], None]] = field(default_factory=list, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """
-        Post-initialization to ensure filename is set and data_json is loaded.
+        Post-initialization to ensure filename is set and data_json is loaded, unless the repository is lazy.
         Raises:
-            ValueError: If filename is not provided.
+            ValueError: If filename is not provided, or workers or chunk_size is not positive.
         """
         if self.filename is None:
             raise ValueError("No filename set")
-        self.refresh_data(self.filename)
+        if self.workers < 1 or self.chunk_size < 1:
+            raise ValueError("workers and chunk_size must be positive")
+        if not self.lazy:
+            self.refresh_data(self.filename)
+
+    def warm(self) -> None:
+        """
+        Loads the data_json if it has not been loaded yet.
+
+        Safe to call from several threads: concurrent first accesses wait for a single load.
+        """
+        if self._snapshot.loaded:
+            return
+        with self._refresh.lock:
+            if not self._snapshot.loaded:
+                self.refresh_data(self.filename)
+
+    def is_loaded(self) -> bool:
+        return self._snapshot.loaded
+
+    def skipped_entries(self) -> int:
+        """
+        Returns the number of invalid entries of the source file left out of the data_json, loading a lazy
+        repository first.
+        """
+        return self.snapshot().skipped
+
+    def generation(self) -> int:
+        """
+        Returns the data_json generation, loading a lazy repository first: a counter that increases whenever the
+        data_json changes (load, reload or append) and never otherwise. Caches derived from the data_json stay
+        valid while it is the same.
+        """
+        return self.snapshot().version
+
+    def snapshot(self) -> RepositorySnapshot[U]:
+        """
+        Returns the current snapshot, loading the data_json first if the repository is lazy.
+
+        Returns:
+            RepositorySnapshot[U]: Immutable state; later refreshes and appends publish new snapshots.
+        """
+        self.warm()
+        return self._snapshot
 
-    def get_data(self) -> list[U]:
+    def get_data(self) -> Sequence[U]:
         """
-        Returns the cached list of data_json.
+        Returns the cached data_json, loading it first if the repository is lazy.
+
+        The sequence belongs to the current snapshot: it is not changed by later refreshes or appends,
+        which publish a new one instead.
 
         Returns:
-            list[U]: List of validated and converted data_json.
+            Sequence[U]: Validated and converted data_json.
         """
-        if not self._data:
+        data = self.snapshot().data
+        if not data:
             logging.warning("No data_json available")
-        return self._data
+        return data
+
+    def get_by_key(self, key: str) -> U | None:
+        """
+        Returns the item with the given primary key value.
+
+        Args:
+            key (str): Value of the repository's primary key.
+
+        Returns:
+            U | None: Matching item, or None if there is none.
+
+        Raises:
+            ValueError: If the repository has no primary key.
+        """
+        if self.primary_key is None:
+            raise ValueError(f"{type(self).__name__} has no primary key")
+        return self.snapshot().get_by_key(key)
+
+    def find_by(self, key: str, value: str) -> list[U]:
+        """
+        Returns all items whose secondary key attribute equals the given value.
+
+        Args:
+            key (str): Name of an indexed attribute, one of `secondary_keys`.
+            value (str): Value to look up.
+
+        Returns:
+            list[U]: Matching items in repository order.
 
-    def refresh_data(self, filename: str | None = None) -> list[U]:
+        Raises:
+            ValueError: If the attribute is not indexed.
+        """
+        if key not in self.secondary_keys:
+            raise ValueError(f"{type(self).__name__} has no index on {key}")
+        return self.snapshot().find_by(key, value)
+
+    def refresh_data(self, filename: str | None = None) -> Sequence[U]:
         """
         Refreshes the cached data_json from the given filename or from the existing filename.
 
+        The new data_json is loaded next to the current snapshot, which readers keep using until the new one
+        is published. Callers that request a reload of the same file while one is running wait for it and then
+        share a reload started after their request, instead of loading the file once each.
+
         Args:
             filename (str | None): Optional new filename to load data_json from.
 
         Returns:
-            list[U]: List of validated and converted data_json.
+            Sequence[U]: Validated and converted data_json.
         """
         if filename is None:
             logging.warning(f"No provided filename used default filename")
+        ticket = self._refresh.request()
+        with self._refresh.flight(ticket, force=filename not in (None, self.filename)) as needed:
+            if not needed:
+                logging.info(f"Reload of {self.filename} already done by a concurrent refresh")
+                return self._snapshot.data
+            if filename is not None:
+                self.filename = filename
+            logging.info(f"Refreshing {self.filename}")
+            filename = str(self.filename)
+            state = FileState.of(filename)
+            data, skipped = self._load_data(filename)
+            version = self._snapshot.version + 1
+            snapshot = RepositorySnapshot[U](
+                version=version,
+                base_version=version,
+                data=ListPrefix(data),
+                index=RepositoryIndex[U](self.primary_key, self.secondary_keys).build(data),
+                loaded=True,
+                skipped=skipped,
+            )
+            if state is not None and state == FileState.of(filename):
+                snapshot = self._with_source_state(snapshot, state)
+            else:
+                # The file changed while loading: keep the earlier state so the next check reloads it.
+                snapshot = replace(snapshot, source_state=state)
+            self._snapshot = snapshot
+            return data
+
+    def add(self, entry: T) -> U:
+        """
+        Validates, converts and appends a single raw entry to the source file and the data_json; see `add_many`.
+
+        Returns:
+            U: The converted item.
+        """
+        return self.add_many([entry])[0]
+
+    def add_many(self, entries: Iterable[T]) -> list[U]:
+        """
+        Validates and converts raw entries, appends them to the source file and adds them to the data_json,
+        indexes and subscribers. Concurrent calls append one after another.
+
+        The file is appended to in place (NDJSON lines, or elements before the closing bracket of a JSON array),
+        and indexes and subscribers receive only the new items, so the cost depends on the number of entries,
+        not on the size of the repository. Changes made to the file by others are picked up first.
+
+        Args:
+            entries (Iterable[T]): Raw entries to add, in order.
+
+        Returns:
+            list[U]: The converted items.
+
+        Raises:
+            ValueError: If any entry is invalid; nothing is written then.
+        """
+        entries = list(entries)
+        for entry in entries:
+            if not self.validator.validate(entry):
+                raise ValueError(f"Invalid entry: {entry}")
+        items = [self.converter.convert(entry) for entry in entries]
+        if not items:
+            return items
+
+        filename = str(self.filename)
+        with self._refresh.lock:
+            self.refresh_if_changed()
+            writer_for(filename).append(filename, entries)
+            self.extend(items)
+        return items
+
+    def extend(self, items: list[U]) -> None:
+        """
+        Adds items that were just appended to the source file to the cached data_json and indexes,
+        without re-reading the file.
+
+        A lazy repository that was not loaded yet ignores the items; they are read with the rest of the file.
+
+        Args:
+            items (list[U]): Validated and converted items, in the order they were written.
+        """
+        with self._refresh.lock:
+            snapshot = self._snapshot
+            if not snapshot.loaded:
+                return
+            snapshot = snapshot.appended(items)
+            state = FileState.of(str(self.filename))
+            if state is not None:
+                snapshot = self._with_source_state(snapshot, state)
+            self._publish_appended(snapshot, items)
+
+    def subscribe(self, listener: Callable[[list[U]], None]) -> None:
+        """
+        Registers a callback receiving the items appended to the data_json by `add_many`, `extend` or
+        `refresh_if_changed`, so dependent caches can be updated with the delta instead of rebuilt.
+        Callbacks run right after the new snapshot is published, while appends are still serialized.
+
+        Args:
+            listener (Callable[[list[U]], None]): Called with the new items, in order.
+        """
+        self._listeners.append(listener)
+
+    def refresh_if_changed(self) -> RefreshResult:
+        """
+        Brings the data_json up to date with the source file, doing as little work as possible.
+
+        The file is unchanged if its size, modification time and inode match the last load. A file that kept its
+        inode, grew, and still has the same bytes at the end of the previously read content is treated as
+        append-only: only the new tail is read, validated and converted. Anything else triggers a full reload.
+
+        A lazy repository that was not loaded yet has nothing to refresh and returns UNCHANGED.
+
+        Concurrent calls are serialized; a call that waited for another one finds the file unchanged.
+
+        Returns:
+            RefreshResult: UNCHANGED, APPENDED or RELOADED, depending on what was done.
+        """
+        if not self._snapshot.loaded:
+            return RefreshResult.UNCHANGED
+        filename = str(self.filename)
+        if FileState.of(filename) in (None, self._snapshot.source_state):
+            return RefreshResult.UNCHANGED
+
+        with self._refresh.lock:
+            snapshot = self._snapshot
+            state = FileState.of(filename)
+            if state is None or state == snapshot.source_state:
+                return RefreshResult.UNCHANGED
+
+            offset = snapshot.append_offset
+            if offset is not None and self._is_append(snapshot, state):
+                try:
+                    file_reader = reader_for(filename, self.file_reader)
+                    items, skipped = self._convert_entries(file_reader.read_appended(filename, offset, state.size))
+                except ValueError as e:
+                    logging.warning(f"Could not read appended entries of {filename}, reloading: {e}")
+                else:
+                    logging.info(f"Read {len(items)} appended entries from {filename}")
+                    appended = replace(snapshot.appended(items), skipped=snapshot.skipped + skipped)
+                    self._publish_appended(self._with_source_state(appended, state), items)
+                    return RefreshResult.APPENDED
+
+            self.refresh_data()
+            return RefreshResult.RELOADED
+
+    def source_version(self) -> FileState | None:
+        """
+        Returns the state of the source file the data_json is up to date with, or None if it could not be read.
+        """
+        return self._snapshot.source_state
+
+    def _publish_appended(self, snapshot: RepositorySnapshot[U], items: list[U]) -> None:
+        self._snapshot = snapshot
+        for listener in self._listeners:
+            listener(items)
+
+    def _with_source_state(self, snapshot: RepositorySnapshot[U], state: FileState) -> RepositorySnapshot[U]:
+        """
+        Returns the snapshot with the file state its data_json matches, and where entries appended later will start.
+        """
+        filename = str(self.filename)
+        file_reader = reader_for(filename, self.file_reader)
+        append_offset = None
+        if isinstance(file_reader, FileReader):
+            append_offset = file_reader.append_offset(filename, state.size)
+        tail_sample = b""
+        if append_offset is not None:
+            tail_sample = read_bytes(filename, max(0, append_offset - 64), append_offset)
+        return replace(snapshot, source_state=state, append_offset=append_offset, tail_sample=tail_sample)
+
+    def _is_append(self, snapshot: RepositorySnapshot[U], state: FileState) -> bool:
+        """
+        Checks whether the source file only grew since the snapshot was loaded, i.e. the data_json read so far
+        is still there.
+        """
+        previous = snapshot.source_state
+        if previous is None or snapshot.append_offset is None:
+            return False
+        if state.inode != previous.inode or state.size <= previous.size:
+            return False
+        start = max(0, snapshot.append_offset - len(snapshot.tail_sample))
+        return read_bytes(str(self.filename), start, snapshot.append_offset) == snapshot.tail_sample
+
+    def _load_data(self, filename: str) -> tuple[list[U], int]:
+        """
+        Loads data_json from the snapshot cache if it is fresh, otherwise processes the file and saves a new snapshot.
+
+        Files with invalid entries are not snapshotted, so the entries are reported again on every load.
+
+        Args:
+            filename (str): Path to the file with raw data_json.
+
+        Returns:
+            tuple[list[U], int]: List of validated and converted data_json, and the number of invalid entries skipped.
+        """
+        if self.snapshot_cache is None:
+            return self._process_data(filename)
+
+        namespace = self._snapshot_namespace()
+        key = SnapshotKey.from_file(filename)
+        cached: list[U] | None = self.snapshot_cache.load(filename, namespace, key)
+        if cached is not None:
+            return cached, 0
+
+        data, skipped = self._process_data(filename)
+        state = FileState.of(filename)
+        if skipped:
+            logging.info(f"{filename} has {skipped} invalid entries, snapshot not saved")
+        elif state is not None and (state.size, state.mtime_ns) == (key.size, key.mtime_ns):
+            self.snapshot_cache.save(filename, namespace, key, data)
         else:
-            self.filename = filename
-        logging.info(f"Refreshing {self.filename}")
-        self._data = self._process_data(str(self.filename))
-        return self._data
+            logging.warning(f"{filename} changed while loading, snapshot not saved")
+        return data, skipped
+
+    def _snapshot_namespace(self) -> str:
+        """
+        Identifies what the snapshots of this repository hold; snapshots saved under another namespace are ignored.
+        """
+        return f"{type(self).__name__}-{type(self.converter).__name__}"
 
-    def _process_data(self, filename: str) -> list[U]:
+    def _process_data(self, filename: str) -> tuple[list[U], int]:
         """
         Reads raw data_json from file, validates and converts entries.
 
@@ -73,46 +726,122 @@ class DataRepository[T, U]:
             filename (str): Path to the file with raw data_json.
 
         Returns:
-            list[U]: List of validated and converted data_json.
+            tuple[list[U], int]: List of validated and converted data_json, and the number of invalid entries skipped.
         """
         logging.info(f"Reading data_json from {filename}")
-        raw_data = self.file_reader.read(filename)
+        file_reader = reader_for(filename, self.file_reader)
+        raw_data = file_reader.iter_read(filename) if self.streaming else file_reader.read(filename)
+        return self._convert_entries(raw_data)
+
+    def _convert_entries(self, entries: Iterable[T]) -> tuple[list[U], int]:
+        """
+        Validates and converts raw entries, logging and skipping invalid ones.
+
+        With more than one worker and more than one chunk of entries, chunks are validated in a process pool.
+        Workers only report which entries are invalid; conversion stays in this process, so converted items are
+        not pickled back and strings interned by the converter are shared across chunks. Results are merged in
+        file order and invalid entries are logged in the same order as in-process.
+
+        Args:
+            entries (Iterable[T]): Raw entries in file order.
+
+        Returns:
+            tuple[list[U], int]: List of validated and converted data_json, and the number of invalid entries skipped.
+        """
+        if self.workers == 1:
+            return self._convert_in_process(entries)
+
+        chunks = batched(entries, self.chunk_size)
+        first = next(chunks, ())
+        second = next(chunks, None)
+        if second is None:
+            return self._convert_in_process(first)
+
+        valid_data: list[U] = []
+        skipped = 0
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=_PROCESS_CONTEXT) as executor:
+            # At most two chunks per worker are in flight, so a streamed file is never fully held in memory.
+            pending: deque[tuple[tuple[T, ...], Future[list[int]]]] = deque()
+            for chunk in chain((first, second), chunks):
+                pending.append((chunk, executor.submit(_invalid_positions, self.validator, chunk)))
+                if len(pending) >= 2 * self.workers:
+                    skipped += self._convert_chunk(valid_data, *pending.popleft())
+            while pending:
+                skipped += self._convert_chunk(valid_data, *pending.popleft())
+        return valid_data, skipped
+
+    def _convert_in_process(self, entries: Iterable[T]) -> tuple[list[U], int]:
         valid_data = []
-        for entry in raw_data:
+        skipped = 0
+        for entry in entries:
             if self.validator.validate(entry):
                 converted_entry = self.converter.convert(entry)
                 valid_data.append(converted_entry)
             else:
                 logging.error(f"Invalid entry: {entry}")
-        return valid_data
+                skipped += 1
+        return valid_data, skipped
+
+    def _convert_chunk(self, valid_data: list[U], chunk: tuple[T, ...], invalid: Future[list[int]]) -> int:
+        """
+        Converts the valid entries of a chunk validated by a worker and logs the invalid ones.
+
+        Returns:
+            int: Number of invalid entries in the chunk.
+        """
+        start = 0
+        positions = invalid.result()
+        for position in [*positions, len(chunk)]:
+            valid_data.extend(self.converter.convert(entry) for entry in chunk[start:position])
+            if position < len(chunk):
+                logging.error(f"Invalid entry: {chunk[position]}")
+            start = position + 1
+        return len(positions)
+
+
+def _invalid_positions[T](validator: Validator[T], entries: tuple[T, ...]) -> list[int]:
+    """
+    Validates a chunk of raw entries in a worker process; must stay a module-level function to be picklable.
+
+    Returns:
+        list[int]: Positions of the invalid entries, in ascending order.
+    """
+    return [position for position, entry in enumerate(entries) if not validator.validate(entry)]
 
 
 class UserDataRepository(DataRepository[UsersDataDict, User]):
     """
-    Repository for user data_json.
+    Repository for user data_json, keyed by email.
     """
-    pass
+    primary_key = "email"
 
 
 class LockerDataRepository(DataRepository[LockersDataDict, Locker]):
     """
-    Repository for locker data_json.
+    Repository for locker data_json, keyed by locker_id.
     """
-    pass
+    primary_key = "locker_id"
 
 
 class ParcelDataRepository(DataRepository[ParcelsDataDict, Parcel]):
     """
-    Repository for parcel data_json.
+    Repository for parcel data_json, keyed by parcel_id.
     """
-    pass
+    primary_key = "parcel_id"
+
+    @override
+    def _snapshot_namespace(self) -> str:
+        """
+        Includes the size rule table, since parcels are stored with the size it classified them as.
+        """
+        return f"{super()._snapshot_namespace()}-{parcel_size_rules.fingerprint()}"
 
 
 class DeliveryDataRepository(DataRepository[DeliversDataDict, Deliver]):
     """
-    Repository for delivery data_json.
+    Repository for delivery data_json, indexed by locker_id, sender_email and parcel_id.
     """
-    pass
+    secondary_keys = ("locker_id", "sender_email", "parcel_id")
 
 
 @dataclass
@@ -125,52 +854,248 @@ class ParcelSummaryRepository[U, L, P, D]:
         locker_repo (DataRepository[L, Locker]): Repository of lockers.
         parcel_repo (DataRepository[P, Parcel]): Repository of parcels.
         delivery_repo (DataRepository[D, Deliver]): Repository of deliveries.
-        _parcel_summary (dict[str, dict[str, int]]): Cached parcel summary.
+        _delivery_view (Versioned[ListPrefix[EnrichedDelivery]] | None): Cached enriched delivery view with the
+            generations of the repositories it was built from.
+        _sent_days (Versioned[SentDayIndex] | None): Sent-day index over the cached delivery view.
+        _parcel_summary (Versioned[dict[str, dict[str, int]]] | None): Published parcel summary with the
+            generations of the repositories it was built from; never changed once returned.
+        _parcel_counts (Versioned[dict[str, dict[str, int]]] | None): Summary with appended deliveries counted in,
+            published by the next `parcel` call; None while the published summary is the latest.
+
+    The delivery view joins every delivery with its parcel, locker, sender and receiver once, and the summary and
+    all reports read from it. Both are rebuilt only when the generation of one of the repositories moved since
+    they were built; appended deliveries are enriched and added to them instead, in O(number of deliveries added).
+    A published view never changes: appended rows go to the list it shares with the next, longer view. Neither does
+    a published summary: appended deliveries are counted into a copy that shares the entries of untouched parcels. Builds and delta updates are serialized, and concurrent rebuilds share one build.
+    Every build takes one snapshot per repository and derives both its data_json and its generations from them.
     """
     user_repo: DataRepository[U, User]
     locker_repo: DataRepository[L, Locker]
     parcel_repo: DataRepository[P, Parcel]
     delivery_repo: DataRepository[D, Deliver]
-    _parcel_summary: dict[str, dict[str, int]] = field(default_factory=dict, init=False)
+    _delivery_view: Versioned[ListPrefix[EnrichedDelivery]] | None = field(default=None, init=False, repr=False)
+    _sent_days: Versioned[SentDayIndex] | None = field(default=None, init=False, repr=False)
+    _parcel_summary: Versioned[dict[str, dict[str, int]]] | None = field(default=None, init=False)
+    _parcel_counts: Versioned[dict[str, dict[str, int]]] | None = field(default=None, init=False, repr=False)
+    _builds: SingleFlight = field(default_factory=SingleFlight, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """
+        Adds deliveries appended to the delivery repository to a built view and summary instead of rebuilding them.
+        """
+        self.delivery_repo.subscribe(self._add_delivers)
 
     def parcel(self, force_refresh: bool = False) -> dict[str, dict[str, int]]:
         """
-        Returns the parcel summary, optionally forcing a refresh.
+        Returns the parcel summary, building it only if the repository data_json changed since the last build.
+
+        The returned summary is never changed afterwards: deliveries appended later are counted into a new one,
+        returned by the next call without a rebuild.
 
         Args:
-            force_refresh (bool): If True, rebuilds the summary even if cached.
+            force_refresh (bool): If True, rebuilds the summary even if it is up to date; never needed for
+                correctness.
 
         Returns:
             dict[str, dict[str, int]]: Mapping of parcel IDs to locker IDs and counts.
         """
-        if force_refresh or not self._parcel_summary:
+        cached = self._parcel_summary
+        if not force_refresh and cached is not None and cached.generations == self.data_version():
+            return cached.value
+
+        ticket = self._builds.request()
+        for repo in self._repositories():
+            repo.warm()
+        with self._builds.flight(ticket) as needed:
+            generations = self.data_version()
+            cached = self._parcel_summary
+            # A concurrent build that failed leaves no current summary behind: build it here to surface the error.
+            if (force_refresh and needed) or cached is None or cached.generations != generations:
+                cached = self._publish_parcel(generations, force_refresh)
+            return cached.value
+
+    def _publish_parcel(
+            self,
+            generations: tuple[int, ...],
+            force_refresh: bool) -> Versioned[dict[str, dict[str, int]]]:
+        """
+        Publishes the summary with appended deliveries counted in if it is current, or builds a new one.
+        """
+        summary = self._parcel_counts
+        if force_refresh or summary is None or summary.generations != generations:
+            if force_refresh:
+                self._delivery_view = None
             logging.info("Building or refreshing parcel summary from repository")
-            self._parcel_summary = self._build_parcel()
-        return self._parcel_summary
+            view = self._view()
+            summary = Versioned(view.generations, self._build_parcel(view.value))
+        self._parcel_summary, self._parcel_counts = summary, None
+        return summary
 
-    def _build_parcel(self) -> dict[str, dict[str, int]]:
+    def invalidate(self) -> None:
         """
-        Builds the parcel summary by cross-referencing users, lockers, parcels, and deliveries.
+        Drops the cached delivery view, sent-day index and parcel summary, so the next call builds them again
+        from the repositories, e.g. to time a cold build.
+        """
+        with self._builds.lock:
+            self._delivery_view = self._sent_days = self._parcel_summary = self._parcel_counts = None
+
+    def delivery_view(self, since: date | None = None, until: date | None = None) -> Sequence[EnrichedDelivery]:
+        """
+        Returns the deliveries joined with their parcel, locker, sender and receiver, in delivery order.
+
+        The view is materialized once per data_json generation. Deliveries referencing a missing parcel, locker,
+        sender or receiver are left out (with a warning), so every report filters dangling references the same way.
+
+        A date window is answered from an index of view positions grouped by sent day, built once per generation
+        and extended on appends: two binary searches find the days in the window, whose positions are merged back
+        into delivery order.
+
+        Args:
+            since (date | None): Only deliveries sent on or after this date; unbounded if None.
+            until (date | None): Only deliveries sent on or before this date; unbounded if None.
+
+        Returns:
+            Sequence[EnrichedDelivery]: Enriched deliveries; the full view is never modified once returned.
+        """
+        view = self._view()
+        if since is None and until is None:
+            return view.value
+        positions = self._sent_day_index(view).window(
+            None if since is None else since.toordinal(),
+            None if until is None else until.toordinal(),
+            len(view.value),
+        )
+        return [view.value[position] for position in positions]
+
+    def _view(self) -> Versioned[ListPrefix[EnrichedDelivery]]:
+        cached = self._delivery_view
+        if cached is not None and cached.generations == self.data_version():
+            return cached
+
+        for repo in self._repositories():
+            repo.warm()
+        with self._builds.lock:
+            snapshots = self._snapshots()
+            generations = tuple(snapshot.version for snapshot in snapshots)
+            cached = self._delivery_view
+            if cached is None or cached.generations != generations:
+                cached = self._delivery_view = Versioned(
+                    generations, ListPrefix(self._enrich(snapshots[3].data, snapshots)))
+            return cached
+
+    def _sent_day_index(self, view: Versioned[ListPrefix[EnrichedDelivery]]) -> SentDayIndex:
+        """
+        Returns the sent-day index of a delivery view, building it if the cached one belongs to another view.
+        """
+        cached = self._sent_days
+        if cached is not None and cached.generations == view.generations:
+            return cached.value
+        with self._builds.lock:
+            cached = self._sent_days
+            if cached is None or cached.generations != view.generations:
+                cached = self._sent_days = Versioned(view.generations, SentDayIndex.build(view.value))
+            return cached.value
+
+    def refresh_if_changed(self) -> bool:
+        """
+        Brings every repository up to date with its source file; the summary follows on the next `parcel` call.
+
+        Returns:
+            bool: True if any repository appended or reloaded data_json.
+        """
+        results = [repo.refresh_if_changed() for repo in self._repositories()]
+        return any(result is not RefreshResult.UNCHANGED for result in results)
+
+    def data_version(self) -> tuple[int, ...]:
+        """
+        Returns the generations of the user, locker, parcel and delivery repositories; the tuple changes
+        whenever any of their data_json changes, so it keys caches derived from them.
+        """
+        return tuple(repo.generation() for repo in self._repositories())
+
+    def _repositories(self) -> tuple[DataRepository, ...]:
+        return self.user_repo, self.locker_repo, self.parcel_repo, self.delivery_repo
+
+    def _snapshots(self) -> tuple[RepositorySnapshot, ...]:
+        """
+        Takes one snapshot of the user, locker, parcel and delivery repositories, so data_json read from them
+        matches their generations even if a repository publishes a new snapshot meanwhile.
+        """
+        return tuple(repo.snapshot() for repo in self._repositories())
+
+    def _build_parcel(self, view: Iterable[EnrichedDelivery]) -> dict[str, dict[str, int]]:
+        """
+        Builds the parcel summary from an enriched delivery view.
 
         Returns:
             dict[str, dict[str, int]]: Mapping of parcel IDs to locker IDs and counts.
         """
         parcel_summary: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._count_delivers(parcel_summary, view)
+        return parcel_summary
 
-        users = {user.email: user for user in self.user_repo.get_data()}
-        lockers = {locker.locker_id: locker for locker in self.locker_repo.get_data()}
-        parcels = {parcel.parcel_id: parcel for parcel in self.parcel_repo.get_data()}
-        delivers = self.delivery_repo.get_data()
+    @staticmethod
+    def _count_delivers(parcel_summary: dict[str, dict[str, int]], rows: Iterable[EnrichedDelivery]) -> None:
+        for row in rows:
+            parcel_summary.setdefault(row.deliver.parcel_id, defaultdict(int))[row.deliver.locker_id] += 1
 
+    def _enrich(self, delivers: Iterable[Deliver], snapshots: tuple[RepositorySnapshot, ...]) -> list[EnrichedDelivery]:
+        """
+        Joins deliveries with their parcel, locker, sender and receiver from the given repository snapshots
+        (see `_snapshots`), leaving out deliveries with a dangling reference.
+        """
+        users, lockers, parcels = (snapshot.key_lookup() for snapshot in snapshots[:3])
+
+        rows: list[EnrichedDelivery] = []
         for deliver in delivers:
-            parcel = parcels.get(deliver.parcel_id)
-            locker = lockers.get(deliver.locker_id)
-            sender = users.get(deliver.sender_email)
-            receiver = users.get(deliver.receiver_email)
+            parcel = parcels(deliver.parcel_id)
+            locker = lockers(deliver.locker_id)
+            sender = users(deliver.sender_email)
+            receiver = users(deliver.receiver_email)
 
             if parcel and locker and sender and receiver:
-                parcel_summary[parcel.parcel_id][locker.locker_id] += 1
+                rows.append(EnrichedDelivery(
+                    deliver=deliver,
+                    size=parcel.size,
+                    locker_city=locker.city,
+                    sender_city=sender.city,
+                    receiver_city=receiver.city,
+                    days=deliver.expected_day - deliver.sent_day,
+                ))
             else:
                 logging.warning(f"Parcel {deliver.parcel_id} not available")
+        return rows
 
-        return parcel_summary
+    def _add_delivers(self, delivers: list[Deliver]) -> None:
+        """
+        Adds appended deliveries to the built view and summary: the view is extended into the list it shares with
+        the next view, in O(number of deliveries). The deliveries are counted into copies of the entries of their
+        parcels, in a copy of the published summary made by the first append after it was published.
+
+        A delta is applied only if the view or summary is current up to this very append; otherwise it is left to
+        be rebuilt on next use.
+        """
+        with self._builds.lock:
+            view, summary = self._delivery_view, self._parcel_counts or self._parcel_summary
+            if view is None and summary is None:
+                return
+            snapshots = self._snapshots()
+            generations = tuple(snapshot.version for snapshot in snapshots)
+            previous = (*generations[:3], generations[3] - 1)
+            view_current = view is not None and view.generations == previous
+            summary_current = summary is not None and summary.generations == previous
+            if not (view_current or summary_current):
+                return
+            rows = self._enrich(delivers, snapshots)
+
+            if view is not None and view_current:
+                self._delivery_view = Versioned(generations, view.value.extended(rows))
+                sent_days = self._sent_days
+                if sent_days is not None and sent_days.generations == previous:
+                    self._sent_days = Versioned(generations, sent_days.value.extended(rows, len(view.value)))
+            if summary is not None and summary_current:
+                counts = summary.value if summary is self._parcel_counts else summary.value.copy()
+                for parcel_id in {row.deliver.parcel_id for row in rows}:
+                    counts[parcel_id] = defaultdict(int, counts.get(parcel_id, {}))
+                self._count_delivers(counts, rows)
+                self._parcel_counts = Versioned(generations, counts)
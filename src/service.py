@@ -1,8 +1,10 @@
 from src.repository import ParcelSummaryRepository
-from src.model import Parcel, CompartmentsLarge
+from src.model import CompartmentsLarge, EnrichedDelivery, Locker
+from dataclasses import dataclass, field
 from collections import defaultdict
-from dataclasses import dataclass
-from datetime import datetime
+from typing import Callable, Iterable
+from datetime import date
+import threading
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -11,33 +13,102 @@ logging.basicConfig(level=logging.INFO)
 SendAndReceivedType = dict[str, defaultdict[CompartmentsLarge, dict[str, int]]]
 NestedDefaultDict = defaultdict[str, defaultdict[str, int]]
 ResultsDict = dict[str, dict[str, str | int]]
+LockerLimitsDict = defaultdict[str, dict[CompartmentsLarge, int]]
 
-@dataclass(eq=True, frozen=False)
-class ParcelReportService:
+@dataclass(frozen=True)
+class ParcelReports:
     """
-    Service providing reports and statistics related to parcels, lockers, and deliveries.
+    Results of all parcel reports computed together by `ParcelReportService.compute_all`.
+
+    Each attribute has the same structure as the return value of the service method of the same name.
     """
+    most_common_parcel_sizes_per_locker: dict[str, list[str]]
+    city_most_shipments_by_size: ResultsDict
+    max_days_between_sent_and_expected: dict[str, int]
+    is_parcel_limit_in_locker_exceeded: LockerLimitsDict
 
-    repository: ParcelSummaryRepository
 
-    def most_common_parcel_sizes_per_locker(self) -> dict[str, list[str]]:
+@dataclass
+class ReportState:
+    """
+    Running aggregates behind every parcel report, updated as enriched deliveries are added.
+
+    Adding a delivery costs O(1) and every report is answered in O(number of groups) (lockers, sizes, cities or
+    senders), however many deliveries were added. Groups keep the order in which deliveries first reached them,
+    so ties are broken exactly as by a full scan.
+
+    Attributes:
+        sizes (NestedDefaultDict): Number of deliveries per locker and parcel size.
+        counts (SendAndReceivedType): Number of deliveries per "sent"/"received", parcel size and city.
+        days_per_sender (defaultdict[str, int]): Longest delivery duration in days per sender.
+        limits (LockerLimitsDict): Remaining compartments per locker and size; negative when exceeded.
+        rows (int): Number of deliveries added.
+        generations (tuple[int, ...]): Repository generations the state was brought up to date with.
+        base_version (int): Base version of the delivery snapshot the state was built from.
+    """
+    sizes: NestedDefaultDict = field(default_factory=lambda: defaultdict(lambda: defaultdict(int)))
+    counts: SendAndReceivedType = field(default_factory=lambda: {
+        "sent": defaultdict(lambda: defaultdict(int)),
+        "received": defaultdict(lambda: defaultdict(int)),
+    })
+    days_per_sender: defaultdict[str, int] = field(default_factory=lambda: defaultdict(int))
+    limits: LockerLimitsDict = field(default_factory=lambda: defaultdict(dict))
+    rows: int = 0
+    generations: tuple[int, ...] = field(default=(), compare=False)
+    base_version: int = field(default=-1, compare=False)
+
+    @classmethod
+    def build(cls, lockers: Iterable[Locker], rows: Iterable[EnrichedDelivery]) -> "ReportState":
         """
-        Returns the most common parcel sizes per locker.
+        Builds the state from scratch.
 
-        Aggregates the parcel sizes for each locker and returns a dictionary
-        where the key is the locker ID and the value is a list of the most common parcel size(s).
+        Args:
+            lockers (Iterable[Locker]): Lockers whose compartments are counted down.
+            rows (Iterable[EnrichedDelivery]): Enriched deliveries, in delivery order.
+
+        Returns:
+            ReportState: Aggregates of all the deliveries.
+        """
+        state = cls()
+        for locker in lockers:
+            state.limits[locker.locker_id] = dict(locker.compartments)
+        state.add(rows)
+        return state
+
+    def add(self, rows: Iterable[EnrichedDelivery]) -> None:
+        """
+        Counts enriched deliveries into the aggregates.
         """
-        result: NestedDefaultDict = defaultdict(lambda: defaultdict(int))
-        parcels: dict[str, Parcel] = {p.parcel_id: p for p in self.repository.parcel_repo.get_data()}
+        for row in rows:
+            deliver = row.deliver
+            self.sizes[deliver.locker_id][row.size.value] += 1
+            self.counts["sent"][row.size][row.sender_city] += 1
+            self.counts["received"][row.size][row.receiver_city] += 1
+            self.days_per_sender[deliver.sender_email] = max(self.days_per_sender[deliver.sender_email], row.days)
+            self._take_compartment(deliver.locker_id, row.size)
+            self.rows += 1
 
-        for deliver in self.repository.delivery_repo.get_data():
-            parcel = parcels[deliver.parcel_id]
-            size = Parcel.get_size(parcel.height, parcel.length)
-            result[deliver.locker_id][size.value] += 1
+    def is_consistent(self, lockers: Iterable[Locker], rows: Iterable[EnrichedDelivery]) -> bool:
+        """
+        Checks the aggregates against a full recomputation from the given data_json.
+        """
+        return self == ReportState.build(lockers, rows)
+
+    def reports(self) -> ParcelReports:
+        """
+        Returns all reports; they are copies, unaffected by later additions.
+        """
+        return ParcelReports(
+            most_common_parcel_sizes_per_locker=self.most_common_sizes(),
+            city_most_shipments_by_size=self.most_common_cities(),
+            max_days_between_sent_and_expected=self.longest_senders(),
+            is_parcel_limit_in_locker_exceeded=self.remaining_compartments(),
+        )
 
+    def most_common_sizes(self) -> dict[str, list[str]]:
         most_common = {}
 
-        for locker_id, size_counts in result.items():
+        for locker_id, size_counts in self.sizes.items():
             if size_counts:
                 max_count = max(size_counts.values())
                 common_size = [size for size, count in size_counts.items() if count == max_count]
@@ -45,79 +116,194 @@ class ParcelReportService:
 
         return most_common
 
-    def city_most_shipments_by_size(self) -> dict[str, dict[str, str | int]]:
-        """
-        Returns cities with the most shipments by parcel size, split by sent and received.
-
-        Returns a dictionary with keys 'sent' and 'received', each mapping parcel sizes to the city
-        with the highest shipment count.
-        """
-        users = {u.email: u for u in self.repository.user_repo.get_data()}
-        parcels = {p.parcel_id: p for p in self.repository.parcel_repo.get_data()}
-
-        counts: SendAndReceivedType = {
-            "sent": defaultdict(lambda: defaultdict(int)),
-            "received": defaultdict(lambda: defaultdict(int)),
-        }
-
-        for deliver in self.repository.delivery_repo.get_data():
-            parcel = parcels.get(deliver.parcel_id)
-            sender = users.get(deliver.sender_email)
-            receiver = users.get(deliver.receiver_email)
-            if parcel and sender and receiver:
-                size = Parcel.get_size(parcel.height, parcel.length)
-                counts["sent"][size][sender.city] += 1
-                counts["received"][size][receiver.city] += 1
-
+    def most_common_cities(self) -> ResultsDict:
         result: ResultsDict = {
             "sent": {},
             "received": {},
         }
 
         for sent_received in ["sent", "received"]:
-            for size, cities in counts[sent_received].items():
+            for size, cities in self.counts[sent_received].items():
                 most_common_cities = max(cities.items(), key=lambda x: x[1])[0]
                 result[sent_received][size.value] = most_common_cities
 
         return result
 
-    def max_days_between_sent_and_expected(self) -> dict[str, int]:
+    def longest_senders(self) -> dict[str, int]:
+        max_delivery = max(self.days_per_sender.values(), default=0)
+        counts = {sender: days for sender, days in self.days_per_sender.items() if max_delivery == days}
+        return counts
+
+    def remaining_compartments(self) -> LockerLimitsDict:
+        return defaultdict(dict, {locker_id: dict(limits) for locker_id, limits in self.limits.items()})
+
+    def _take_compartment(self, locker_id: str, size: CompartmentsLarge) -> None:
+        self.limits[locker_id][size] = self.limits[locker_id].get(size, 0) - 1
+        if self.limits[locker_id][size] < 0:
+            logging.warning(f'No places available {locker_id} for {size}')
+
+
+@dataclass(eq=True, frozen=False)
+class ParcelReportService:
+    """
+    Service providing reports and statistics related to parcels, lockers, and deliveries.
+
+    Every report reads the repository's enriched delivery view, so deliveries referencing a missing parcel, locker,
+    sender or receiver are left out of all reports alike.
+
+    Every report takes optional `since`/`until` dates and then only covers deliveries sent in that window
+    (both inclusive); the window is looked up in the repository's sent-date index and aggregated on the fly.
+
+    Unwindowed reports are answered from a `ReportState` kept between calls: deliveries appended to the repository are
+    counted into it, and it is rebuilt only when deliveries are reloaded or another repository changes. The results
+    of `compute_all` are kept with the repository generations they were computed from and reused by the individual
+    report methods until one moves.
+    """
+
+    repository: ParcelSummaryRepository
+    _reports: ParcelReports | None = field(default=None, init=False, repr=False, compare=False)
+    _reports_generations: tuple[int, ...] = field(default=(), init=False, repr=False, compare=False)
+    _state: ReportState | None = field(default=None, init=False, repr=False, compare=False)
+    _state_lock: threading.RLock = field(default_factory=threading.RLock, init=False, repr=False, compare=False)
+
+    def compute_all(self, since: date | None = None, until: date | None = None) -> ParcelReports:
         """
-        Calculates the maximum number of days between the sent date and expected delivery date per sender.
+        Computes all reports from the up-to-date report state.
 
-        Returns a dictionary mapping sender email addresses to the maximum delivery duration (in days).
+        Args:
+            since (date | None): Only deliveries sent on or after this date; unbounded if None.
+            until (date | None): Only deliveries sent on or before this date; unbounded if None.
+
+        Returns:
+            ParcelReports: Results of the four report methods.
         """
-        result: defaultdict[str, int] = defaultdict(int)
+        if since is not None or until is not None:
+            return self._window_state(since, until).reports()
+        with self._state_lock:
+            state = self.report_state()
+            self._reports = state.reports()
+            self._reports_generations = state.generations
+            return self._reports
 
-        for deliver in self.repository.delivery_repo.get_data():
-            sent_date = datetime.strptime(deliver.sent_date ,"%Y-%m-%d")
-            expected_date = datetime.strptime(deliver.expected_delivery_date ,"%Y-%m-%d")
-            days = (expected_date - sent_date).days
-            result[deliver.sender_email] = max(result[deliver.sender_email], days)
+    def most_common_parcel_sizes_per_locker(
+            self, since: date | None = None, until: date | None = None) -> dict[str, list[str]]:
+        """
+        Returns the most common parcel sizes per locker.
 
-        max_delivery = max(result.values(), default=0)
-        counts = {sender: days for sender, days in result.items() if max_delivery == days}
-        return counts
+        Aggregates the parcel sizes for each locker and returns a dictionary
+        where the key is the locker ID and the value is a list of the most common parcel size(s).
+
+        Args:
+            since (date | None): Only deliveries sent on or after this date; unbounded if None.
+            until (date | None): Only deliveries sent on or before this date; unbounded if None.
+        """
+        if reports := self._fresh_reports(since, until):
+            return reports.most_common_parcel_sizes_per_locker
+        return self._from_state(ReportState.most_common_sizes, since, until)
+
+    def city_most_shipments_by_size(
+            self, since: date | None = None, until: date | None = None) -> dict[str, dict[str, str | int]]:
+        """
+        Returns cities with the most shipments by parcel size, split by sent and received.
+
+        Returns a dictionary with keys 'sent' and 'received', each mapping parcel sizes to the city
+        with the highest shipment count.
+
+        Args:
+            since (date | None): Only deliveries sent on or after this date; unbounded if None.
+            until (date | None): Only deliveries sent on or before this date; unbounded if None.
+        """
+        if reports := self._fresh_reports(since, until):
+            return reports.city_most_shipments_by_size
+        return self._from_state(ReportState.most_common_cities, since, until)
 
-    def is_parcel_limit_in_locker_exceeded(self) -> dict[str, dict[CompartmentsLarge, int]]:
+    def max_days_between_sent_and_expected(
+            self, since: date | None = None, until: date | None = None) -> dict[str, int]:
+        """
+        Calculates the maximum number of days between the sent date and expected delivery date per sender.
+
+        Returns a dictionary mapping sender email addresses to the maximum delivery duration (in days).
+
+        Args:
+            since (date | None): Only deliveries sent on or after this date; unbounded if None.
+            until (date | None): Only deliveries sent on or before this date; unbounded if None.
+        """
+        if reports := self._fresh_reports(since, until):
+            return reports.max_days_between_sent_and_expected
+        return self._from_state(ReportState.longest_senders, since, until)
+
+    def is_parcel_limit_in_locker_exceeded(
+            self, since: date | None = None, until: date | None = None) -> dict[str, dict[CompartmentsLarge, int]]:
         """
         Checks if any parcel locker compartment has exceeded its parcel limit.
 
         Returns a dictionary mapping locker IDs to dictionaries of compartment sizes and their remaining capacity.
         Logs a warning if any compartment capacity goes below zero.
+
+        Args:
+            since (date | None): Only deliveries sent on or after this date; unbounded if None.
+            until (date | None): Only deliveries sent on or before this date; unbounded if None.
         """
-        result: defaultdict[str, dict[CompartmentsLarge, int]] = defaultdict(dict)
-        parcels = {p.parcel_id: p for p in self.repository.parcel_repo.get_data()}
+        if reports := self._fresh_reports(since, until):
+            return reports.is_parcel_limit_in_locker_exceeded
+        return self._from_state(ReportState.remaining_compartments, since, until)
 
-        for locker in self.repository.locker_repo.get_data():
-            result[locker.locker_id] = dict(locker.compartments)
+    def report_state(self, rebuild: bool = False) -> ReportState:
+        """
+        Brings the report state up to date with the repository and returns it.
 
-        for deliver in self.repository.delivery_repo.get_data():
-            parcel = parcels[deliver.parcel_id]
-            size = Parcel.get_size(parcel.height, parcel.length)
-            result[deliver.locker_id][size] -= 1
-            if result[deliver.locker_id][size] < 0:
-                logging.warning(f'No places available {deliver.locker_id} for {size}')
+        Nothing is done if no repository generation moved since the last call. Deliveries appended since then
+        are counted into the state; any other change rebuilds it from the delivery view.
 
-        return result
+        Args:
+            rebuild (bool): If True, rebuilds the state even if it could be updated incrementally.
 
+        Returns:
+            ReportState: The live state; it keeps changing with later calls, use `reports` for a copy.
+        """
+        with self._state_lock:
+            generations = self.repository.data_version()
+            state = self._state
+            if not rebuild and state is not None and state.generations == generations:
+                return state
+            base_version = self.repository.delivery_repo.snapshot().base_version
+            view = self.repository.delivery_view()
+            if rebuild or state is None or state.generations[:3] != generations[:3] or (
+                    state.base_version != base_version or state.rows > len(view)):
+                state = ReportState.build(self.repository.locker_repo.get_data(), view)
+            else:
+                state.add(view[state.rows:])
+            state.generations, state.base_version = generations, base_version
+            self._state = state
+            return state
+
+    def is_report_state_consistent(self) -> bool:
+        """
+        Checks the up-to-date report state against a full recomputation from the repository.
+        """
+        with self._state_lock:
+            state = self.report_state()
+            return state.is_consistent(self.repository.locker_repo.get_data(), self.repository.delivery_view())
+
+    def _from_state[R](self, answer: Callable[[ReportState], R], since: date | None, until: date | None) -> R:
+        if since is not None or until is not None:
+            return answer(self._window_state(since, until))
+        with self._state_lock:
+            return answer(self.report_state())
+
+    def _window_state(self, since: date | None, until: date | None) -> ReportState:
+        """
+        Aggregates only the deliveries sent in a date window, in O(log n + k) for k deliveries in the window
+        plus the lockers.
+        """
+        return ReportState.build(self.repository.locker_repo.get_data(), self.repository.delivery_view(since, until))
+
+    def _fresh_reports(self, since: date | None = None, until: date | None = None) -> ParcelReports | None:
+        """
+        Returns the results of the last unwindowed `compute_all` if no repository generation moved since.
+        """
+        if since is not None or until is not None:
+            return None
+        if self._reports is None or self._reports_generations != self.repository.data_version():
+            return None
+        return self._reports
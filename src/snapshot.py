@@ -0,0 +1,119 @@
+from dataclasses import dataclass
+from typing import Any
+import tempfile
+import hashlib
+import logging
+import pickle
+import os
+
+logging.basicConfig(level=logging.INFO)
+
+SNAPSHOT_FORMAT = 4
+
+
+@dataclass(frozen=True)
+class SnapshotKey:
+    """
+    Identifies the exact content of a source file a snapshot was built from.
+
+    Attributes:
+        size (int): File size in bytes.
+        mtime_ns (int): Last modification time in nanoseconds.
+        digest (str): BLAKE2b hash of the file content.
+    """
+    size: int
+    mtime_ns: int
+    digest: str
+
+    @classmethod
+    def from_file(cls, file_name: str, block_size: int = 1024 * 1024) -> "SnapshotKey":
+        """
+        Builds a key from the file's metadata and content hash.
+
+        Args:
+            file_name (str): Path to the source file.
+            block_size (int): Number of bytes hashed at once.
+
+        Returns:
+            SnapshotKey: Key of the current file content.
+        """
+        stat = os.stat(file_name)
+        digest = hashlib.blake2b(digest_size=16)
+        with open(file_name, "rb") as file:
+            while block := file.read(block_size):
+                digest.update(block)
+        return cls(size=stat.st_size, mtime_ns=stat.st_mtime_ns, digest=digest.hexdigest())
+
+
+@dataclass
+class SnapshotCache:
+    """
+    On-disk cache of already validated and converted repository data_json.
+
+    Every snapshot is a pickle file holding a small header (format, namespace and SnapshotKey of the
+    source file) followed by the converted records, so a stale snapshot is rejected without decoding
+    the records. Snapshots are trusted input: point `directory` only at storage owned by the application.
+
+    Attributes:
+        directory (str): Directory where snapshot files are stored, created on first save.
+    """
+    directory: str
+
+    def load(self, source: str, namespace: str, key: SnapshotKey) -> list[Any] | None:
+        """
+        Loads the snapshot of a source file if it matches the given key.
+
+        Args:
+            source (str): Path to the source file.
+            namespace (str): Identifies the repository type, so different repositories never share snapshots.
+            key (SnapshotKey): Key of the current source file content.
+
+        Returns:
+            list[Any] | None: Cached records, or None if there is no fresh snapshot.
+        """
+        path = self._path(source, namespace)
+        try:
+            with open(path, "rb") as file:
+                header = pickle.load(file)
+                if header != self._header(namespace, key):
+                    logging.info(f"Snapshot {path} is stale")
+                    return None
+                data: list[Any] = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            logging.warning(f"Snapshot {path} could not be loaded: {e}")
+            return None
+        logging.info(f"Loaded {len(data)} records from snapshot {path}")
+        return data
+
+    def save(self, source: str, namespace: str, key: SnapshotKey, data: list[Any]) -> None:
+        """
+        Atomically writes a snapshot of the converted records of a source file.
+
+        Args:
+            source (str): Path to the source file.
+            namespace (str): Identifies the repository type.
+            key (SnapshotKey): Key of the source file content the records were built from.
+            data (list[Any]): Validated and converted records.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(source, namespace)
+        file = tempfile.NamedTemporaryFile("wb", dir=self.directory, delete=False)
+        try:
+            with file:
+                pickle.dump(self._header(namespace, key), file, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(file.name, path)
+        except BaseException:
+            os.unlink(file.name)
+            raise
+        logging.info(f"Saved {len(data)} records to snapshot {path}")
+
+    def _path(self, source: str, namespace: str) -> str:
+        source_id = hashlib.blake2b(os.path.abspath(source).encode(), digest_size=8).hexdigest()
+        return os.path.join(self.directory, f"{namespace}-{source_id}.snapshot")
+
+    @staticmethod
+    def _header(namespace: str, key: SnapshotKey) -> tuple[int, str, SnapshotKey]:
+        return SNAPSHOT_FORMAT, namespace, key
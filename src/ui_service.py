@@ -1,13 +1,13 @@
-from src.file_service import DeliverReaderJson, DeliverWriterJson
+from src.file_service import DeliverReaderJson, DeliverWriterJson, DeliverWriterNdjson, FileReader, is_ndjson
+from src.repository import DataRepository, DeliveryDataRepository
+from src.converter import DeliverConverter
 from src.validator import DeliversDataDictValidator
 from src.model import DeliversDataDict, Deliver
 from src.report_service import ReportService
 from dataclasses import dataclass, field
-from datetime import datetime, date
-from collections import defaultdict
+from datetime import date
 import streamlit as st
 from typing import cast
-import json
 
 
 @dataclass
@@ -23,13 +23,20 @@ class UiService:
     Attributes:
         report_service (ReportService): Service object providing parcel report data and methods.
         validator (DeliversDataDictValidator): Validator to verify the structure and correctness of delivery data.
+        deliveries_file (str): Path to the deliveries file, either a JSON array or NDJSON.
+        delivery_repo (DataRepository[DeliversDataDict, Deliver] | None): Repository of deliveries backing
+            parcel tracking; loaded from the tracked file on first use if not provided.
 
     Methods:
         _send(file_path: str) -> DeliversDataDict | None:
             Presents input fields for parcel delivery details and saves validated data to a JSON file.
 
         _find(file_path: str) -> None:
-            Allows searching for a parcel by its ID and displays delivery status.
+            Allows searching for a parcel by its ID using the delivery repository's parcel_id index
+            and displays delivery status.
+
+        _sent_window() -> tuple[date | None, date | None]:
+            Presents a date-range picker limiting reports to deliveries sent in that range.
 
         show_ui() -> None:
             Displays the main Streamlit UI with a sidebar menu to choose between sending orders,
@@ -38,13 +45,17 @@ class UiService:
 
     report_service: ReportService
     validator: DeliversDataDictValidator = field(default_factory=DeliversDataDictValidator)
+    deliveries_file: str = "data_json/delivers.json"
+    delivery_repo: DataRepository[DeliversDataDict, Deliver] | None = None
 
     def _send_parcel(self, file_path: str) -> DeliversDataDict | None:
         """
         Presents a form in Streamlit for entering new shipping details and saves the data to a JSON file.
 
         The form collects shipment number, locker number, sender and receiver emails, send date, and expected delivery date.
-        It validates the input data, appends the new delivery to existing records, and writes back to the JSON file.
+        It validates the input data and appends the new delivery to existing records in place, without rewriting
+        the file. If the delivery repository is backed by the same file, the delivery is added through it, so its
+        indexes and the parcel summary are updated with just the new delivery.
         Displays success or error messages based on the operation result.
 
         Args:
@@ -88,13 +99,13 @@ class UiService:
                 st.error("Data did not pass validation. Please check dates and email address.")
                 return None
 
-            reader = DeliverReaderJson()
-            existing_data = reader.read(file_path)
-            existing_data.append(cast(Deliver, new_delivery))
-
             try:
-                writer = DeliverWriterJson()
-                writer.write(file_path, existing_data)
+                if self.delivery_repo is not None and self.delivery_repo.filename == file_path:
+                    self.delivery_repo.add(new_delivery)
+                elif is_ndjson(file_path):
+                    DeliverWriterNdjson().append(file_path, [cast(Deliver, new_delivery)])
+                else:
+                    DeliverWriterJson().append(file_path, [cast(Deliver, new_delivery)])
                 st.success("Your package has been shipped")
                 st.json(new_delivery)
                 return new_delivery
@@ -109,8 +120,9 @@ class UiService:
             Allows the user to search for a parcel by ID from a JSON file and displays delivery status using Streamlit.
 
             This function:
-            - Loads parcel data from the given JSON file.
-            - Validates the data structure of each parcel using DeliversDataDictValidator.
+            - Looks up deliveries in the tracking repository's parcel_id index, which is validated once at load
+              and kept up to date with appended deliveries, so the file is not re-read on every search.
+            - Shows an error instead if any record of the file did not pass validation.
             - Prompts the user to input a parcel ID via a Streamlit text input.
             - Displays appropriate messages based on whether the parcel is found, its expected delivery date,
               and whether it is ready for pickup or still out for delivery.
@@ -122,34 +134,66 @@ class UiService:
                 None
             """
 
-        with open(file_path, "r", encoding="utf8") as file:
-            data = json.load(file)
-
-        if not all(self.validator.validate(parcel) for parcel in data) :
+        repository = self._tracking_repository(file_path)
+        if repository.skipped_entries():
             st.error("Invalid data structure in JSON file.")
             return
 
         st.subheader("Find Parcel 🔍")
         page = st.text_input("Enter the number ID")
-        result = defaultdict(list)
+        result: list[Deliver] = []
         if page:
-            for parcel in data:
-                if parcel["parcel_id"] == page:
-                    result[parcel["parcel_id"]].append(parcel)
+            result = repository.find_by("parcel_id", page)
 
             if not result:
                 st.write("Not found parcel")
 
+        for parcel in result:
+            if parcel.expected_day < date.today().toordinal():
+                if st.button("Parcel is ready for pickup. You can collect your parcel now"):
+                    st.success(f"Parcel number {parcel.parcel_id} has been picked up")
+            else:
+                st.write(f"Parcel number {parcel.parcel_id} out for delivery, estimated delivery time"
+                         f"  {parcel.expected_delivery_date}")
 
-        for key, value  in result.items():
-            for parcel in value:
-                expected_delivery = datetime.strptime(parcel["expected_delivery_date"], "%Y-%m-%d").date()
-                if expected_delivery < date.today():
-                    if st.button("Parcel is ready for pickup. You can collect your parcel now"):
-                        st.success(f"Parcel number {parcel["parcel_id"]} has been picked up")
-                else:
-                    st.write(f"Parcel number {parcel["parcel_id"]} out for delivery, estimated delivery time"
-                             f"  {parcel["expected_delivery_date"]}")
+    def _tracking_repository(self, file_path: str) -> DataRepository[DeliversDataDict, Deliver]:
+        """
+        Returns the delivery repository used for tracking, indexed by parcel_id.
+
+        The repository is loaded and validated once and kept on the service; later calls only reload it
+        if the file changed on disk.
+
+        Args:
+            file_path (str): Path to the deliveries file.
+
+        Returns:
+            DataRepository[DeliversDataDict, Deliver]: Repository of valid deliveries from the file.
+        """
+        if self.delivery_repo is None or self.delivery_repo.filename != file_path:
+            self.delivery_repo = DeliveryDataRepository(
+                file_reader=cast(FileReader[DeliversDataDict], DeliverReaderJson()),
+                validator=self.validator,
+                converter=DeliverConverter(),
+                filename=file_path,
+                streaming=True,
+            )
+        else:
+            self.delivery_repo.refresh_if_changed()
+        return self.delivery_repo
+
+    def _sent_window(self) -> tuple[date | None, date | None]:
+        """
+        Presents a date-range picker for the sent date of the reported deliveries.
+
+        Returns:
+            tuple[date | None, date | None]: First and last sent date included; None for an open end, so an
+            empty range reports all deliveries and a single picked date reports deliveries sent from then on.
+        """
+        picked = st.date_input("Sent between", value=[], format="YYYY-MM-DD")
+        window = tuple(picked) if isinstance(picked, (tuple, list)) else ()
+        since = window[0] if window else None
+        until = window[1] if len(window) > 1 else None
+        return since, until
 
     def show_ui(self) -> None:
         """
@@ -161,7 +205,7 @@ class UiService:
         - Viewing various parcel reports
 
         Based on user selection, calls the corresponding private methods to handle input, display data,
-        or show reports as interactive Streamlit tables.
+        or show reports as interactive Streamlit tables, limited to the sent-date range picked above them.
 
         Returns:
             None
@@ -172,20 +216,21 @@ class UiService:
 
         match page:
             case "Send Order":
-                self._send_parcel("data_json/delivers.json")
+                self._send_parcel(self.deliveries_file)
             case "Track your shipment":
-                self._find_parcel("data_json/delivers.json")
+                self._find_parcel(self.deliveries_file)
             case "Report":
                 st.subheader("Reports")
+                since, until = self._sent_window()
                 if st.button("📊 Most Common Parcel Sizes per Locker"):
-                    df = self.report_service.report_most_common_parcel_sizes_per_locker()
+                    df = self.report_service.report_most_common_parcel_sizes_per_locker(since, until)
                     st.dataframe(df)
                 if st.button('📊 City Most Shipments by Size'):
-                    df = self.report_service.report_city_most_shipments_by_size()
+                    df = self.report_service.report_city_most_shipments_by_size(since, until)
                     st.dataframe(df)
                 if st.button("📊 Max days between sent and expected date"):
-                    df = self.report_service.report_max_days_between_sent_and_expected()
+                    df = self.report_service.report_max_days_between_sent_and_expected(since, until)
                     st.dataframe(df)
                 if st.button("📊 is parcel limit in locker exceeded"):
-                    df = self.report_service.report_is_parcel_limit_in_locker_exceeded()
+                    df = self.report_service.report_is_parcel_limit_in_locker_exceeded(since, until)
                     st.dataframe(df)
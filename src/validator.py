@@ -3,12 +3,120 @@ from email_validator import validate_email, EmailNotValidError
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 from typing import override, cast
-from datetime import datetime
+from collections import OrderedDict
+from src.dates import day_number
+import threading
 import logging
+import os
 
 logging.basicConfig(level=logging.INFO)
 
 
+@dataclass(frozen=True)
+class EmailCacheInfo:
+    """
+    Statistics of an EmailValidationCache.
+    """
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+@dataclass
+class EmailValidationCache:
+    """
+    Bounded, thread-safe LRU cache of email validation results.
+
+    The same addresses repeat across many users and deliveries, so the result of
+    `email_validator.validate_email` is remembered per address. Invalid results keep their error message,
+    which is logged again on every hit.
+
+    Attributes:
+        maxsize (int): Maximum number of cached addresses; the least recently used one is evicted first.
+        enabled (bool): If False, every address is validated without touching the cache.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that had to call `validate_email`.
+    """
+    maxsize: int = 500_000
+    enabled: bool = True
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _results: OrderedDict[str, str | None] = field(default_factory=OrderedDict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def validate(self, email: str) -> str | None:
+        """
+        Validates an email address, using the cached result when available.
+
+        Args:
+            email: The email address to validate.
+
+        Returns:
+            None if the email is valid; otherwise, the validation error message.
+        """
+        if not self.enabled or self.maxsize <= 0:
+            return self._validate(email)
+
+        with self._lock:
+            if email in self._results:
+                self._results.move_to_end(email)
+                self.hits += 1
+                return self._results[email]
+            self.misses += 1
+
+        error = self._validate(email)
+
+        with self._lock:
+            self._results[email] = error
+            self._results.move_to_end(email)
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+        return error
+
+    def configure(self, maxsize: int | None = None, enabled: bool | None = None) -> None:
+        """
+        Changes the cache size or turns the cache on and off, clearing cached results.
+
+        Args:
+            maxsize: New maximum number of cached addresses.
+            enabled: Whether the cache should be used.
+        """
+        with self._lock:
+            if maxsize is not None:
+                self.maxsize = maxsize
+            if enabled is not None:
+                self.enabled = enabled
+        self.clear()
+
+    def clear(self) -> None:
+        """
+        Removes all cached results and resets the hit/miss counters.
+        """
+        with self._lock:
+            self._results.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> EmailCacheInfo:
+        """
+        Returns the current cache statistics.
+        """
+        with self._lock:
+            return EmailCacheInfo(self.hits, self.misses, self.maxsize, len(self._results))
+
+    @staticmethod
+    def _validate(email: str) -> str | None:
+        try:
+            validate_email(email)
+            return None
+        except EmailNotValidError as e:
+            return str(e)
+
+
+email_validation_cache = EmailValidationCache(maxsize=int(os.environ.get("EMAIL_CACHE_SIZE", 500_000)))
+
+
 class Validator[T](ABC):
     """
     Abstract base class for data_json validation.
@@ -49,18 +157,20 @@ class Validator[T](ABC):
         """
                 Validates the format of an email address using the `email_validator` library.
 
+                Results are memoized in the shared `email_validation_cache`, so every validator
+                checks a repeated address only once.
+
                 Args:
                     email: The email address to validate.
 
                 Returns:
                     True if the email is valid; otherwise, False.
                 """
-        try:
-            validate_email(email)
-            return True
-        except EmailNotValidError as e:
-            logging.error(str(e))
+        error = email_validation_cache.validate(email)
+        if error is not None:
+            logging.error(error)
             return False
+        return True
 
     @staticmethod
     def is_positive(data: int | str) -> bool:
@@ -177,10 +287,7 @@ class DeliversDataDictValidator(Validator[DeliversDataDict]):
             logging.warning('Email cannot be the same as sender address')
             return False
 
-        sent_date = datetime.strptime(data['sent_date'], "%Y-%m-%d")
-        expected_delivery_date = datetime.strptime(data['expected_delivery_date'], "%Y-%m-%d")
-
-        if sent_date >= expected_delivery_date:
+        if day_number(data['sent_date']) >= day_number(data['expected_delivery_date']):
             logging.warning('Delivery date cannot be earlier than expected delivery date')
             return False
 
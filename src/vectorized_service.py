@@ -0,0 +1,259 @@
+from src.service import ParcelReportService, ParcelReports, ResultsDict, LockerLimitsDict
+from src.columnar import DeliveryColumns, DictionaryEncoding
+from src.model import CompartmentsLarge, EnrichedDelivery, ParcelSizeRules
+from dataclasses import dataclass, field
+from collections import defaultdict
+from typing import Callable, override
+from datetime import date
+from array import array
+import numpy as np
+import logging
+
+logging.basicConfig(level=logging.INFO)
+
+SIZES = tuple(CompartmentsLarge)
+
+
+@dataclass
+class ReportArrays:
+    """
+    The enriched delivery view in columnar form.
+
+    Attributes:
+        columns (DeliveryColumns): Encoded deliveries.
+        parcel_sizes (array): Index into `SIZES` of the parcel size of every delivery.
+        sender_cities (array): City code of the sender of every delivery.
+        receiver_cities (array): City code of the receiver of every delivery.
+        cities (DictionaryEncoding): Dictionary of user cities.
+        generations (tuple[int, ...]): Repository generations the arrays were brought up to date with.
+        base_version (int): Base version of the delivery snapshot the columns were encoded from.
+    """
+    columns: DeliveryColumns = field(default_factory=DeliveryColumns)
+    parcel_sizes: array = field(default_factory=lambda: array("b"))
+    sender_cities: array = field(default_factory=lambda: array("i"))
+    receiver_cities: array = field(default_factory=lambda: array("i"))
+    cities: DictionaryEncoding = field(default_factory=DictionaryEncoding)
+    generations: tuple[int, ...] = ()
+    base_version: int = -1
+
+    def append(self, row: EnrichedDelivery) -> None:
+        self.columns.append(row.deliver)
+        self.parcel_sizes.append(SIZES.index(row.size))
+        self.sender_cities.append(self.cities.encode(row.sender_city))
+        self.receiver_cities.append(self.cities.encode(row.receiver_city))
+
+    def sizes(self) -> np.ndarray:
+        """
+        Returns the size index of every delivery.
+        """
+        return np.frombuffer(self.parcel_sizes, dtype=np.int8) if self.parcel_sizes else np.empty(0, dtype=np.int8)
+
+    def cities_of(self, column: str) -> np.ndarray:
+        """
+        Returns the city code of the sender or receiver of every delivery.
+        """
+        cities = self.sender_cities if column == "sender" else self.receiver_cities
+        return np.frombuffer(cities, dtype=np.int32) if cities else np.empty(0, dtype=np.int32)
+
+
+@dataclass(eq=True, frozen=False)
+class VectorizedParcelReportService(ParcelReportService):
+    """
+    ParcelReportService computing every report with NumPy group-bys over a columnar copy of the enriched
+    delivery view.
+
+    Produces the same results, in the same order, as `ParcelReportService`. The only difference is logging:
+    an over-full compartment is reported once per report instead of once per delivery.
+
+    The columnar copy is kept between calls and extended in place when deliveries are appended to the
+    repository, so repeated reports only encode new deliveries. It is only extended and read under the state
+    lock: an append must neither race another one nor resize arrays a NumPy view is reading. Reports for a
+    `since`/`until` window encode just the deliveries found in it with the repository's sent-date index,
+    into arrays of their own.
+    """
+    _arrays: ReportArrays | None = field(default=None, init=False, repr=False, compare=False)
+
+    @override
+    def compute_all(self, since: date | None = None, until: date | None = None) -> ParcelReports:
+        """
+        Computes all reports from one up-to-date columnar snapshot of the repositories.
+
+        Args:
+            since (date | None): Only deliveries sent on or after this date; unbounded if None.
+            until (date | None): Only deliveries sent on or before this date; unbounded if None.
+
+        Returns:
+            ParcelReports: Results of the four report methods.
+        """
+        if since is not None or until is not None:
+            return self._vectorized_reports(self._window_arrays(since, until))
+        with self._state_lock:
+            arrays = self._report_arrays()
+            self._reports, self._reports_generations = self._vectorized_reports(arrays), arrays.generations
+            return self._reports
+
+    @override
+    def most_common_parcel_sizes_per_locker(
+            self, since: date | None = None, until: date | None = None) -> dict[str, list[str]]:
+        if reports := self._fresh_reports(since, until):
+            return reports.most_common_parcel_sizes_per_locker
+        return self._from_arrays(self._vectorized_sizes, since, until)
+
+    @override
+    def city_most_shipments_by_size(
+            self, since: date | None = None, until: date | None = None) -> dict[str, dict[str, str | int]]:
+        if reports := self._fresh_reports(since, until):
+            return reports.city_most_shipments_by_size
+        return self._from_arrays(self._vectorized_cities, since, until)
+
+    @override
+    def max_days_between_sent_and_expected(
+            self, since: date | None = None, until: date | None = None) -> dict[str, int]:
+        if reports := self._fresh_reports(since, until):
+            return reports.max_days_between_sent_and_expected
+        return self._from_arrays(self._vectorized_days, since, until)
+
+    @override
+    def is_parcel_limit_in_locker_exceeded(
+            self, since: date | None = None, until: date | None = None) -> dict[str, dict[CompartmentsLarge, int]]:
+        if reports := self._fresh_reports(since, until):
+            return reports.is_parcel_limit_in_locker_exceeded
+        return self._from_arrays(self._vectorized_limits, since, until)
+
+    def _from_arrays[R](self, answer: Callable[[ReportArrays], R], since: date | None, until: date | None) -> R:
+        if since is not None or until is not None:
+            return answer(self._window_arrays(since, until))
+        with self._state_lock:
+            return answer(self._report_arrays())
+
+    def _window_arrays(self, since: date | None, until: date | None) -> ReportArrays:
+        """
+        Encodes the deliveries sent in a date window into new arrays.
+        """
+        window = ReportArrays()
+        for row in self.repository.delivery_view(since, until):
+            window.append(row)
+        return window
+
+    def _report_arrays(self) -> ReportArrays:
+        """
+        Brings the columnar copy up to date with the enriched delivery view; must be called under the state lock.
+
+        Nothing is done if no repository generation moved since the last call. Deliveries appended since then
+        (a later snapshot of the same load) are encoded incrementally; any other change starts over, since it
+        may change how earlier deliveries resolve.
+        """
+        generations = self.repository.data_version()
+        arrays = self._arrays
+        if arrays is not None and arrays.generations == generations:
+            return arrays
+        base_version = self.repository.delivery_repo.snapshot().base_version
+        view = self.repository.delivery_view()
+        if arrays is None or arrays.generations[:3] != generations[:3] or arrays.base_version != base_version or (
+                len(arrays.columns) > len(view)):
+            arrays = ReportArrays()
+
+        for row in view[len(arrays.columns):]:
+            arrays.append(row)
+
+        arrays.generations = generations
+        arrays.base_version = base_version
+        self._arrays = arrays
+        return arrays
+
+    def _vectorized_reports(self, arrays: ReportArrays) -> ParcelReports:
+        return ParcelReports(
+            most_common_parcel_sizes_per_locker=self._vectorized_sizes(arrays),
+            city_most_shipments_by_size=self._vectorized_cities(arrays),
+            max_days_between_sent_and_expected=self._vectorized_days(arrays),
+            is_parcel_limit_in_locker_exceeded=self._vectorized_limits(arrays),
+        )
+
+    @staticmethod
+    def _vectorized_sizes(arrays: ReportArrays) -> dict[str, list[str]]:
+        lockers = arrays.columns.lockers
+        keys = arrays.columns.numpy_column("locker").astype(np.int64) * len(SIZES) + arrays.sizes()
+        counts = np.bincount(keys, minlength=len(lockers) * len(SIZES)).reshape(len(lockers), len(SIZES))
+        best = counts.max(axis=1)
+
+        result: dict[str, list[str]] = {locker_id: [] for locker_id in lockers.values}
+        for key in _in_order_of_appearance(keys):
+            locker, size = divmod(int(key), len(SIZES))
+            if counts[locker, size] == best[locker]:
+                result[lockers.decode(locker)].append(SIZES[size].value)
+        return result
+
+    @staticmethod
+    def _vectorized_cities(arrays: ReportArrays) -> ResultsDict:
+        sizes = arrays.sizes().astype(np.int64)
+        cities = max(len(arrays.cities), 1)
+
+        result: ResultsDict = {"sent": {}, "received": {}}
+        for sent_received in ("sent", "received"):
+            keys = sizes * cities + arrays.cities_of("sender" if sent_received == "sent" else "receiver")
+            counts = np.bincount(keys, minlength=len(SIZES) * cities)
+            best: dict[int, int] = {}
+            for key in _in_order_of_appearance(keys):
+                size = int(key) // cities
+                if size not in best or counts[key] > counts[best[size]]:
+                    best[size] = int(key)
+            for size, key in best.items():
+                result[sent_received][SIZES[size].value] = arrays.cities.decode(key % cities)
+        return result
+
+    @staticmethod
+    def _vectorized_days(arrays: ReportArrays) -> dict[str, int]:
+        senders = arrays.columns.numpy_column("sender")
+        days = arrays.columns.numpy_column("expected_day") - arrays.columns.numpy_column("sent_day")
+        longest = np.zeros(len(arrays.columns.users), dtype=np.int64)
+        np.maximum.at(longest, senders, days)
+
+        order = _in_order_of_appearance(senders)
+        max_delivery = int(longest[order].max()) if order.size else 0
+        return {arrays.columns.users.decode(int(sender)): max_delivery
+                for sender in order if longest[sender] == max_delivery}
+
+    def _vectorized_limits(self, arrays: ReportArrays) -> LockerLimitsDict:
+        result: LockerLimitsDict = defaultdict(dict)
+        for locker in self.repository.locker_repo.get_data():
+            result[locker.locker_id] = dict(locker.compartments)
+
+        lockers = arrays.columns.lockers
+        keys = arrays.columns.numpy_column("locker").astype(np.int64) * len(SIZES) + arrays.sizes()
+        counts = np.bincount(keys, minlength=len(lockers) * len(SIZES))
+        for key in _in_order_of_appearance(keys):
+            code, size = divmod(int(key), len(SIZES))
+            locker_id, compartment = lockers.decode(code), SIZES[size]
+            result[locker_id][compartment] = result[locker_id].get(compartment, 0) - int(counts[key])
+            if result[locker_id][compartment] < 0:
+                logging.warning(f'No places available {locker_id} for {compartment}')
+        return result
+
+
+REPORT_BACKENDS: dict[str, type[ParcelReportService]] = {
+    "python": ParcelReportService,
+    "numpy": VectorizedParcelReportService,
+}
+
+
+def classify_array(rules: ParcelSizeRules, heights: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """
+    Vectorized `ParcelSizeRules.classify` for arrays of dimensions.
+
+    Returns:
+        np.ndarray: int8 index into `SIZES` for every parcel.
+    """
+    heights, lengths = np.asarray(heights), np.asarray(lengths)
+    result = np.full(np.broadcast(heights, lengths).shape, SIZES.index(rules.fallback), dtype=np.int8)
+    for rule in reversed(rules.rules):
+        result[(heights <= rule.max_height) & (lengths <= rule.max_length)] = SIZES.index(rule.size)
+    return result
+
+
+def _in_order_of_appearance(keys: np.ndarray) -> np.ndarray:
+    """
+    Returns the distinct keys ordered by their first occurrence.
+    """
+    unique, first = np.unique(keys, return_index=True)
+    return unique[np.argsort(first, kind="stable")]
+
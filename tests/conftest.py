@@ -11,13 +11,30 @@ from src.model import (
     ParcelsDataDict,
     DeliversDataDict
 )
+from src.repository import DataRepository
 from src.report_service import ReportService
+from typing import Any, Callable
 from src.ui_service import UiService
 from src.validator import DeliversDataDictValidator
 
 
 def fake_user() -> MagicMock:
-    return MagicMock(spec=User)
+    # User-like object without a `name` attribute; slotted User exposes every field on the class itself.
+    return MagicMock(spec=[field for field in User.__slots__ if field != "name"])
+
+InMemoryRepositoryFactory = Callable[[type[DataRepository], list[Any]], DataRepository]
+
+@pytest.fixture
+def in_memory_repository() -> InMemoryRepositoryFactory:
+    def build(repository_type: type[DataRepository], data: list[Any]) -> DataRepository:
+        file_reader = MagicMock()
+        file_reader.read.return_value = list(data)
+        validator = MagicMock()
+        validator.validate.return_value = True
+        converter = MagicMock()
+        converter.convert.side_effect = lambda entry: entry
+        return repository_type(file_reader=file_reader, validator=validator, converter=converter, filename="memory.json")
+    return build
 
 @pytest.fixture
 def mock_service() -> MagicMock:
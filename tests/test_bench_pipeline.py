@@ -0,0 +1,31 @@
+from benchmarks.bench_pipeline import StageResult, compare, save_results, load_results
+import os
+
+
+def test_compare_reports_only_regressions_beyond_thresholds() -> None:
+    baseline = [
+        StageResult("read:delivers", 1_000, 1_000, 0.100, 10.0),
+        StageResult("convert:DeliverConverter", 1_000, 1_000, 0.001, 1.0),
+        StageResult("join:_build_parcel", 1_000, 1_000, 0.050, 5.0),
+    ]
+    results = [
+        StageResult("read:delivers", 1_000, 1_000, 0.200, 10.0),
+        StageResult("convert:DeliverConverter", 1_000, 1_000, 0.002, 1.0),
+        StageResult("join:_build_parcel", 1_000, 1_000, 0.050, 20.0),
+        StageResult("join:_build_parcel", 10_000, 10_000, 1.000, 50.0),
+    ]
+
+    regressions = compare(results, baseline, time_threshold=0.25, memory_threshold=0.25, min_seconds=0.005)
+
+    assert len(regressions) == 2
+    assert regressions[0].startswith("read:delivers@1000: 0.2000 s")
+    assert regressions[1].startswith("join:_build_parcel@1000: 20.0 MiB")
+
+
+def test_results_round_trip(tmpdir) -> None:
+    file_name = os.path.join(tmpdir, "results.json")
+    results = [StageResult("read:users", 1_000, 50, 0.01, 0.5)]
+
+    save_results(file_name, results)
+
+    assert load_results(file_name) == results
@@ -0,0 +1,74 @@
+from src.bootstrap import load_in_parallel, load_repositories, RepositoryLoadError
+from src.dataset_generator import DatasetConfig, DatasetGenerator
+from src.repository import DataRepository, ParcelSummaryRepository
+from unittest.mock import MagicMock
+import threading
+import pytest
+import os
+
+
+def test_load_repositories_builds_summary(tmp_path) -> None:
+    DatasetGenerator(DatasetConfig(deliveries=100, users=10, lockers=3)).write(str(tmp_path))
+
+    repository = load_repositories(str(tmp_path))
+
+    assert isinstance(repository, ParcelSummaryRepository)
+    assert len(repository.user_repo.get_data()) == 10
+    assert len(repository.locker_repo.get_data()) == 3
+    assert len(repository.parcel_repo.get_data()) == 100
+    assert len(repository.delivery_repo.get_data()) == 100
+    assert len(repository.parcel()) == 100
+
+
+def test_load_repositories_uses_deliveries_file(tmp_path) -> None:
+    DatasetGenerator(DatasetConfig(deliveries=20, users=5, lockers=2)).write(str(tmp_path))
+    os.rename(tmp_path / "delivers.json", tmp_path / "other.json")
+
+    repository = load_repositories(str(tmp_path), deliveries_file=str(tmp_path / "other.json"))
+
+    assert len(repository.delivery_repo.get_data()) == 20
+
+
+def test_load_in_parallel_runs_factories_concurrently() -> None:
+    barrier = threading.Barrier(3, timeout=5)
+
+    def factory() -> DataRepository:
+        barrier.wait()
+        return MagicMock(spec=DataRepository)
+
+    repositories, timings = load_in_parallel({"a": factory, "b": factory, "c": factory})
+
+    assert set(repositories) == {"a", "b", "c"}
+    assert set(timings) == {"a", "b", "c"}
+    assert all(seconds >= 0 for seconds in timings.values())
+
+
+def test_load_in_parallel_reports_failed_repository() -> None:
+    def broken() -> DataRepository:
+        raise FileNotFoundError("parcels.json")
+
+    with pytest.raises(RepositoryLoadError, match="parcels") as error:
+        load_in_parallel({"users": lambda: MagicMock(spec=DataRepository), "parcels": broken})
+
+    assert error.value.name == "parcels"
+    assert isinstance(error.value.__cause__, FileNotFoundError)
+
+
+def test_load_repositories_fails_cleanly_on_missing_file(tmp_path) -> None:
+    DatasetGenerator(DatasetConfig(deliveries=20, users=5, lockers=2)).write(str(tmp_path))
+    os.remove(tmp_path / "lockers.json")
+
+    with pytest.raises(RepositoryLoadError) as error:
+        load_repositories(str(tmp_path))
+
+    assert error.value.name == "lockers"
+
+
+def test_load_repositories_lazy_defers_loading(tmp_path) -> None:
+    DatasetGenerator(DatasetConfig(deliveries=20, users=5, lockers=2)).write(str(tmp_path))
+
+    repository = load_repositories(str(tmp_path), lazy=True)
+
+    assert not any(repo.is_loaded() for repo in repository._repositories())
+    assert len(repository.parcel()) == 20
+    assert all(repo.is_loaded() for repo in repository._repositories())
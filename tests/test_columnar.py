@@ -0,0 +1,55 @@
+from src.columnar import DeliveryColumns, DictionaryEncoding
+from src.repository import DeliveryDataRepository
+from src.model import Deliver
+from tests.conftest import InMemoryRepositoryFactory
+import numpy as np
+import pytest
+
+
+def test_dictionary_encoding_assigns_codes_in_order() -> None:
+    encoding = DictionaryEncoding()
+
+    assert [encoding.encode(value) for value in ("L002", "L001", "L002")] == [0, 1, 0]
+    assert encoding.decode(1) == "L001"
+    assert len(encoding) == 2
+
+
+def test_columns_from_repository(
+        in_memory_repository: InMemoryRepositoryFactory,
+        deliver_1: Deliver,
+        deliver_2: Deliver,
+        deliver_3: Deliver) -> None:
+    repository = in_memory_repository(DeliveryDataRepository, [deliver_1, deliver_2, deliver_3])
+
+    columns = DeliveryColumns.from_repository(repository)
+
+    assert len(columns) == 3
+    assert list(columns) == [deliver_1, deliver_2, deliver_3]
+    assert columns[1] == deliver_2
+    assert columns.numpy_column("locker").tolist() == [0, 1, 1]
+    assert columns.numpy_column("sender").tolist() == [0, 1, 2]
+    assert columns.numpy_column("receiver").tolist() == [1, 0, 3]
+    assert (columns.numpy_column("expected_day") - columns.numpy_column("sent_day")).tolist() == [4, 4, 4]
+
+
+def test_numpy_column_is_a_read_only_int32_view(deliver_1: Deliver) -> None:
+    columns = DeliveryColumns.from_delivers([deliver_1])
+
+    view = columns.numpy_column("sent_day")
+
+    assert view.dtype == np.int32
+    assert not view.flags.writeable
+    assert np.shares_memory(view, np.frombuffer(columns.columns["sent_day"], dtype=np.int32))
+    with pytest.raises(BufferError):
+        columns.append(deliver_1)
+    del view
+    columns.append(deliver_1)
+    assert len(columns) == 2
+
+
+def test_empty_columns() -> None:
+    columns = DeliveryColumns()
+
+    assert len(columns) == 0
+    assert list(columns) == []
+    assert columns.numpy_column("parcel").size == 0
@@ -0,0 +1,16 @@
+from src.concurrency import SingleFlight
+
+
+def test_single_flight_skips_refresh_started_after_ticket() -> None:
+    flight = SingleFlight()
+    ticket = flight.request()
+
+    with flight.flight(flight.request()) as needed:
+        assert needed
+    with flight.flight(ticket) as needed:
+        assert not needed
+    with flight.flight(ticket, force=True) as needed:
+        assert needed
+    with flight.flight(flight.request()) as needed:
+        assert needed
+    assert flight.started == 3
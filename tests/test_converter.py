@@ -1,6 +1,8 @@
 from src.converter import UserConverter, LockerConverter, ParcelConverter, DeliverConverter
+from src.model import Deliver, DeliversDataDict
 from pytest import FixtureRequest
 import pytest
+import json
 
 
 
@@ -44,4 +46,18 @@ def test_converter_delivery_from_dict(deliver_data_fixture: str, expected_delive
     deliver_data = request.getfixturevalue(deliver_data_fixture)
     converter = DeliverConverter()
     result = converter.convert(deliver_data)
-    assert result == deliver
\ No newline at end of file
+    assert result == deliver
+
+def test_converter_delivery_interns_repeated_strings(deliver_1_data: DeliversDataDict) -> None:
+    converter = DeliverConverter()
+    first = converter.convert(json.loads(json.dumps(deliver_1_data)))
+    second = converter.convert(json.loads(json.dumps(deliver_1_data)))
+
+    assert first == second
+    assert first.sender_email is second.sender_email
+    assert first.locker_id is second.locker_id
+    assert first.sent_date is second.sent_date
+
+def test_models_have_no_instance_dict(deliver_1: Deliver) -> None:
+    assert not hasattr(deliver_1, "__dict__")
+    assert deliver_1.to_dict()["parcel_id"] == deliver_1.parcel_id
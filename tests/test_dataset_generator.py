@@ -0,0 +1,82 @@
+from src.dataset_generator import DatasetConfig, DatasetGenerator
+from src.validator import (
+    UserDataDictValidator,
+    LockerDataDictValidator,
+    ParcelDataDictValidator,
+    DeliversDataDictValidator,
+)
+from src.file_service import FileReader, NdjsonFileReader
+from collections import Counter
+import pytest
+import os
+
+
+def test_generator_is_deterministic() -> None:
+    config = DatasetConfig(deliveries=200, users=20, lockers=5, seed=7, invalid_fraction=0.1)
+
+    assert list(DatasetGenerator(config).deliveries()) == list(DatasetGenerator(config).deliveries())
+    assert list(DatasetGenerator(config).users()) != list(DatasetGenerator(
+        DatasetConfig(deliveries=200, users=20, lockers=5, seed=8, invalid_fraction=0.1)).users())
+
+
+def test_generated_dataset_is_valid_and_consistent() -> None:
+    generator = DatasetGenerator(DatasetConfig(deliveries=300, users=30, lockers=4))
+
+    users = list(generator.users())
+    lockers = list(generator.lockers())
+    parcels = list(generator.parcels())
+    delivers = list(generator.deliveries())
+
+    assert all(UserDataDictValidator().validate(user) for user in users)
+    assert all(LockerDataDictValidator().validate(locker) for locker in lockers)
+    assert all(ParcelDataDictValidator().validate(parcel) for parcel in parcels)
+    assert all(DeliversDataDictValidator().validate(deliver) for deliver in delivers)
+
+    emails = {user["email"] for user in users}
+    assert len(emails) == 30
+    assert {deliver["locker_id"] for deliver in delivers} <= {locker["locker_id"] for locker in lockers}
+    assert [deliver["parcel_id"] for deliver in delivers] == [parcel["parcel_id"] for parcel in parcels]
+    assert all(deliver["sender_email"] in emails and deliver["receiver_email"] in emails for deliver in delivers)
+
+
+def test_generator_skews_lockers_and_senders() -> None:
+    generator = DatasetGenerator(DatasetConfig(deliveries=2_000, users=100, lockers=10, locker_skew=3.0))
+
+    delivers = list(generator.deliveries())
+    lockers = Counter(deliver["locker_id"] for deliver in delivers)
+    senders = Counter(deliver["sender_email"] for deliver in delivers)
+
+    assert lockers.most_common(1)[0][0] == DatasetGenerator.locker_id(0)
+    assert lockers.most_common(1)[0][1] > 2_000 / 10 * 2
+    assert senders.most_common(1)[0][1] > 2_000 / 100 * 5
+
+
+def test_generator_mixes_in_invalid_records() -> None:
+    generator = DatasetGenerator(DatasetConfig(deliveries=1_000, users=50, lockers=5, invalid_fraction=0.2))
+    validator = DeliversDataDictValidator()
+
+    delivers = list(generator.deliveries())
+    invalid = [deliver for deliver in delivers if not validator.validate(deliver)]
+
+    assert len(delivers) == 1_000 + len(invalid)
+    assert 100 < len(invalid) < 300
+    assert all(deliver["parcel_id"].endswith("-INVALID") for deliver in invalid)
+
+
+@pytest.mark.parametrize("extension, reader", [(".json", FileReader()), (".ndjson", NdjsonFileReader())])
+def test_generator_writes_files(tmpdir, extension: str, reader: FileReader) -> None:
+    generator = DatasetGenerator(DatasetConfig(deliveries=50, users=10, lockers=2))
+
+    written = generator.write(str(tmpdir), extension)
+
+    delivers_file = os.path.join(tmpdir, "delivers" + extension)
+    assert written[delivers_file] == 50
+    assert reader.read(delivers_file) == list(generator.deliveries())
+    assert sorted(os.listdir(tmpdir)) == sorted(name + extension for name in ("users", "lockers", "parcels", "delivers"))
+
+
+def test_config_rejects_invalid_parameters() -> None:
+    with pytest.raises(ValueError):
+        DatasetConfig(users=1)
+    with pytest.raises(ValueError):
+        DatasetConfig(invalid_fraction=1.0)
@@ -0,0 +1,26 @@
+from src.dates import day_number, iso_date
+from src.model import Deliver
+from datetime import date
+import pytest
+
+
+def test_day_number_round_trip() -> None:
+    assert day_number("2025-01-07") - day_number("2025-01-01") == 6
+    assert day_number("2025-01-01") == date(2025, 1, 1).toordinal()
+    assert iso_date(day_number("2024-02-29")) == "2024-02-29"
+
+
+def test_day_number_accepts_unpadded_dates_like_strptime() -> None:
+    assert day_number("2025-1-7") == day_number("2025-01-07")
+
+
+@pytest.mark.parametrize("value", ["2025-02-30", "2025/01/01", "01-01-2025", "", "2025-01-0１"])
+def test_day_number_rejects_invalid_dates(value: str) -> None:
+    with pytest.raises(ValueError):
+        day_number(value)
+
+
+def test_deliver_parses_dates_once(deliver_1: Deliver) -> None:
+    assert deliver_1.expected_day - deliver_1.sent_day == 4
+    assert deliver_1.to_dict()["sent_date"] == "2023-12-01"
+    assert "sent_day" not in repr(deliver_1)
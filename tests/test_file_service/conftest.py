@@ -13,4 +13,11 @@ def users_file(tmpdir, users_data: UsersDataDict) -> str:
     file_path = os.path.join(tmpdir, "test_user.json")
     with open(file_path, "w") as file:
         json.dump(users_data, file)
-    return file_path
\ No newline at end of file
+    return file_path
+
+@pytest.fixture
+def users_ndjson_file(tmpdir, users_data: list[UsersDataDict]) -> str:
+    file_path = os.path.join(tmpdir, "test_user.ndjson")
+    with open(file_path, "w") as file:
+        file.writelines(json.dumps(user) + "\n" for user in users_data)
+    return file_path
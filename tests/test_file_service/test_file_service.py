@@ -1,6 +1,23 @@
-from src.file_service import UserReaderJson, UserWriterJson
+from src.file_service import (
+    UserReaderJson,
+    UserWriterJson,
+    UserReaderNdjson,
+    UserWriterNdjson,
+    NdjsonFileReader,
+    FileState,
+    reader_for,
+    writer_for,
+    FileWriter,
+    NdjsonFileWriter,
+    convert_json_to_ndjson,
+    _JsonArrayStream,
+)
 from src.model import User, UsersDataDict
+from unittest.mock import patch
+from typing import cast
 import os.path
+import pytest
+import json
 
 
 def test_user_read_file_service(users_file: str, users_data: list[UsersDataDict]) -> None:
@@ -15,3 +32,209 @@ def test_user_write_file_service(users_data: list[User], users_file: str) -> Non
     writer.write(file_path, users_data)
     assert users_file == file_path
 
+
+
+def test_user_iter_read_file_service(users_file: str, users_data: list[UsersDataDict]) -> None:
+    reader = UserReaderJson()
+    users = reader.iter_read(users_file)
+    assert list(users) == users_data
+
+
+def test_iter_read_across_chunk_boundaries(users_file: str, users_data: list[UsersDataDict]) -> None:
+    reader = UserReaderJson()
+    reader.chunk_size = 7
+    assert list(reader.iter_read(users_file)) == users_data
+
+
+def test_iter_read_empty_array(tmpdir) -> None:
+    file_path = os.path.join(tmpdir, "empty.json")
+    with open(file_path, "w") as file:
+        file.write(" [ ] ")
+    assert list(UserReaderJson().iter_read(file_path)) == []
+
+
+@pytest.mark.parametrize("content", ['{"email": "a"}', '[{"email": "a"} {"email": "b"}]', '[{"email": "a"},'])
+def test_iter_read_invalid_json_raises(tmpdir, content: str) -> None:
+    file_path = os.path.join(tmpdir, "invalid.json")
+    with open(file_path, "w") as file:
+        file.write(content)
+    with pytest.raises(json.JSONDecodeError):
+        list(UserReaderJson().iter_read(file_path))
+
+
+def test_iter_read_corrupt_element_does_not_buffer_rest_of_file(tmpdir) -> None:
+    file_path = os.path.join(tmpdir, "corrupt.json")
+    with open(file_path, "w") as file:
+        file.write('[{"email": "a" "name": "b"}' + ', {"email": "c"}' * 10_000 + "]")
+    reader = UserReaderJson()
+    reader.chunk_size, reader.max_element_size = 64, 256
+
+    with patch.object(_JsonArrayStream, "_read_more", autospec=True,
+                      side_effect=_JsonArrayStream._read_more) as read_more:
+        with pytest.raises(json.JSONDecodeError):
+            list(reader.iter_read(file_path))
+
+    assert read_more.call_count <= 256 // 64 + 2
+
+
+def test_user_read_ndjson_file_service(users_ndjson_file: str, users_data: list[UsersDataDict]) -> None:
+    reader = UserReaderNdjson()
+    assert reader.read(users_ndjson_file) == users_data
+
+
+def test_user_write_and_append_ndjson_file_service(tmpdir, users_data: list[User]) -> None:
+    file_path = os.path.join(tmpdir, "users.ndjson")
+    writer = UserWriterNdjson()
+    writer.write(file_path, users_data[:1])
+    writer.append(file_path, users_data[1:])
+
+    with open(file_path, "r") as file:
+        lines = file.readlines()
+    assert [json.loads(line) for line in lines] == users_data
+
+
+@pytest.mark.parametrize("file_name, expected_type", [
+    ("users.json", UserReaderJson),
+    ("users.ndjson", NdjsonFileReader),
+    ("users.JSONL", NdjsonFileReader),
+    ("users.csv", UserReaderJson),
+])
+def test_reader_for_picks_reader_by_extension(file_name: str, expected_type: type) -> None:
+    assert type(reader_for(file_name, UserReaderJson())) is expected_type
+
+
+def test_convert_json_to_ndjson(users_file: str, users_data: list[UsersDataDict]) -> None:
+    target = convert_json_to_ndjson(users_file)
+
+    assert target.endswith("test_user.ndjson")
+    assert UserReaderNdjson().read(target) == users_data
+
+
+@pytest.mark.parametrize("reader, writer", [
+    (UserReaderJson(), UserWriterJson()),
+    (UserReaderNdjson(), UserWriterNdjson()),
+])
+def test_read_appended_returns_only_new_entries(tmpdir, reader, writer, users_data: list[UsersDataDict]) -> None:
+    file_path = os.path.join(tmpdir, "users" + writer.extensions[0])
+    writer.write(file_path, users_data[:1])
+    offset = reader.append_offset(file_path, os.path.getsize(file_path))
+
+    writer.write(file_path, users_data)
+
+    assert offset is not None
+    assert reader.read_appended(file_path, offset, os.path.getsize(file_path)) == users_data[1:]
+
+
+def test_read_appended_to_empty_json_array(tmpdir, users_data: list[UsersDataDict]) -> None:
+    file_path = os.path.join(tmpdir, "users.json")
+    with open(file_path, "w") as file:
+        file.write("[]")
+    offset = UserReaderJson().append_offset(file_path, os.path.getsize(file_path))
+
+    UserWriterJson().write(file_path, cast(list[User], users_data))
+
+    assert offset is not None
+    assert UserReaderJson().read_appended(file_path, offset, os.path.getsize(file_path)) == users_data
+
+
+def test_append_offset_of_non_array_is_none(tmpdir) -> None:
+    file_path = os.path.join(tmpdir, "users.json")
+    with open(file_path, "w") as file:
+        file.write('{"email": "john.doe@example.com"}')
+
+    assert UserReaderJson().append_offset(file_path, os.path.getsize(file_path)) is None
+
+
+def test_file_state_of_missing_file_is_none(tmpdir, users_file: str) -> None:
+    assert FileState.of(os.path.join(tmpdir, "missing.json")) is None
+    state = FileState.of(users_file)
+    assert state is not None
+    assert state.size == os.path.getsize(users_file)
+
+
+@pytest.mark.parametrize("writer", [UserWriterJson(), UserWriterNdjson()])
+def test_write_iter_matches_write(tmpdir, writer, users_data: list[UsersDataDict]) -> None:
+    expected_path = os.path.join(tmpdir, "expected" + writer.extensions[0])
+    streamed_path = os.path.join(tmpdir, "streamed" + writer.extensions[0])
+    writer.write(expected_path, users_data)
+
+    assert writer.write_iter(streamed_path, iter(users_data)) == len(users_data)
+    with open(expected_path) as expected, open(streamed_path) as streamed:
+        assert streamed.read() == expected.read()
+
+
+@pytest.mark.parametrize("writer", [UserWriterJson(), UserWriterNdjson()])
+@pytest.mark.parametrize("initial", [0, 1, 2])
+def test_append_matches_write(tmpdir, writer, initial: int, users_data: list[UsersDataDict]) -> None:
+    expected_path = os.path.join(tmpdir, "expected" + writer.extensions[0])
+    appended_path = os.path.join(tmpdir, "appended" + writer.extensions[0])
+    writer.write(expected_path, users_data)
+    writer.write(appended_path, users_data[:initial])
+
+    writer.append(appended_path, users_data[initial:])
+
+    with open(expected_path) as expected, open(appended_path) as appended:
+        assert appended.read() == expected.read()
+
+
+def test_append_to_missing_json_file_creates_array(tmpdir, users_data: list[UsersDataDict]) -> None:
+    file_path = os.path.join(tmpdir, "users.json")
+
+    UserWriterJson().append(file_path, cast(list[User], users_data))
+
+    assert UserReaderJson().read(file_path) == users_data
+
+
+def test_json_append_replaces_a_longer_tail(tmpdir, users_data: list[UsersDataDict]) -> None:
+    file_path = os.path.join(tmpdir, "users.json")
+    with open(file_path, "w") as file:
+        json.dump(users_data[:1], file)
+        file.write(" " * 1024 + "\n")
+
+    UserWriterJson().append(file_path, cast(list[User], users_data[1:2]))
+
+    assert UserReaderJson().read(file_path) == users_data[:2]
+
+
+def test_json_append_leaves_file_untouched_if_an_entry_does_not_serialize(
+        tmpdir,
+        users_data: list[UsersDataDict]) -> None:
+    file_path = os.path.join(tmpdir, "users.json")
+    UserWriterJson().write(file_path, cast(list[User], users_data[:1]))
+    with open(file_path, "rb") as file:
+        before = file.read()
+
+    with pytest.raises(TypeError):
+        UserWriterJson().append(file_path, cast(list[User], [{"email": object()}]))
+
+    with open(file_path, "rb") as file:
+        assert file.read() == before
+
+
+def test_ndjson_append_adds_missing_trailing_newline(tmpdir, users_data: list[UsersDataDict]) -> None:
+    file_path = os.path.join(tmpdir, "users.ndjson")
+    with open(file_path, "w") as file:
+        file.write(json.dumps(users_data[0]))
+
+    UserWriterNdjson().append(file_path, cast(list[User], users_data[1:]))
+
+    assert UserReaderNdjson().read(file_path) == users_data
+
+
+def test_append_to_non_array_raises(tmpdir, users_data: list[UsersDataDict]) -> None:
+    file_path = os.path.join(tmpdir, "users.json")
+    with open(file_path, "w") as file:
+        file.write('{"email": "a@b.com"}')
+
+    with pytest.raises(ValueError, match="JSON array"):
+        UserWriterJson().append(file_path, cast(list[User], users_data))
+
+
+@pytest.mark.parametrize("file_name, expected_type", [
+    ("users.json", FileWriter),
+    ("users.ndjson", NdjsonFileWriter),
+    ("users.JSONL", NdjsonFileWriter),
+    ("users.txt", FileWriter),
+])
+def test_writer_for_picks_writer_by_extension(file_name: str, expected_type: type) -> None:
+    assert type(writer_for(file_name)) is expected_type
@@ -7,9 +7,13 @@ from src.model import (
     LockersDataDict,
     ParcelsDataDict,
     DeliversDataDict,
-    CompartmentsLarge
+    CompartmentsLarge,
+    ParcelSizeRule,
+    ParcelSizeRules,
 )
 import pytest
+import json
+import os
 
 def test_user_to_dict(user_1: User, user_1_data: UsersDataDict) -> None:
     data = user_1.to_dict()
@@ -34,4 +38,38 @@ def test_deliver_to_dict(deliver_1: Deliver, deliver_1_data: DeliversDataDict) -
 ])
 def test_size_parcel(height: int, length: int, expected: CompartmentsLarge) -> None:
     data = Parcel.get_size(height, length)
-    assert data == expected
\ No newline at end of file
+    assert data == expected
+
+def test_parcel_size_is_classified_on_creation(parcel_1: Parcel, parcel_2: Parcel) -> None:
+    assert parcel_1.size == CompartmentsLarge.MEDIUM
+    assert parcel_2.size == CompartmentsLarge.SMALL
+    assert "size" not in parcel_1.to_dict()
+
+def test_parcel_size_rules_are_sorted_and_extendable() -> None:
+    rules = ParcelSizeRules([
+        ParcelSizeRule(CompartmentsLarge.MEDIUM, max_height=40, max_length=60),
+        ParcelSizeRule(CompartmentsLarge.SMALL, max_height=10, max_length=20),
+    ])
+
+    assert [rule.size for rule in rules.rules] == [CompartmentsLarge.SMALL, CompartmentsLarge.MEDIUM]
+    assert rules.classify(10, 20) == CompartmentsLarge.SMALL
+    assert rules.classify(20, 40) == CompartmentsLarge.MEDIUM
+    assert rules.classify(41, 40) == CompartmentsLarge.LARGE
+
+def test_parcel_size_rules_from_file(tmpdir) -> None:
+    file_name = os.path.join(tmpdir, "rules.json")
+    with open(file_name, "w") as file:
+        json.dump([{"size": "medium", "max_height": 50, "max_length": 50}], file)
+
+    rules = ParcelSizeRules.from_file(file_name)
+
+    assert rules.classify(20, 40) == CompartmentsLarge.MEDIUM
+    assert rules.classify(60, 40) == CompartmentsLarge.LARGE
+
+def test_fingerprint_changes_with_rule_table() -> None:
+    rules = ParcelSizeRules()
+    fingerprint = rules.fingerprint()
+
+    assert ParcelSizeRules().fingerprint() == fingerprint
+    rules.configure([ParcelSizeRule(CompartmentsLarge.SMALL, max_height=25, max_length=40)])
+    assert rules.fingerprint() != fingerprint
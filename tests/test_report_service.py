@@ -1,5 +1,6 @@
 from src.report_service import ReportService
 from unittest.mock import MagicMock
+from datetime import date
 import pandas as pd
 
 def test_report_most_common_parcel_sizes_per_locker(mock_service: MagicMock, mock_report_service: ReportService) -> None:
@@ -41,3 +42,29 @@ def test_report_is_parcel_limit_in_locker_exceeded(mock_service: MagicMock, mock
     result = mock_report_service.report_is_parcel_limit_in_locker_exceeded()
     assert isinstance(result, pd.DataFrame)
 
+
+def test_report_is_cached_until_data_version_changes(mock_service: MagicMock, mock_report_service: ReportService) -> None:
+    mock_service.max_days_between_sent_and_expected.return_value = {"alice.smith@gmail.com": 13}
+    mock_service.repository.data_version.return_value = (1, 1, 1, 1)
+
+    first = mock_report_service.report_max_days_between_sent_and_expected()
+    second = mock_report_service.report_max_days_between_sent_and_expected()
+    mock_service.repository.data_version.return_value = (1, 1, 1, 2)
+    third = mock_report_service.report_max_days_between_sent_and_expected()
+
+    assert first is second
+    assert third is not first
+    assert mock_service.max_days_between_sent_and_expected.call_count == 2
+
+def test_report_is_cached_per_date_window(mock_service: MagicMock, mock_report_service: ReportService) -> None:
+    mock_service.max_days_between_sent_and_expected.return_value = {"alice.smith@gmail.com": 13}
+    mock_service.repository.data_version.return_value = (1, 1, 1, 1)
+    since, until = date(2023, 12, 1), date(2023, 12, 7)
+
+    everything = mock_report_service.report_max_days_between_sent_and_expected()
+    window = mock_report_service.report_max_days_between_sent_and_expected(since, until)
+
+    assert window is not everything
+    assert mock_report_service.report_max_days_between_sent_and_expected(since, until) is window
+    mock_service.max_days_between_sent_and_expected.assert_called_with(since, until)
+    assert mock_service.max_days_between_sent_and_expected.call_count == 2
@@ -1,9 +1,26 @@
 from tests.test_repository.data_repository.conftest import user_data_repository
-from src.repository import UserDataRepository
-from src.model import UsersDataDict, User
-from unittest.mock import MagicMock
+from src.repository import UserDataRepository, DeliveryDataRepository, ParcelDataRepository, RefreshResult
+from tests.conftest import InMemoryRepositoryFactory
+from src.file_service import UserReaderJson, UserWriterJson, UserWriterNdjson, FileWriter, FileReader
+from src.snapshot import SnapshotCache
+from src.dataset_generator import DatasetConfig, DatasetGenerator
+from src.file_service import DeliverReaderJson, ParcelReaderJson
+from src.validator import Validator
+from src.converter import DeliverConverter
+from src.model import (
+    UsersDataDict, User, Deliver, DeliversDataDict, Parcel, ParcelsDataDict, CompartmentsLarge, ParcelSizeRule,
+    parcel_size_rules,
+)
+from unittest.mock import MagicMock, patch
+from typing import Sequence, cast, override
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 import logging
 import pytest
+import json
+import threading
+import time
+import os
 
 
 def test_get_data_empty_cache_logs_warning(
@@ -76,3 +93,492 @@ def test_no_invalid_entry_logs_error(
 
     assert "Invalid entry: {'email': 'alice.smith@gmail.com', 'name': 'Alice', 'surname': 'Smith', 'city': 'Chicago'}" in caplog.text
     assert len(data) == 1
+    assert user_data_repository.skipped_entries() == 1
+
+def test_process_data_streaming_uses_iter_read(
+        user_data_repository: UserDataRepository,
+        file_reader_mock: MagicMock,
+        validator_mock: MagicMock,
+        converter_mock: MagicMock,
+        user_1_data: UsersDataDict,
+        user_1: User
+    ) -> None:
+    file_reader_mock.iter_read.return_value = iter([user_1_data])
+    validator_mock.validate.return_value = True
+    converter_mock.convert.return_value = user_1
+    user_data_repository.streaming = True
+
+    data = user_data_repository.refresh_data()
+
+    file_reader_mock.iter_read.assert_called_once_with("user.json")
+    assert data == [user_1]
+
+def test_refresh_data_picks_reader_by_extension(
+        tmpdir,
+        validator_mock: MagicMock,
+        converter_mock: MagicMock,
+        user_1_data: UsersDataDict,
+        user_1: User
+    ) -> None:
+    file_path = os.path.join(tmpdir, "users.ndjson")
+    with open(file_path, "w") as file:
+        file.write(json.dumps(user_1_data) + "\n")
+    validator_mock.validate.return_value = True
+    converter_mock.convert.side_effect = lambda entry: User(**entry)
+
+    repository = UserDataRepository(
+        file_reader=cast(FileReader[UsersDataDict], UserReaderJson()),
+        validator=validator_mock,
+        converter=converter_mock,
+        filename=file_path,
+    )
+
+    assert repository.get_data() == [user_1]
+
+def test_refresh_data_uses_fresh_snapshot(
+        tmpdir,
+        validator_mock: MagicMock,
+        converter_mock: MagicMock,
+        user_1_data: UsersDataDict,
+        user_1: User
+    ) -> None:
+    file_path = os.path.join(tmpdir, "users.json")
+    with open(file_path, "w") as file:
+        json.dump([user_1_data], file)
+    validator_mock.validate.return_value = True
+    converter_mock.convert.return_value = user_1
+    snapshot_cache = SnapshotCache(os.path.join(tmpdir, "snapshots"))
+
+    def build() -> UserDataRepository:
+        return UserDataRepository(
+            file_reader=cast(FileReader[UsersDataDict], UserReaderJson()),
+            validator=validator_mock,
+            converter=converter_mock,
+            filename=file_path,
+            snapshot_cache=snapshot_cache,
+        )
+
+    cold = build()
+    warm = build()
+
+    assert cold.get_data() == warm.get_data() == [user_1]
+    assert validator_mock.validate.call_count == 1
+    assert converter_mock.convert.call_count == 1
+
+def test_parcel_snapshot_is_ignored_after_size_rules_change(
+        tmpdir,
+        validator_mock: MagicMock,
+        converter_mock: MagicMock,
+        parcel_1_data: ParcelsDataDict) -> None:
+    file_path = os.path.join(tmpdir, "parcels.json")
+    with open(file_path, "w") as file:
+        json.dump([parcel_1_data], file)
+    validator_mock.validate.return_value = True
+    converter_mock.convert.side_effect = lambda entry: Parcel(**entry)
+    snapshot_cache = SnapshotCache(os.path.join(tmpdir, "snapshots"))
+
+    def build() -> ParcelDataRepository:
+        return ParcelDataRepository(
+            file_reader=cast(FileReader[ParcelsDataDict], ParcelReaderJson()),
+            validator=validator_mock,
+            converter=converter_mock,
+            filename=file_path,
+            snapshot_cache=snapshot_cache,
+        )
+
+    assert build().get_data()[0].size == CompartmentsLarge.MEDIUM
+    with patch.object(parcel_size_rules, "rules", [ParcelSizeRule(CompartmentsLarge.SMALL, 30, 50)]):
+        assert build().get_data()[0].size == CompartmentsLarge.SMALL
+    assert converter_mock.convert.call_count == 2
+
+def test_get_by_key_uses_primary_index(
+        in_memory_repository: InMemoryRepositoryFactory,
+        user_1: User,
+        user_2: User) -> None:
+    repository = in_memory_repository(UserDataRepository, [user_1, user_2])
+
+    assert repository.get_by_key(user_2.email) is user_2
+    assert repository.get_by_key("unknown@gmail.com") is None
+
+
+def test_find_by_uses_secondary_index(
+        in_memory_repository: InMemoryRepositoryFactory,
+        deliver_1: Deliver,
+        deliver_2: Deliver,
+        deliver_3: Deliver) -> None:
+    repository = in_memory_repository(DeliveryDataRepository, [deliver_1, deliver_2, deliver_3])
+
+    assert repository.find_by("parcel_id", "P67890") == [deliver_2, deliver_3]
+    assert repository.find_by("locker_id", "L001") == [deliver_1]
+    assert repository.find_by("sender_email", "unknown@gmail.com") == []
+
+
+def test_indexes_are_rebuilt_on_refresh(
+        in_memory_repository: InMemoryRepositoryFactory,
+        user_1: User,
+        user_2: User) -> None:
+    repository = in_memory_repository(UserDataRepository, [user_1])
+
+    with patch.object(repository.file_reader, "read", return_value=[user_2]):
+        repository.refresh_data()
+
+    assert repository.get_by_key(user_1.email) is None
+    assert repository.get_by_key(user_2.email) is user_2
+
+
+def test_missing_index_raises_value_error(
+        in_memory_repository: InMemoryRepositoryFactory,
+        deliver_1: Deliver) -> None:
+    repository = in_memory_repository(DeliveryDataRepository, [deliver_1])
+
+    with pytest.raises(ValueError, match="has no primary key"):
+        repository.get_by_key("P12345")
+    with pytest.raises(ValueError, match="has no index on receiver_email"):
+        repository.find_by("receiver_email", "jane.smith@example.com")
+
+def test_refresh_if_changed_reloads_only_changed_file(
+        tmpdir,
+        validator_mock: MagicMock,
+        converter_mock: MagicMock,
+        user_1_data: UsersDataDict,
+        user_2_data: UsersDataDict) -> None:
+    file_path = os.path.join(tmpdir, "users.json")
+    with open(file_path, "w") as file:
+        json.dump([user_1_data], file)
+    validator_mock.validate.return_value = True
+    converter_mock.convert.side_effect = lambda entry: User(**entry)
+    repository = UserDataRepository(
+        file_reader=cast(FileReader[UsersDataDict], UserReaderJson()),
+        validator=validator_mock,
+        converter=converter_mock,
+        filename=file_path,
+    )
+    version = repository.source_version()
+
+    assert repository.refresh_if_changed() is RefreshResult.UNCHANGED
+
+    with open(file_path, "w") as file:
+        json.dump([user_2_data, user_1_data], file)
+
+    assert repository.refresh_if_changed() is RefreshResult.RELOADED
+    assert len(repository.get_data()) == 2
+    assert repository.source_version() != version
+
+
+@pytest.mark.parametrize("file_name, writer", [
+    ("users.json", UserWriterJson()),
+    ("users.ndjson", UserWriterNdjson()),
+])
+def test_refresh_if_changed_reads_only_appended_entries(
+        tmpdir,
+        file_name: str,
+        writer: FileWriter[UsersDataDict],
+        validator_mock: MagicMock,
+        converter_mock: MagicMock,
+        user_1_data: UsersDataDict,
+        user_2_data: UsersDataDict) -> None:
+    file_path = os.path.join(tmpdir, file_name)
+    writer.write(file_path, [user_1_data])
+    validator_mock.validate.return_value = True
+    converter_mock.convert.side_effect = lambda entry: User(**entry)
+    repository = UserDataRepository(
+        file_reader=cast(FileReader[UsersDataDict], UserReaderJson()),
+        validator=validator_mock,
+        converter=converter_mock,
+        filename=file_path,
+    )
+    data = repository.get_data()
+
+    writer.write(file_path, [user_1_data, user_2_data])
+
+    assert repository.refresh_if_changed() is RefreshResult.APPENDED
+    assert [user.email for user in data] == [user_1_data["email"]]
+    assert [user.email for user in repository.get_data()] == [user_1_data["email"], user_2_data["email"]]
+    assert repository.snapshot().base_version == repository.snapshot().version - 1
+    assert repository.get_by_key(user_2_data["email"]) == User(**user_2_data)
+    assert converter_mock.convert.call_count == 2
+    assert repository.refresh_if_changed() is RefreshResult.UNCHANGED
+
+
+def test_refresh_if_changed_reloads_when_earlier_entries_change(
+        tmpdir,
+        validator_mock: MagicMock,
+        converter_mock: MagicMock,
+        user_1_data: UsersDataDict,
+        user_2_data: UsersDataDict) -> None:
+    file_path = os.path.join(tmpdir, "users.ndjson")
+    UserWriterNdjson().write(file_path, cast(list[User], [user_1_data]))
+    validator_mock.validate.return_value = True
+    converter_mock.convert.side_effect = lambda entry: User(**entry)
+    repository = UserDataRepository(
+        file_reader=cast(FileReader[UsersDataDict], UserReaderJson()),
+        validator=validator_mock,
+        converter=converter_mock,
+        filename=file_path,
+    )
+
+    UserWriterNdjson().write(file_path, cast(list[User], [user_2_data, user_1_data]))
+
+    assert repository.refresh_if_changed() is RefreshResult.RELOADED
+    assert [user.email for user in repository.get_data()] == [user_2_data["email"], user_1_data["email"]]
+
+
+def test_refresh_if_changed_missing_file_keeps_data(user_data_repository: UserDataRepository) -> None:
+    assert user_data_repository.refresh_if_changed() is RefreshResult.UNCHANGED
+    assert user_data_repository.source_version() is None
+
+
+class DeliveryDatesValidator(Validator[DeliversDataDict]):
+    """
+    Offline stand-in for DeliversDataDictValidator; worker processes do not inherit test-time patches.
+    """
+    @override
+    def validate(self, data: DeliversDataDict) -> bool:
+        return len(data) == 6 and data["sent_date"] < data["expected_delivery_date"]
+
+
+def test_parallel_conversion_matches_in_process(tmpdir, caplog: pytest.LogCaptureFixture) -> None:
+    config = DatasetConfig(deliveries=200, users=10, lockers=3, invalid_fraction=0.1)
+    DatasetGenerator(config).write(str(tmpdir))
+    file_path = os.path.join(tmpdir, "delivers.json")
+
+    def load(workers: int) -> tuple[Sequence[Deliver], list[str], int]:
+        caplog.clear()
+        with caplog.at_level(logging.ERROR):
+            repository = DeliveryDataRepository(
+                file_reader=cast(FileReader[DeliversDataDict], DeliverReaderJson()),
+                validator=DeliveryDatesValidator(),
+                converter=DeliverConverter(),
+                filename=file_path,
+                workers=workers,
+                chunk_size=16,
+            )
+        invalid = [r.message for r in caplog.records if r.message.startswith("Invalid entry")]
+        return repository.get_data(), invalid, repository.skipped_entries()
+
+    in_process, in_process_log, in_process_skipped = load(1)
+    parallel, parallel_log, parallel_skipped = load(3)
+
+    assert parallel == in_process
+    assert parallel_log == in_process_log
+    assert parallel_skipped == in_process_skipped == len(in_process_log)
+    assert len(in_process_log) > 0
+    assert [deliver.sent_day for deliver in parallel] == [deliver.sent_day for deliver in in_process]
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(0, 10), (2, 0)])
+def test_invalid_parallel_options_raise_value_error(
+        file_reader_mock: MagicMock,
+        validator_mock: MagicMock,
+        converter_mock: MagicMock,
+        workers: int,
+        chunk_size: int) -> None:
+    with pytest.raises(ValueError, match="must be positive"):
+        UserDataRepository(
+            file_reader=file_reader_mock,
+            validator=validator_mock,
+            converter=converter_mock,
+            filename="user.json",
+            workers=workers,
+            chunk_size=chunk_size,
+        )
+
+
+@pytest.fixture
+def lazy_user_repository(
+        file_reader_mock: MagicMock, validator_mock: MagicMock, converter_mock: MagicMock,
+        user_1_data: UsersDataDict, user_1: User) -> UserDataRepository:
+    file_reader_mock.read.return_value = [user_1_data]
+    validator_mock.validate.return_value = True
+    converter_mock.convert.return_value = user_1
+    return UserDataRepository(
+        file_reader=file_reader_mock,
+        validator=validator_mock,
+        converter=converter_mock,
+        filename="user.json",
+        lazy=True,
+    )
+
+
+def test_lazy_repository_loads_on_first_access(
+        lazy_user_repository: UserDataRepository, file_reader_mock: MagicMock, user_1: User) -> None:
+    assert not lazy_user_repository.is_loaded()
+    file_reader_mock.read.assert_not_called()
+
+    assert lazy_user_repository.get_by_key(user_1.email) == user_1
+    assert lazy_user_repository.get_data() == [user_1]
+    assert lazy_user_repository.is_loaded()
+    file_reader_mock.read.assert_called_once_with("user.json")
+
+
+def test_lazy_repository_loads_once_under_concurrent_access(
+        lazy_user_repository: UserDataRepository, file_reader_mock: MagicMock, user_1_data: UsersDataDict) -> None:
+    def slow_read(file_name: str) -> list[UsersDataDict]:
+        time.sleep(0.05)
+        return [user_1_data]
+    file_reader_mock.read.side_effect = slow_read
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: len(lazy_user_repository.get_data()), range(8)))
+
+    assert results == [1] * 8
+    file_reader_mock.read.assert_called_once()
+
+
+def test_lazy_repository_warm_and_refresh(
+        lazy_user_repository: UserDataRepository, file_reader_mock: MagicMock, user_1: User) -> None:
+    assert lazy_user_repository.refresh_if_changed() is RefreshResult.UNCHANGED
+    lazy_user_repository.extend([user_1])
+    file_reader_mock.read.assert_not_called()
+
+    lazy_user_repository.warm()
+    lazy_user_repository.warm()
+
+    file_reader_mock.read.assert_called_once()
+    assert lazy_user_repository.get_data() == [user_1]
+
+
+@pytest.mark.parametrize("file_name", ["users.json", "users.ndjson"])
+def test_add_many_persists_and_updates_indexes(
+        tmpdir,
+        file_name: str,
+        validator_mock: MagicMock,
+        converter_mock: MagicMock,
+        user_1_data: UsersDataDict,
+        user_2_data: UsersDataDict) -> None:
+    file_path = os.path.join(tmpdir, file_name)
+    writer = UserWriterJson() if file_name.endswith(".json") else UserWriterNdjson()
+    writer.write(file_path, [])
+    validator_mock.validate.return_value = True
+    converter_mock.convert.side_effect = lambda entry: User(**entry)
+    repository = UserDataRepository(
+        file_reader=cast(FileReader[UsersDataDict], UserReaderJson()),
+        validator=validator_mock,
+        converter=converter_mock,
+        filename=file_path,
+    )
+    added: list[User] = []
+    repository.subscribe(added.extend)
+
+    assert repository.add(user_1_data) == User(**user_1_data)
+    assert repository.add_many([user_2_data]) == [User(**user_2_data)]
+
+    assert added == repository.get_data() == [User(**user_1_data), User(**user_2_data)]
+    assert repository.get_by_key(user_2_data["email"]) == User(**user_2_data)
+    assert repository.refresh_if_changed() is RefreshResult.UNCHANGED
+    assert repository.refresh_data() == added
+
+
+def test_add_many_with_invalid_entry_writes_nothing(
+        tmpdir,
+        validator_mock: MagicMock,
+        converter_mock: MagicMock,
+        user_1_data: UsersDataDict,
+        user_2_data: UsersDataDict) -> None:
+    file_path = os.path.join(tmpdir, "users.ndjson")
+    UserWriterNdjson().write(file_path, cast(list[User], [user_1_data]))
+    validator_mock.validate.side_effect = lambda entry: entry is not user_2_data
+    converter_mock.convert.side_effect = lambda entry: User(**entry)
+    repository = UserDataRepository(
+        file_reader=cast(FileReader[UsersDataDict], UserReaderJson()),
+        validator=validator_mock,
+        converter=converter_mock,
+        filename=file_path,
+    )
+    size = os.path.getsize(file_path)
+
+    with pytest.raises(ValueError, match="Invalid entry"):
+        repository.add_many([user_1_data, user_2_data])
+
+    assert os.path.getsize(file_path) == size
+    assert len(repository.get_data()) == 1
+
+
+def test_concurrent_reloads_are_coalesced_and_readers_keep_snapshot(
+        user_data_repository: UserDataRepository,
+        file_reader_mock: MagicMock,
+        validator_mock: MagicMock,
+        converter_mock: MagicMock,
+        user_1_data: UsersDataDict,
+        user_2_data: UsersDataDict) -> None:
+    validator_mock.validate.return_value = True
+    converter_mock.convert.side_effect = lambda entry: User(**entry)
+    file_reader_mock.read.return_value = [user_1_data]
+    user_data_repository.refresh_data()
+    before = user_data_repository.snapshot()
+
+    reading, release = threading.Event(), threading.Event()
+    def blocking_read(file_name: str) -> list[UsersDataDict]:
+        reading.set()
+        release.wait(timeout=5)
+        return [user_1_data, user_2_data]
+    file_reader_mock.read.side_effect = blocking_read
+    file_reader_mock.read.reset_mock()
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        first = executor.submit(user_data_repository.refresh_data)
+        assert reading.wait(timeout=5)
+        waiting = [executor.submit(user_data_repository.refresh_data) for _ in range(4)]
+        time.sleep(0.05)
+
+        assert user_data_repository.get_data() is before.data
+        assert user_data_repository.get_by_key(user_2_data["email"]) is None
+
+        release.set()
+        results = [future.result(timeout=5) for future in [first, *waiting]]
+
+    assert file_reader_mock.read.call_count == 2
+    assert all(len(result) == 2 for result in results)
+    assert user_data_repository.snapshot().version > before.version
+    assert len(before.data) == 1
+
+
+def test_snapshot_is_not_modified_by_appends(
+        user_data_repository: UserDataRepository, user_1: User, user_2: User) -> None:
+    user_data_repository.extend([user_1])
+    snapshot = user_data_repository.snapshot()
+
+    user_data_repository.extend([user_2])
+
+    assert snapshot.data == [user_1]
+    assert snapshot.get_by_key(user_1.email) is user_1
+    assert snapshot.get_by_key(user_2.email) is None
+    assert user_data_repository.get_data() == [user_1, user_2]
+    assert user_data_repository.snapshot().base_version == snapshot.base_version
+    assert user_data_repository.snapshot().index is snapshot.index
+
+
+def test_snapshot_lookups_ignore_later_appends(
+        in_memory_repository: InMemoryRepositoryFactory,
+        user_1: User,
+        deliver_1: Deliver,
+        deliver_2: Deliver,
+        deliver_3: Deliver) -> None:
+    users = in_memory_repository(UserDataRepository, [user_1])
+    delivers = in_memory_repository(DeliveryDataRepository, [deliver_1, deliver_2])
+    user_snapshot, deliver_snapshot = users.snapshot(), delivers.snapshot()
+    renamed = replace(user_1, name="Johnny")
+
+    users.extend([renamed])
+    delivers.extend([deliver_3])
+
+    assert user_snapshot.get_by_key(user_1.email) is user_1
+    assert users.get_by_key(user_1.email) is renamed
+    assert deliver_snapshot.find_by("parcel_id", "P67890") == [deliver_2]
+    assert delivers.find_by("parcel_id", "P67890") == [deliver_2, deliver_3]
+
+
+def test_appending_to_an_earlier_snapshot_leaves_later_ones_unchanged(
+        user_data_repository: UserDataRepository, user_1: User, user_2: User) -> None:
+    user_data_repository.extend([user_1])
+    earlier = user_data_repository.snapshot()
+    user_data_repository.extend([user_2])
+    later = user_data_repository.snapshot()
+
+    branch = earlier.appended([user_2, user_1])
+
+    assert branch.data == [user_1, user_2, user_1]
+    assert branch.get_by_key(user_1.email) is user_1
+    assert branch.index is not later.index
+    assert later.data == [user_1, user_2]
+    assert earlier.data == [user_1]
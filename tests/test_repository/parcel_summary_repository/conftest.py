@@ -1,38 +1,37 @@
 from src.model import User, Locker, Parcel, Deliver, UsersDataDict, LockersDataDict, ParcelsDataDict, DeliversDataDict
-from src.repository import ParcelSummaryRepository
-from unittest.mock import MagicMock
+from src.repository import (
+    ParcelSummaryRepository,
+    UserDataRepository,
+    LockerDataRepository,
+    ParcelDataRepository,
+    DeliveryDataRepository,
+    DataRepository,
+)
+from tests.conftest import InMemoryRepositoryFactory
 import pytest
 
 @pytest.fixture
-def mock_user_repo(user_1: User, user_2: User) -> MagicMock:
-    repo = MagicMock()
-    repo.get_data.return_value = [user_1, user_2]
-    return repo
+def mock_user_repo(in_memory_repository: InMemoryRepositoryFactory, user_1: User, user_2: User) -> DataRepository:
+    return in_memory_repository(UserDataRepository, [user_1, user_2])
 
 @pytest.fixture
-def mock_locker_repo(locker_1: Locker, locker_2: Locker) -> MagicMock:
-    repo = MagicMock()
-    repo.get_data.return_value = [locker_1, locker_2]
-    return repo
+def mock_locker_repo(in_memory_repository: InMemoryRepositoryFactory, locker_1: Locker, locker_2: Locker) -> DataRepository:
+    return in_memory_repository(LockerDataRepository, [locker_1, locker_2])
 
 @pytest.fixture
-def mock_parcel_repo(parcel_1: Parcel, parcel_2: Parcel) -> MagicMock:
-    repo = MagicMock()
-    repo.get_data.return_value = [parcel_1, parcel_2]
-    return repo
+def mock_parcel_repo(in_memory_repository: InMemoryRepositoryFactory, parcel_1: Parcel, parcel_2: Parcel) -> DataRepository:
+    return in_memory_repository(ParcelDataRepository, [parcel_1, parcel_2])
 
 @pytest.fixture
-def mock_deliver_repo(deliver_1: Deliver, deliver_2: Deliver) -> MagicMock:
-    repo = MagicMock()
-    repo.get_data.return_value = [deliver_1, deliver_2]
-    return repo
+def mock_deliver_repo(in_memory_repository: InMemoryRepositoryFactory, deliver_1: Deliver, deliver_2: Deliver) -> DataRepository:
+    return in_memory_repository(DeliveryDataRepository, [deliver_1, deliver_2])
 
 @pytest.fixture
 def parcel_summary_repo(
-        mock_user_repo: MagicMock,
-        mock_locker_repo: MagicMock,
-        mock_parcel_repo: MagicMock,
-        mock_deliver_repo: MagicMock
+        mock_user_repo: DataRepository,
+        mock_locker_repo: DataRepository,
+        mock_parcel_repo: DataRepository,
+        mock_deliver_repo: DataRepository
 ) -> ParcelSummaryRepository[UsersDataDict, LockersDataDict, ParcelsDataDict, DeliversDataDict]:
 
     return ParcelSummaryRepository(
@@ -1,14 +1,20 @@
-from src.model import Parcel, Locker, Deliver
-from src.repository import ParcelSummaryRepository
+from src.model import Parcel, Locker, Deliver, EnrichedDelivery, CompartmentsLarge
+from src.repository import ParcelSummaryRepository, RefreshResult, SentDayIndex
+from datetime import date
+from typing import Sequence
 import pytest
+from unittest.mock import MagicMock, patch
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import logging
+import time
 
 
 def test_initial_state_empty_cache(
         parcel_summary_repo: ParcelSummaryRepository
 ) -> None:
 
-    assert parcel_summary_repo._parcel_summary == {}
+    assert parcel_summary_repo._parcel_summary is None
 
 def test_build_parcel_summary(
         parcel_summary_repo: ParcelSummaryRepository,
@@ -37,9 +43,265 @@ def test_invalid_entry_logs_warning(
         expected_delivery_date="2023-12-05"
     )
 
-    delivers = parcel_summary_repo.delivery_repo.get_data()
-    delivers.append(invalid_deliver)
+    parcel_summary_repo.delivery_repo.extend([invalid_deliver])
 
     with caplog.at_level(logging.WARNING):
         _ = parcel_summary_repo.parcel()
     assert any("not available" in record.message  for record in caplog.records)
+
+
+def test_refresh_if_changed_reports_change(
+        parcel_summary_repo: ParcelSummaryRepository,
+        mock_deliver_repo: MagicMock) -> None:
+    with patch.object(mock_deliver_repo, "refresh_if_changed", return_value=RefreshResult.APPENDED):
+        assert parcel_summary_repo.refresh_if_changed() is True
+
+
+def test_reloaded_repository_rebuilds_summary(parcel_summary_repo: ParcelSummaryRepository) -> None:
+    summary = parcel_summary_repo.parcel()
+    generations = parcel_summary_repo.data_version()
+
+    parcel_summary_repo.parcel_repo.refresh_data()
+
+    assert parcel_summary_repo.data_version() != generations
+    assert parcel_summary_repo.parcel() is not summary
+
+
+def test_repeated_summary_requests_do_not_rebuild(parcel_summary_repo: ParcelSummaryRepository) -> None:
+    summary = parcel_summary_repo.parcel()
+
+    with patch.object(parcel_summary_repo, "_build_parcel") as build:
+        assert parcel_summary_repo.parcel() is summary
+        assert parcel_summary_repo.parcel() is summary
+    build.assert_not_called()
+
+
+def test_empty_summary_is_built_once(parcel_summary_repo: ParcelSummaryRepository) -> None:
+    with patch.object(parcel_summary_repo, "_build_parcel", return_value={}) as build:
+        assert parcel_summary_repo.parcel() == {}
+        assert parcel_summary_repo.parcel() == {}
+    build.assert_called_once()
+
+
+def test_refresh_if_changed_keeps_summary_when_unchanged(parcel_summary_repo: ParcelSummaryRepository) -> None:
+    summary = parcel_summary_repo.parcel()
+
+    assert parcel_summary_repo.refresh_if_changed() is False
+    assert parcel_summary_repo.parcel() is summary
+
+
+def test_appended_delivery_updates_built_summary(
+        parcel_summary_repo: ParcelSummaryRepository,
+        deliver_1: Deliver) -> None:
+    summary = parcel_summary_repo.parcel()
+    count = summary[deliver_1.parcel_id][deliver_1.locker_id]
+
+    with patch.object(parcel_summary_repo, "_build_parcel") as build:
+        parcel_summary_repo.delivery_repo.extend([deliver_1])
+        assert parcel_summary_repo.parcel()[deliver_1.parcel_id][deliver_1.locker_id] == count + 1
+    build.assert_not_called()
+
+
+def test_appended_user_rebuilds_summary(
+        parcel_summary_repo: ParcelSummaryRepository,
+        user_1) -> None:
+    summary = parcel_summary_repo.parcel()
+
+    parcel_summary_repo.user_repo.extend([user_1])
+
+    with patch.object(parcel_summary_repo, "_build_parcel", return_value={}) as build:
+        assert parcel_summary_repo.parcel() == {}
+    build.assert_called_once()
+    assert summary
+
+
+def test_concurrent_summary_requests_build_once(parcel_summary_repo: ParcelSummaryRepository) -> None:
+    build = parcel_summary_repo._build_parcel
+
+    def slow_build(view: Sequence[EnrichedDelivery]) -> dict[str, dict[str, int]]:
+        time.sleep(0.05)
+        return build(view)
+
+    with patch.object(parcel_summary_repo, "_build_parcel", side_effect=slow_build) as builds:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            summaries = list(executor.map(lambda _: parcel_summary_repo.parcel(), range(8)))
+
+    assert builds.call_count == 1
+    assert all(summary is summaries[0] for summary in summaries)
+
+
+def test_failed_concurrent_build_raises_its_error_in_every_caller(
+        parcel_summary_repo: ParcelSummaryRepository) -> None:
+    request = parcel_summary_repo._builds.request
+    tickets = threading.Barrier(2)
+
+    def request_together() -> int:
+        ticket = request()
+        tickets.wait()
+        return ticket
+
+    def failing_build(view: Sequence[EnrichedDelivery]) -> dict[str, dict[str, int]]:
+        time.sleep(0.05)
+        raise RuntimeError("build failed")
+
+    with patch.object(parcel_summary_repo._builds, "request", side_effect=request_together), \
+            patch.object(parcel_summary_repo, "_build_parcel", side_effect=failing_build):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(parcel_summary_repo.parcel) for _ in range(2)]
+
+    for future in futures:
+        with pytest.raises(RuntimeError, match="build failed"):
+            future.result()
+
+
+def test_appended_delivery_does_not_change_returned_summary(
+        parcel_summary_repo: ParcelSummaryRepository,
+        deliver_1: Deliver,
+        deliver_2: Deliver) -> None:
+    summary = parcel_summary_repo.parcel()
+    before = {parcel_id: dict(lockers) for parcel_id, lockers in summary.items()}
+
+    parcel_summary_repo.delivery_repo.extend([deliver_1])
+    updated = parcel_summary_repo.parcel()
+    parcel_summary_repo.delivery_repo.extend([deliver_1])
+
+    assert summary == before
+    assert updated[deliver_1.parcel_id][deliver_1.locker_id] == before[deliver_1.parcel_id][deliver_1.locker_id] + 1
+    assert updated[deliver_2.parcel_id] is summary[deliver_2.parcel_id]
+    assert parcel_summary_repo.parcel()[deliver_1.parcel_id][deliver_1.locker_id] == (
+        before[deliver_1.parcel_id][deliver_1.locker_id] + 2)
+
+
+def test_delivery_view_enriches_deliveries(
+        parcel_summary_repo: ParcelSummaryRepository,
+        deliver_1: Deliver) -> None:
+    row = parcel_summary_repo.delivery_view()[0]
+
+    assert row == EnrichedDelivery(
+        deliver=deliver_1,
+        size=CompartmentsLarge.MEDIUM,
+        locker_city="New York",
+        sender_city="New York",
+        receiver_city="Los Angeles",
+        days=4,
+    )
+
+
+def test_delivery_view_skips_dangling_references(
+        parcel_summary_repo: ParcelSummaryRepository,
+        deliver_1: Deliver,
+        caplog: pytest.LogCaptureFixture) -> None:
+    dangling = Deliver(
+        parcel_id=deliver_1.parcel_id,
+        locker_id="L999",
+        sender_email=deliver_1.sender_email,
+        receiver_email=deliver_1.receiver_email,
+        sent_date=deliver_1.sent_date,
+        expected_delivery_date=deliver_1.expected_delivery_date,
+    )
+    parcel_summary_repo.delivery_repo.extend([dangling])
+
+    with caplog.at_level(logging.WARNING):
+        view = parcel_summary_repo.delivery_view()
+
+    assert [row.deliver for row in view] == parcel_summary_repo.delivery_repo.get_data()[:-1]
+    assert any("not available" in record.message for record in caplog.records)
+
+
+def test_delivery_view_is_built_once_per_generation(
+        parcel_summary_repo: ParcelSummaryRepository,
+        deliver_1: Deliver) -> None:
+    view = parcel_summary_repo.delivery_view()
+
+    with patch.object(parcel_summary_repo, "_enrich", wraps=parcel_summary_repo._enrich) as enrich:
+        assert parcel_summary_repo.delivery_view() is view
+        parcel_summary_repo.delivery_repo.extend([deliver_1])
+        appended = parcel_summary_repo.delivery_view()
+
+    enrich.assert_called_once()
+    assert enrich.call_args.args[0] == [deliver_1]
+    assert appended[:len(view)] == view
+    assert appended[-1].deliver is deliver_1
+    assert len(view) == len(appended) - 1
+
+
+def test_delivery_appended_during_build_is_counted_once(
+        parcel_summary_repo: ParcelSummaryRepository,
+        deliver_1: Deliver) -> None:
+    delivery_repo = parcel_summary_repo.delivery_repo
+    enrich = parcel_summary_repo._enrich
+    appends: list[threading.Thread] = []
+
+    def enrich_while_appending(delivers, snapshots):
+        if not appends:
+            generation = delivery_repo.generation()
+            appends.append(threading.Thread(target=delivery_repo.extend, args=([deliver_1],)))
+            appends[0].start()
+            while delivery_repo.generation() == generation:
+                time.sleep(0.001)
+        return enrich(delivers, snapshots)
+
+    with patch.object(parcel_summary_repo, "_enrich", side_effect=enrich_while_appending):
+        summary = parcel_summary_repo.parcel()
+        appends[0].join()
+
+    expected = enrich(delivery_repo.get_data(), parcel_summary_repo._snapshots())
+    assert list(parcel_summary_repo.delivery_view()) == expected
+    assert summary == parcel_summary_repo._build_parcel(expected[:-1])
+    assert parcel_summary_repo.parcel() == parcel_summary_repo._build_parcel(expected)
+
+
+def test_delivery_view_window_keeps_delivery_order(
+        parcel_summary_repo: ParcelSummaryRepository,
+        deliver_1: Deliver,
+        deliver_2: Deliver) -> None:
+    earlier = Deliver(
+        parcel_id=deliver_1.parcel_id,
+        locker_id=deliver_1.locker_id,
+        sender_email=deliver_1.sender_email,
+        receiver_email=deliver_1.receiver_email,
+        sent_date="2023-11-20",
+        expected_delivery_date="2023-11-22",
+    )
+    parcel_summary_repo.delivery_view(date(2023, 12, 1))
+    parcel_summary_repo.delivery_repo.extend([earlier, deliver_1])
+
+    window = parcel_summary_repo.delivery_view(date(2023, 11, 1), date(2023, 12, 1))
+
+    assert [row.deliver for row in window] == [deliver_1, earlier, deliver_1]
+    assert [row.deliver for row in parcel_summary_repo.delivery_view(since=date(2023, 12, 2))] == [deliver_2]
+    assert parcel_summary_repo.delivery_view(until=date(2023, 11, 19)) == []
+    assert parcel_summary_repo._sent_days is not None
+    assert parcel_summary_repo._sent_days.value == SentDayIndex.build(parcel_summary_repo.delivery_view())
+
+
+def test_sent_day_index_extended_in_place_bounds_earlier_windows(
+        parcel_summary_repo: ParcelSummaryRepository,
+        deliver_1: Deliver) -> None:
+    view = parcel_summary_repo.delivery_view()
+    index = SentDayIndex.build(view)
+    later = Deliver(
+        parcel_id=deliver_1.parcel_id,
+        locker_id=deliver_1.locker_id,
+        sender_email=deliver_1.sender_email,
+        receiver_email=deliver_1.receiver_email,
+        sent_date="2030-01-01",
+        expected_delivery_date="2030-01-02",
+    )
+    rows = parcel_summary_repo._enrich([deliver_1, later], parcel_summary_repo._snapshots())
+
+    assert index.extended(rows, len(view)) is index
+    assert index.window(None, None, len(view)) == list(range(len(view)))
+    assert index.window(None, None, len(view) + 2) == list(range(len(view) + 2))
+
+
+def test_invalidate_drops_cached_view_and_summary(parcel_summary_repo: ParcelSummaryRepository) -> None:
+    view = parcel_summary_repo.delivery_view()
+    summary = parcel_summary_repo.parcel()
+
+    parcel_summary_repo.invalidate()
+
+    assert parcel_summary_repo.delivery_view() is not view
+    assert parcel_summary_repo.delivery_view() == view
+    assert parcel_summary_repo.parcel() is not summary
+    assert parcel_summary_repo.parcel() == summary
@@ -1,16 +1,34 @@
 from src.model import Deliver, User, Parcel, Locker
+from src.repository import (
+    ParcelSummaryRepository,
+    UserDataRepository,
+    LockerDataRepository,
+    ParcelDataRepository,
+    DeliveryDataRepository,
+)
 from src.service import ParcelReportService
-from unittest.mock import MagicMock
+from tests.conftest import InMemoryRepositoryFactory
+from typing import Callable
 import pytest
 
+ServiceFactory = Callable[..., ParcelReportService]
 
 @pytest.fixture
-def mock_repository() -> MagicMock:
-    return MagicMock()
-
-@pytest.fixture
-def service(mock_repository: MagicMock) -> ParcelReportService:
-    return ParcelReportService(repository=mock_repository)
+def make_service(in_memory_repository: InMemoryRepositoryFactory) -> ServiceFactory:
+    def build(
+            users: list[User] | None = None,
+            lockers: list[Locker] | None = None,
+            parcels: list[Parcel] | None = None,
+            delivers: list[Deliver] | None = None,
+            service_type: type[ParcelReportService] = ParcelReportService) -> ParcelReportService:
+        repository = ParcelSummaryRepository(
+            user_repo=in_memory_repository(UserDataRepository, users or []),
+            locker_repo=in_memory_repository(LockerDataRepository, lockers or []),
+            parcel_repo=in_memory_repository(ParcelDataRepository, parcels or []),
+            delivery_repo=in_memory_repository(DeliveryDataRepository, delivers or []),
+        )
+        return service_type(repository=repository)
+    return build
 
 @pytest.fixture
 def delivers_list(deliver_1: Deliver, deliver_2: Deliver) -> list[Deliver]:
@@ -26,4 +44,4 @@ def parcels_list(parcel_1: Parcel, parcel_2: Parcel) -> list[Parcel]:
 
 @pytest.fixture
 def lockers_list(locker_1: Locker, locker_2: Locker) -> list[Locker]:
-    return [locker_1, locker_2]
\ No newline at end of file
+    return [locker_1, locker_2]
@@ -1,21 +1,20 @@
-from tests.test_service.conftest import delivers_list, users_list, parcels_list
+from tests.test_service.conftest import ServiceFactory
 from src.model import Deliver, User, Parcel, Locker, CompartmentsLarge
-from src.service import ParcelReportService
-from unittest.mock import MagicMock
-from tests.conftest import parcel_1
+from src.service import ParcelReports, ReportState
+from unittest.mock import patch
+from collections import defaultdict
+from datetime import date
 import logging
 import pytest
 
 def test_city_most_shipments_by_size(
-        service: ParcelReportService,
-        mock_repository: MagicMock,
+        make_service: ServiceFactory,
         delivers_list: list[Deliver],
         users_list: list[User],
-        parcels_list: list[Parcel]) -> None:
+        parcels_list: list[Parcel],
+        lockers_list: list[Locker]) -> None:
 
-    mock_repository.delivery_repo.get_data.return_value = delivers_list
-    mock_repository.user_repo.get_data.return_value = users_list
-    mock_repository.parcel_repo.get_data.return_value = parcels_list
+    service = make_service(users=users_list, lockers=lockers_list, parcels=parcels_list, delivers=delivers_list)
 
     result = service.city_most_shipments_by_size()
 
@@ -27,18 +26,13 @@ def test_city_most_shipments_by_size(
     assert expected == result
 
 def test_most_common_parcel_sizes_per_locker(
-        service: ParcelReportService,
-        mock_repository: MagicMock,
+        make_service: ServiceFactory,
         delivers_list: list[Deliver],
         users_list: list[User],
         parcels_list: list[Parcel],
         lockers_list: list[Locker]) -> None:
 
-    mock_repository.delivery_repo.get_data.return_value = delivers_list
-    mock_repository.user_repo.get_data.return_value = users_list
-    mock_repository.parcel_repo.get_data.return_value = parcels_list
-    mock_repository.locker_repo.get_data.return_value = lockers_list
-
+    service = make_service(users=users_list, lockers=lockers_list, parcels=parcels_list, delivers=delivers_list)
 
     result = service.most_common_parcel_sizes_per_locker()
 
@@ -49,11 +43,13 @@ def test_most_common_parcel_sizes_per_locker(
     assert expected == result
 
 def test_max_days_between_sent_and_expected_deliver_with_single_sender(
-        service: ParcelReportService,
-        mock_repository: MagicMock,
-        deliver_1: MagicMock) -> None:
+        make_service: ServiceFactory,
+        users_list: list[User],
+        parcels_list: list[Parcel],
+        lockers_list: list[Locker],
+        deliver_1: Deliver) -> None:
 
-    mock_repository.delivery_repo.get_data.return_value = [deliver_1]
+    service = make_service(users=users_list, lockers=lockers_list, parcels=parcels_list, delivers=[deliver_1])
 
     result = service.max_days_between_sent_and_expected()
 
@@ -63,12 +59,14 @@ def test_max_days_between_sent_and_expected_deliver_with_single_sender(
     assert expected == result
 
 def test_max_days_between_sent_and_expected_deliver_with_multiple_senders(
-        service: ParcelReportService,
-        mock_repository: MagicMock,
-        deliver_1: MagicMock,
-        deliver_2: MagicMock) -> None:
+        make_service: ServiceFactory,
+        users_list: list[User],
+        parcels_list: list[Parcel],
+        lockers_list: list[Locker],
+        deliver_1: Deliver,
+        deliver_2: Deliver) -> None:
 
-    mock_repository.delivery_repo.get_data.return_value = [deliver_1, deliver_2]
+    service = make_service(users=users_list, lockers=lockers_list, parcels=parcels_list, delivers=[deliver_1, deliver_2])
 
     result = service.max_days_between_sent_and_expected()
 
@@ -79,15 +77,13 @@ def test_max_days_between_sent_and_expected_deliver_with_multiple_senders(
     assert expected == result
 
 def test_is_parcel_limit_in_locker_exceeded_no_places_available(
-        service: ParcelReportService,
-        mock_repository: MagicMock,
+        make_service: ServiceFactory,
+        users_list: list[User],
         locker_1: Locker,
         parcel_1: Parcel,
         deliver_1: Deliver) -> None:
 
-    mock_repository.locker_repo.get_data.return_value = [locker_1]
-    mock_repository.parcel_repo.get_data.return_value = [parcel_1]
-    mock_repository.delivery_repo.get_data.return_value = [deliver_1]
+    service = make_service(users=users_list, lockers=[locker_1], parcels=[parcel_1], delivers=[deliver_1])
 
     result = service.is_parcel_limit_in_locker_exceeded()
 
@@ -98,24 +94,205 @@ def test_is_parcel_limit_in_locker_exceeded_no_places_available(
     assert result == expected
 
 def test_test_is_parcel_limit_in_locker_exceeded_no_places_available_with_logs_warning(
-        service: ParcelReportService,
-        mock_repository: MagicMock,
+        make_service: ServiceFactory,
+        users_list: list[User],
         parcel_1: Parcel,
         deliver_1: Deliver,
         caplog: pytest.LogCaptureFixture) -> None:
 
-    mock_repository.locker_repo.get_data.return_value = [Locker(
-        locker_id="L001",
-        city="New York",
-        latitude=40.730610,
-        longitude=-73.935242,
-        compartments= {CompartmentsLarge.SMALL: 20, CompartmentsLarge.MEDIUM: 0, CompartmentsLarge.LARGE: 5}
-    )]
-    mock_repository.parcel_repo.get_data.return_value = [parcel_1]
-    mock_repository.delivery_repo.get_data.return_value = [deliver_1]
+    service = make_service(
+        users=users_list,
+        lockers=[Locker(
+            locker_id="L001",
+            city="New York",
+            latitude=40.730610,
+            longitude=-73.935242,
+            compartments= {CompartmentsLarge.SMALL: 20, CompartmentsLarge.MEDIUM: 0, CompartmentsLarge.LARGE: 5}
+        )],
+        parcels=[parcel_1],
+        delivers=[deliver_1],
+    )
 
     with caplog.at_level(logging.WARNING):
         data = service.is_parcel_limit_in_locker_exceeded()
 
     assert len(data) == 1
     assert any('No places available' in record.message for record in caplog.records)
+
+def test_reports_with_locker_without_compartment_of_parcel_size(
+        make_service: ServiceFactory,
+        users_list: list[User],
+        parcel_1: Parcel,
+        deliver_1: Deliver,
+        caplog: pytest.LogCaptureFixture) -> None:
+    service = make_service(
+        users=users_list,
+        lockers=[Locker(
+            locker_id="L001",
+            city="New York",
+            latitude=40.730610,
+            longitude=-73.935242,
+            compartments={CompartmentsLarge.SMALL: 5}
+        )],
+        parcels=[parcel_1],
+        delivers=[deliver_1],
+    )
+
+    with caplog.at_level(logging.WARNING):
+        assert service.most_common_parcel_sizes_per_locker() == {"L001": [CompartmentsLarge.MEDIUM.value]}
+    assert list(service.city_most_shipments_by_size()["sent"]) == [CompartmentsLarge.MEDIUM.value]
+    assert len(service.max_days_between_sent_and_expected()) == 1
+    assert service.is_parcel_limit_in_locker_exceeded() == {
+        "L001": {CompartmentsLarge.SMALL: 5, CompartmentsLarge.MEDIUM: -1}
+    }
+    assert any('No places available' in record.message for record in caplog.records)
+
+def test_reports_skip_deliveries_with_unknown_parcel(
+        make_service: ServiceFactory,
+        users_list: list[User],
+        locker_1: Locker,
+        deliver_1: Deliver,
+        caplog: pytest.LogCaptureFixture) -> None:
+    service = make_service(users=users_list, lockers=[locker_1], delivers=[deliver_1])
+
+    with caplog.at_level(logging.WARNING):
+        assert service.most_common_parcel_sizes_per_locker() == {}
+    assert service.city_most_shipments_by_size() == {"sent": {}, "received": {}}
+    assert service.max_days_between_sent_and_expected() == {}
+    assert service.is_parcel_limit_in_locker_exceeded() == {"L001": locker_1.compartments}
+    assert any("not available" in record.message for record in caplog.records)
+
+def test_compute_all_matches_individual_reports(
+        make_service: ServiceFactory,
+        delivers_list: list[Deliver],
+        users_list: list[User],
+        parcels_list: list[Parcel],
+        lockers_list: list[Locker]) -> None:
+    service = make_service(users=users_list, lockers=lockers_list, parcels=parcels_list, delivers=delivers_list)
+    expected = ParcelReports(
+        most_common_parcel_sizes_per_locker=service.most_common_parcel_sizes_per_locker(),
+        city_most_shipments_by_size=service.city_most_shipments_by_size(),
+        max_days_between_sent_and_expected=service.max_days_between_sent_and_expected(),
+        is_parcel_limit_in_locker_exceeded=defaultdict(dict, service.is_parcel_limit_in_locker_exceeded()),
+    )
+
+    assert service.compute_all() == expected
+
+def test_individual_reports_reuse_fresh_compute_all(
+        make_service: ServiceFactory,
+        delivers_list: list[Deliver],
+        users_list: list[User],
+        parcels_list: list[Parcel],
+        lockers_list: list[Locker]) -> None:
+    service = make_service(users=users_list, lockers=lockers_list, parcels=parcels_list, delivers=delivers_list)
+    reports = service.compute_all()
+
+    assert service.most_common_parcel_sizes_per_locker() is reports.most_common_parcel_sizes_per_locker
+    assert service.city_most_shipments_by_size() is reports.city_most_shipments_by_size
+    assert service.max_days_between_sent_and_expected() is reports.max_days_between_sent_and_expected
+    assert service.is_parcel_limit_in_locker_exceeded() is reports.is_parcel_limit_in_locker_exceeded
+
+def test_individual_reports_ignore_stale_compute_all(
+        make_service: ServiceFactory,
+        delivers_list: list[Deliver],
+        users_list: list[User],
+        parcels_list: list[Parcel],
+        lockers_list: list[Locker],
+        deliver_1: Deliver) -> None:
+    service = make_service(users=users_list, lockers=lockers_list, parcels=parcels_list, delivers=delivers_list)
+    reports = service.compute_all()
+
+    with patch.object(service.repository.delivery_repo.file_reader, "read", return_value=[deliver_1]):
+        service.repository.delivery_repo.refresh_data()
+
+    assert service.most_common_parcel_sizes_per_locker() != reports.most_common_parcel_sizes_per_locker
+    assert service.most_common_parcel_sizes_per_locker() == {"L001": ["medium"]}
+
+def test_individual_reports_ignore_compute_all_after_append(
+        make_service: ServiceFactory,
+        delivers_list: list[Deliver],
+        users_list: list[User],
+        parcels_list: list[Parcel],
+        lockers_list: list[Locker],
+        deliver_1: Deliver) -> None:
+    service = make_service(users=users_list, lockers=lockers_list, parcels=parcels_list, delivers=delivers_list)
+    reports = service.compute_all()
+
+    service.repository.delivery_repo.extend([deliver_1])
+
+    assert service.is_parcel_limit_in_locker_exceeded() is not reports.is_parcel_limit_in_locker_exceeded
+
+def test_report_state_counts_appended_deliveries_without_rebuild(
+        make_service: ServiceFactory,
+        delivers_list: list[Deliver],
+        users_list: list[User],
+        parcels_list: list[Parcel],
+        lockers_list: list[Locker],
+        deliver_1: Deliver) -> None:
+    service = make_service(users=users_list, lockers=lockers_list, parcels=parcels_list, delivers=delivers_list)
+    expected = make_service(
+        users=users_list, lockers=lockers_list, parcels=parcels_list, delivers=[*delivers_list, deliver_1, deliver_1])
+    service.compute_all()
+
+    with patch.object(ReportState, "build", wraps=ReportState.build) as build:
+        service.repository.delivery_repo.extend([deliver_1])
+        service.repository.delivery_repo.extend([deliver_1])
+        reports = service.compute_all()
+    build.assert_not_called()
+
+    assert reports == expected.compute_all()
+    assert service.report_state().rows == 4
+    assert service.is_report_state_consistent()
+
+def test_report_state_rebuilds_when_lockers_change(
+        make_service: ServiceFactory,
+        delivers_list: list[Deliver],
+        users_list: list[User],
+        parcels_list: list[Parcel],
+        locker_1: Locker,
+        locker_2: Locker) -> None:
+    service = make_service(users=users_list, lockers=[locker_1], parcels=parcels_list, delivers=delivers_list)
+    state = service.report_state()
+
+    service.repository.locker_repo.extend([locker_2])
+
+    assert service.report_state() is not state
+    assert service.most_common_parcel_sizes_per_locker() == {"L001": ["medium"], "L002": ["small"]}
+
+def test_report_state_consistency_check_detects_drift(
+        make_service: ServiceFactory,
+        delivers_list: list[Deliver],
+        users_list: list[User],
+        parcels_list: list[Parcel],
+        lockers_list: list[Locker]) -> None:
+    service = make_service(users=users_list, lockers=lockers_list, parcels=parcels_list, delivers=delivers_list)
+    service.report_state().sizes["L001"]["medium"] += 1
+
+    assert not service.is_report_state_consistent()
+    service.report_state(rebuild=True)
+    assert service.is_report_state_consistent()
+
+@pytest.mark.parametrize("since, until", [
+    (date(2023, 12, 1), date(2023, 12, 1)),
+    (date(2023, 12, 2), None),
+    (None, date(2023, 11, 30)),
+    (date(2023, 11, 1), date(2023, 12, 31)),
+])
+def test_reports_in_date_window_match_filtered_deliveries(
+        make_service: ServiceFactory,
+        delivers_list: list[Deliver],
+        users_list: list[User],
+        parcels_list: list[Parcel],
+        lockers_list: list[Locker],
+        since: date | None,
+        until: date | None) -> None:
+    service = make_service(users=users_list, lockers=lockers_list, parcels=parcels_list, delivers=delivers_list)
+    in_window = [deliver for deliver in delivers_list
+                 if (since is None or deliver.sent_day >= since.toordinal())
+                 and (until is None or deliver.sent_day <= until.toordinal())]
+    expected = make_service(users=users_list, lockers=lockers_list, parcels=parcels_list, delivers=in_window)
+
+    assert service.compute_all(since, until) == expected.compute_all()
+    assert service.most_common_parcel_sizes_per_locker(since, until) == expected.most_common_parcel_sizes_per_locker()
+    assert service.is_parcel_limit_in_locker_exceeded(since=since, until=until) == (
+        expected.is_parcel_limit_in_locker_exceeded())
@@ -0,0 +1,158 @@
+from src.converter import UserConverter, LockerConverter, ParcelConverter, DeliverConverter
+from src.dataset_generator import DatasetConfig, DatasetGenerator
+from src.model import Deliver, User, Parcel, Locker, CompartmentsLarge, ParcelSizeRules
+from src.service import ParcelReportService
+from src.vectorized_service import VectorizedParcelReportService, classify_array
+from tests.test_service.conftest import ServiceFactory
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from datetime import date
+from typing import cast
+import numpy as np
+import pytest
+
+REPORTS = (
+    "most_common_parcel_sizes_per_locker",
+    "city_most_shipments_by_size",
+    "max_days_between_sent_and_expected",
+    "is_parcel_limit_in_locker_exceeded",
+)
+
+
+def generated(config: DatasetConfig, drop_every_nth_user: int = 0) -> dict[str, list]:
+    generator = DatasetGenerator(config)
+    users = [UserConverter().convert(user) for user in generator.users()]
+    if drop_every_nth_user:
+        users = users[1::drop_every_nth_user] + [user for i, user in enumerate(users) if i % drop_every_nth_user > 1]
+    return {
+        "users": users,
+        "lockers": [LockerConverter().convert(locker) for locker in generator.lockers()],
+        "parcels": [ParcelConverter().convert(parcel) for parcel in generator.parcels()],
+        "delivers": [DeliverConverter().convert(deliver) for deliver in generator.deliveries()],
+    }
+
+
+def assert_equivalent(make_service: ServiceFactory, **data: list) -> None:
+    expected = make_service(**data)
+    vectorized = make_service(**data, service_type=VectorizedParcelReportService)
+
+    for report in REPORTS:
+        result = getattr(vectorized, report)()
+        assert result == getattr(expected, report)()
+        assert list(result) == list(getattr(expected, report)())
+    assert vectorized.compute_all() == expected.compute_all()
+
+
+@pytest.mark.parametrize("config", [
+    DatasetConfig(deliveries=500, users=40, lockers=6, seed=1),
+    DatasetConfig(deliveries=2_000, users=300, lockers=3, seed=2, locker_skew=1.0, sender_skew=1.0),
+    DatasetConfig(deliveries=1_000, users=5, lockers=20, seed=3, locker_skew=6.0, max_delivery_days=2),
+])
+def test_vectorized_reports_match_generated_dataset(make_service: ServiceFactory, config: DatasetConfig) -> None:
+    assert_equivalent(make_service, **generated(config))
+
+
+def test_vectorized_reports_match_with_unknown_users(make_service: ServiceFactory) -> None:
+    data = generated(DatasetConfig(deliveries=800, users=50, lockers=4, seed=4), drop_every_nth_user=3)
+
+    assert_equivalent(make_service, **data)
+
+
+def test_vectorized_reports_match_fixtures(
+        make_service: ServiceFactory,
+        delivers_list: list[Deliver],
+        users_list: list[User],
+        parcels_list: list[Parcel],
+        lockers_list: list[Locker]) -> None:
+    assert_equivalent(make_service, users=users_list, lockers=lockers_list, parcels=parcels_list, delivers=delivers_list)
+
+
+def test_vectorized_reports_match_empty_repositories(make_service: ServiceFactory) -> None:
+    assert_equivalent(make_service)
+
+
+def test_vectorized_reports_match_with_unknown_parcels(make_service: ServiceFactory) -> None:
+    data = generated(DatasetConfig(deliveries=800, users=50, lockers=4, seed=6))
+    data["parcels"] = data["parcels"][::2]
+
+    assert_equivalent(make_service, **data)
+
+
+def test_vectorized_reports_match_with_missing_compartments(make_service: ServiceFactory) -> None:
+    data = generated(DatasetConfig(deliveries=800, users=50, lockers=4, seed=8))
+    data["lockers"] = [
+        replace(locker, compartments={CompartmentsLarge.SMALL: 5}) if i % 2 else locker
+        for i, locker in enumerate(data["lockers"])
+    ]
+
+    assert_equivalent(make_service, **data)
+
+
+def test_vectorized_reports_follow_appended_deliveries(make_service: ServiceFactory) -> None:
+    data = generated(DatasetConfig(deliveries=600, users=30, lockers=5, seed=5))
+    delivers = data.pop("delivers")
+    vectorized = cast(VectorizedParcelReportService,
+                      make_service(**data, delivers=delivers[:400], service_type=VectorizedParcelReportService))
+    expected = make_service(**data, delivers=delivers[:400])
+    vectorized.compute_all()
+    assert vectorized._arrays is not None
+    columns = vectorized._arrays.columns
+
+    vectorized.repository.delivery_repo.extend(delivers[400:])
+    expected.repository.delivery_repo.extend(delivers[400:])
+
+    assert vectorized.compute_all() == expected.compute_all()
+    assert vectorized._arrays is not None
+    assert vectorized._arrays.columns is columns
+    assert len(columns) == 600
+
+
+def test_vectorized_reports_while_deliveries_are_appended(make_service: ServiceFactory) -> None:
+    data = generated(DatasetConfig(deliveries=2_000, users=40, lockers=5, seed=9))
+    delivers = data.pop("delivers")
+    vectorized = make_service(**data, delivers=delivers[:100], service_type=VectorizedParcelReportService)
+    expected = make_service(**data, delivers=delivers)
+
+    def append() -> None:
+        for start in range(100, len(delivers), 50):
+            vectorized.repository.delivery_repo.extend(delivers[start:start + 50])
+
+    def report(_: int) -> None:
+        for report_name in REPORTS:
+            getattr(vectorized, report_name)()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        appending = executor.submit(append)
+        list(executor.map(report, range(40)))
+        appending.result()
+
+    assert vectorized.compute_all() == expected.compute_all()
+
+
+def test_report_backends_are_interchangeable(make_service: ServiceFactory) -> None:
+    assert isinstance(make_service(service_type=VectorizedParcelReportService), ParcelReportService)
+
+
+def test_vectorized_reports_match_in_date_window(make_service: ServiceFactory) -> None:
+    data = generated(DatasetConfig(deliveries=1_000, users=40, lockers=5, seed=7))
+    expected = make_service(**data)
+    vectorized = make_service(**data, service_type=VectorizedParcelReportService)
+    days = sorted(deliver.sent_day for deliver in data["delivers"])
+    since, until = date.fromordinal(days[200]), date.fromordinal(days[600])
+
+    for report in REPORTS:
+        result = getattr(vectorized, report)(since, until)
+        assert result == getattr(expected, report)(since, until)
+        assert list(result) == list(getattr(expected, report)(since, until))
+    assert vectorized.compute_all(since, until) == expected.compute_all(since, until)
+    assert vectorized.compute_all(since, until) != vectorized.compute_all()
+
+
+def test_classify_array_matches_classify() -> None:
+    rules = ParcelSizeRules()
+    heights = np.array([10, 20, 21, 30, 31, 5, 30])
+    lengths = np.array([30, 40, 40, 50, 10, 51, 45])
+
+    sizes = tuple(CompartmentsLarge)
+    expected = [sizes.index(rules.classify(int(h), int(l))) for h, l in zip(heights, lengths)]
+    assert classify_array(rules, heights, lengths).tolist() == expected
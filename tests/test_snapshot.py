@@ -0,0 +1,67 @@
+from src.snapshot import SnapshotCache, SnapshotKey
+from src.model import User
+import pytest
+import pickle
+import os
+
+
+@pytest.fixture
+def source_file(tmpdir) -> str:
+    file_path = os.path.join(tmpdir, "users.json")
+    with open(file_path, "w") as file:
+        file.write("[]")
+    return file_path
+
+@pytest.fixture
+def snapshot_cache(tmpdir) -> SnapshotCache:
+    return SnapshotCache(os.path.join(tmpdir, "snapshots"))
+
+
+def test_snapshot_key_from_file(source_file: str) -> None:
+    key = SnapshotKey.from_file(source_file)
+    assert key.size == 2
+    assert key == SnapshotKey.from_file(source_file)
+
+
+def test_save_and_load_snapshot(snapshot_cache: SnapshotCache, source_file: str, user_1: User) -> None:
+    key = SnapshotKey.from_file(source_file)
+    snapshot_cache.save(source_file, "users", key, [user_1])
+
+    assert snapshot_cache.load(source_file, "users", key) == [user_1]
+
+
+def test_load_missing_snapshot_returns_none(snapshot_cache: SnapshotCache, source_file: str) -> None:
+    assert snapshot_cache.load(source_file, "users", SnapshotKey.from_file(source_file)) is None
+
+
+@pytest.mark.parametrize("namespace, key", [
+    ("users", SnapshotKey(size=2, mtime_ns=0, digest="other")),
+    ("lockers", None),
+])
+def test_load_stale_snapshot_returns_none(
+        snapshot_cache: SnapshotCache,
+        source_file: str,
+        user_1: User,
+        namespace: str,
+        key: SnapshotKey | None) -> None:
+    current_key = SnapshotKey.from_file(source_file)
+    snapshot_cache.save(source_file, "users", current_key, [user_1])
+
+    assert snapshot_cache.load(source_file, namespace, key or current_key) is None
+
+
+def test_load_corrupted_snapshot_returns_none(snapshot_cache: SnapshotCache, source_file: str, user_1: User) -> None:
+    key = SnapshotKey.from_file(source_file)
+    snapshot_cache.save(source_file, "users", key, [user_1])
+    snapshot_file = os.path.join(snapshot_cache.directory, os.listdir(snapshot_cache.directory)[0])
+    with open(snapshot_file, "wb") as file:
+        file.write(b"broken")
+
+    assert snapshot_cache.load(source_file, "users", key) is None
+
+
+def test_failed_save_leaves_no_temporary_file(snapshot_cache: SnapshotCache, source_file: str) -> None:
+    with pytest.raises((pickle.PicklingError, AttributeError, TypeError)):
+        snapshot_cache.save(source_file, "users", SnapshotKey.from_file(source_file), [lambda: None])
+
+    assert os.listdir(snapshot_cache.directory) == []
@@ -1,20 +1,20 @@
 from unittest.mock import MagicMock, patch
 from datetime import date, timedelta
 from src.ui_service import UiService
+from src.repository import RefreshResult
+import json
+import os
 
-@patch("src.ui_service.DeliverWriterJson.write")
-@patch("src.ui_service.DeliverReaderJson.read")
+@patch("src.ui_service.DeliverWriterJson.append")
 @patch("src.ui_service.st")
 def test_ui_service_if_send_successful(
         mock_st: MagicMock,
-        mock_load: MagicMock,
         mock_write: MagicMock,
         mock_ui_service: UiService) -> None:
 
     mock_st.text_input.side_effect = ["P1234", "L001", "jon.doe@gmail.com", "jane.doe@gmail.com"]
     mock_st.date_input.side_effect = [date.today(), date.today() + timedelta(days=1)]
     mock_st.button.return_value = True
-    mock_load.return_value = []
     result = mock_ui_service._send_parcel("fake_path.json")
 
     assert result is not None
@@ -24,9 +24,9 @@ def test_ui_service_if_send_successful(
     assert result["receiver_email"] == "jane.doe@gmail.com"
 
     mock_st.success.assert_called_once_with("Your package has been shipped")
-    mock_write.assert_called()
+    mock_write.assert_called_once_with("fake_path.json", [result])
 
-@patch("src.ui_service.DeliverWriterJson.write")
+@patch("src.ui_service.DeliverWriterJson.append")
 @patch("src.ui_service.st")
 def test_ui_service_if_send_has_no_all_data(
         mock_st: MagicMock,
@@ -43,7 +43,7 @@ def test_ui_service_if_send_has_no_all_data(
     mock_st.error.assert_called_once_with("Please fill out all fields")
     mock_write.assert_not_called()
 
-@patch("src.ui_service.DeliverWriterJson.write")
+@patch("src.ui_service.DeliverWriterJson.append")
 @patch("src.ui_service.st")
 def test_ui_service_if_send_has_not_validate(
         mock_st: MagicMock,
@@ -59,22 +59,79 @@ def test_ui_service_if_send_has_not_validate(
     mock_st.error.assert_called_once_with("Data did not pass validation. Please check dates and email address.")
     mock_write.assert_not_called()
 
-@patch("src.ui_service.DeliverWriterJson.write")
-@patch("src.ui_service.DeliverReaderJson.read")
+@patch("src.ui_service.DeliverWriterJson.append")
 @patch("src.ui_service.st")
 def test_ui_service_if_send_has_error_exception(
         mock_st: MagicMock,
-        mock_load: MagicMock,
         mock_write: MagicMock,
         mock_ui_service: UiService) -> None:
 
     mock_st.text_input.side_effect = ["P1234", "L001", "jon.doe@gmail.com", "jane.doe@gmail.com"]
     mock_st.date_input.side_effect = [date.today(), date.today() + timedelta(days=1)]
     mock_st.button.return_value = True
-    mock_load.return_value = []
 
     mock_write.side_effect = Exception()
 
     mock_ui_service._send_parcel("fake_path.json")
 
     mock_st.error.assert_called_once_with("Data could not be written to file: ")
+
+@patch("src.ui_service.DeliverWriterJson.append")
+@patch("src.ui_service.st")
+def test_ui_service_send_appends_to_ndjson(
+        mock_st: MagicMock,
+        mock_write: MagicMock,
+        mock_ui_service: UiService,
+        tmpdir) -> None:
+
+    file_path = os.path.join(tmpdir, "delivers.ndjson")
+    with open(file_path, "w") as file:
+        file.write('{"parcel_id": "P1"}\n')
+    mock_st.text_input.side_effect = ["P1234", "L001", "jon.doe@gmail.com", "jane.doe@gmail.com"]
+    mock_st.date_input.side_effect = [date.today(), date.today() + timedelta(days=1)]
+    mock_st.button.return_value = True
+
+    result = mock_ui_service._send_parcel(file_path)
+
+    with open(file_path, "r") as file:
+        lines = file.readlines()
+    assert len(lines) == 2
+    assert json.loads(lines[1]) == result
+    mock_write.assert_not_called()
+
+@patch("src.ui_service.st")
+def test_ui_service_send_updates_tracking_index(
+        mock_st: MagicMock,
+        mock_ui_service: UiService,
+        tmpdir) -> None:
+
+    file_path = os.path.join(tmpdir, "delivers.ndjson")
+    open(file_path, "w").close()
+    repository = mock_ui_service._tracking_repository(file_path)
+    mock_st.text_input.side_effect = ["P1234", "L001", "jon.doe@gmail.com", "jane.doe@gmail.com"]
+    mock_st.date_input.side_effect = [date.today(), date.today() + timedelta(days=1)]
+    mock_st.button.return_value = True
+
+    mock_ui_service._send_parcel(file_path)
+
+    assert [deliver.parcel_id for deliver in repository.find_by("parcel_id", "P1234")] == ["P1234"]
+    assert repository.refresh_if_changed() is RefreshResult.UNCHANGED
+
+
+@patch("src.ui_service.st")
+def test_ui_service_send_appends_to_json_array(
+        mock_st: MagicMock,
+        mock_ui_service: UiService,
+        tmpdir) -> None:
+
+    file_path = os.path.join(tmpdir, "delivers.json")
+    with open(file_path, "w") as file:
+        json.dump([{"parcel_id": "P1"}], file, indent=4)
+    mock_st.text_input.side_effect = ["P1234", "L001", "jon.doe@gmail.com", "jane.doe@gmail.com"]
+    mock_st.date_input.side_effect = [date.today(), date.today() + timedelta(days=1)]
+    mock_st.button.return_value = True
+
+    result = mock_ui_service._send_parcel(file_path)
+
+    with open(file_path, "r") as file:
+        assert file.read() == json.dumps([{"parcel_id": "P1"}, result], indent=4)
@@ -1,5 +1,6 @@
 from unittest.mock import MagicMock, patch
 from src.ui_service import UiService
+from datetime import date
 
 
 @patch("src.ui_service.UiService._send_parcel")
@@ -29,7 +30,24 @@ def test_show_ui_report(mock_st: MagicMock, mock_report: MagicMock, mock_ui_serv
     mock_ui_service.show_ui()
     mock_report.assert_called_once()
 
+@patch("src.report_service.ReportService.report_max_days_between_sent_and_expected")
+@patch("src.ui_service.st")
+def test_show_ui_report_uses_picked_date_range(
+        mock_st: MagicMock, mock_report: MagicMock, mock_ui_service: UiService) -> None:
+    mock_st.sidebar.radio.return_value = "Report"
+    mock_st.button.return_value = True
+    mock_st.date_input.return_value = (date(2023, 12, 1), date(2023, 12, 7))
 
+    mock_ui_service.show_ui()
+    mock_report.assert_called_once_with(date(2023, 12, 1), date(2023, 12, 7))
 
+@patch("src.report_service.ReportService.report_max_days_between_sent_and_expected")
+@patch("src.ui_service.st")
+def test_show_ui_report_without_date_range_reports_everything(
+        mock_st: MagicMock, mock_report: MagicMock, mock_ui_service: UiService) -> None:
+    mock_st.sidebar.radio.return_value = "Report"
+    mock_st.button.return_value = True
+    mock_st.date_input.return_value = ()
 
-
+    mock_ui_service.show_ui()
+    mock_report.assert_called_once_with(None, None)
@@ -3,8 +3,13 @@ from src.validator import (
     UserDataDictValidator,
     LockerDataDictValidator,
     ParcelDataDictValidator,
-    DeliversDataDictValidator
+    DeliversDataDictValidator,
+    EmailValidationCache,
+    EmailCacheInfo,
+    email_validation_cache,
 )
+from email_validator import EmailNotValidError
+from unittest.mock import MagicMock, patch
 from src.model import UsersDataDict, LockersDataDict, ParcelsDataDict, User, DeliversDataDict
 import pytest
 from tests.conftest import fake_user
@@ -201,4 +206,63 @@ def test_deliver_data_dict_validator_sent_date_and_expected_delivery_date(
         expected: bool) -> None:
 
     validate = DeliversDataDictValidator()
-    assert validate.validate(data) == expected
\ No newline at end of file
+    assert validate.validate(data) == expected
+
+@pytest.fixture
+def email_cache() -> EmailValidationCache:
+    return EmailValidationCache(maxsize=2)
+
+
+@patch("src.validator.validate_email")
+def test_email_validation_cache_counts_hits_and_misses(mock_validate: MagicMock, email_cache: EmailValidationCache) -> None:
+    assert email_cache.validate("a@gmail.com") is None
+    assert email_cache.validate("a@gmail.com") is None
+
+    mock_validate.assert_called_once_with("a@gmail.com")
+    assert email_cache.info() == EmailCacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+
+
+@patch("src.validator.validate_email")
+def test_email_validation_cache_evicts_least_recently_used(
+        mock_validate: MagicMock,
+        email_cache: EmailValidationCache) -> None:
+    for email in ["a@gmail.com", "b@gmail.com", "a@gmail.com", "c@gmail.com", "a@gmail.com", "b@gmail.com"]:
+        email_cache.validate(email)
+
+    assert [call.args[0] for call in mock_validate.call_args_list] == [
+        "a@gmail.com", "b@gmail.com", "c@gmail.com", "b@gmail.com"
+    ]
+    assert email_cache.info().currsize == 2
+
+
+@patch("src.validator.validate_email")
+def test_email_validation_cache_keeps_error_message(mock_validate: MagicMock, email_cache: EmailValidationCache) -> None:
+    mock_validate.side_effect = EmailNotValidError("invalid")
+
+    assert email_cache.validate("bad") == "invalid"
+    assert email_cache.validate("bad") == "invalid"
+    assert mock_validate.call_count == 1
+
+
+@patch("src.validator.validate_email")
+def test_email_validation_cache_disabled(mock_validate: MagicMock, email_cache: EmailValidationCache) -> None:
+    email_cache.configure(enabled=False)
+    email_cache.validate("a@gmail.com")
+    email_cache.validate("a@gmail.com")
+
+    assert mock_validate.call_count == 2
+    assert email_cache.info() == EmailCacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+
+
+@patch("src.validator.validate_email")
+def test_validators_share_email_cache(
+        mock_validate: MagicMock,
+        user_1_data: UsersDataDict,
+        deliver_1_data: DeliversDataDict) -> None:
+    email_validation_cache.clear()
+
+    UserDataDictValidator().validate(user_1_data)
+    DeliversDataDictValidator().validate(deliver_1_data)
+
+    assert mock_validate.call_count == 2
+    assert email_validation_cache.info().hits == 1